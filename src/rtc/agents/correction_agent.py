@@ -1,7 +1,7 @@
 """CorrectionAgent - 교정 에이전트 (LLM)."""
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Final, Optional
 
 from pydantic import BaseModel, Field
 
@@ -66,6 +66,9 @@ class CorrectionOutput:
     correction_summary: str
 
 
+# 프롬프트에 포함할 full_text 최대 길이
+FULL_TEXT_MAX_CHARS: Final = 50000
+
 CORRECTION_SYSTEM_PROMPT = """You are a Correction Agent fixing inaccuracies in extracted research paper analysis.
 
 ## 출력 언어 규칙 (중요!)
@@ -184,8 +187,8 @@ class CorrectionAgent(BaseAgent[CorrectionInput, CorrectionOutput]):
 
         # Full text 처리
         full_text = input.full_text or "(Full text not available)"
-        if len(full_text) > 50000:
-            full_text = full_text[:50000] + "\n... (truncated)"
+        if len(full_text) > FULL_TEXT_MAX_CHARS:
+            full_text = full_text[:FULL_TEXT_MAX_CHARS] + "\n... (truncated)"
 
         prompt = CORRECTION_PROMPT_TEMPLATE.format(
             title=input.title,
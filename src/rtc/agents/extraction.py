@@ -1,7 +1,7 @@
 """ExtractionAgent - 구조화된 정보 추출 (LLM)."""
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Final, Optional
 
 from rtc.agents.base import BaseAgent
 from rtc.config import get_settings
@@ -22,6 +22,9 @@ class ExtractionInput:
     skim_summary: Optional[SkimSummary] = None
 
 
+# 프롬프트에 포함할 full_text 최대 길이 (토큰 제한)
+FULL_TEXT_MAX_CHARS: Final = 80000
+
 EXTRACTION_SYSTEM_PROMPT = """You are a Research Agent extracting structured information from papers.
 
 ## 목적
@@ -163,7 +166,7 @@ class ExtractionAgent(BaseAgent[ExtractionInput, ExtractionOutput]):
 
         # 콘텐츠 준비
         if input.full_text:
-            content = input.full_text[:80000]  # 토큰 제한 (확대)
+            content = input.full_text[:FULL_TEXT_MAX_CHARS]
             extraction_mode = "full"
         else:
             content = f"Abstract:\n{input.abstract}"
@@ -184,10 +187,8 @@ class ExtractionAgent(BaseAgent[ExtractionInput, ExtractionOutput]):
                 max_tokens=12000,
             )
 
-            # 추출 모드 설정
-            result.extraction_mode = extraction_mode
-
-            return result
+            # 추출 모드 설정 (출력 모델은 불변이므로 복사본에 반영)
+            return result.model_copy(update={"extraction_mode": extraction_mode})
 
         except Exception as e:
             # 실패 시 기본값 반환
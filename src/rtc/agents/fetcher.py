@@ -4,11 +4,10 @@ import logging
 import re
 from dataclasses import dataclass
 
-import arxiv
-
 from rtc.agents.base import BaseAgent
 from rtc.config import get_settings
-from rtc.mcp.servers.hf_papers_server import HFPapersServer, paper_dict_to_candidate
+from rtc.mcp.servers.arxiv_server import ArxivServer
+from rtc.mcp.servers.hf_papers_server import HFPapersServer, paper_dicts_to_candidates
 from rtc.schemas import PaperCandidate
 
 logger = logging.getLogger(__name__)
@@ -62,7 +61,7 @@ class CandidateFetcher(BaseAgent[FetchInput, FetchOutput]):
         # 2. arXiv comment 보강 (venue 감지용)
         venue_enriched = 0
         if self.settings.venue_filter_enabled:
-            venue_enriched = self._enrich_arxiv_comments(candidates)
+            venue_enriched = await self._enrich_arxiv_comments(candidates)
 
         # 3. 필터링 적용
         filtered, stats = self._apply_filters(candidates)
@@ -86,7 +85,7 @@ class CandidateFetcher(BaseAgent[FetchInput, FetchOutput]):
                 days_back=self.settings.hf_papers_lookback_days,
                 min_votes=self.settings.hf_papers_min_votes,
             )
-            return [paper_dict_to_candidate(p) for p in paper_dicts]
+            return paper_dicts_to_candidates(paper_dicts)
         finally:
             await server.close()
 
@@ -204,14 +203,13 @@ class CandidateFetcher(BaseAgent[FetchInput, FetchOutput]):
         if not keywords:
             return True
 
-        text = f"{paper.title} {paper.abstract}".lower()
-        matched = [kw for kw in keywords if kw.lower() in text]
+        matched = self.settings.find_keywords(f"{paper.title} {paper.abstract}", keywords)
         if matched:
             paper.matched_keywords = matched
             return True
         return False
 
-    def _enrich_arxiv_comments(self, candidates: list[PaperCandidate]) -> int:
+    async def _enrich_arxiv_comments(self, candidates: list[PaperCandidate]) -> int:
         """arXiv API로 comment 필드 보강 및 venue 감지.
 
         comment가 없는 논문만 대상으로 batch lookup 수행.
@@ -230,26 +228,22 @@ class CandidateFetcher(BaseAgent[FetchInput, FetchOutput]):
         logger.info("arXiv comment 보강: %d건 조회", len(id_list))
 
         try:
-            client = arxiv.Client()
-            search = arxiv.Search(id_list=id_list)
-            results = list(client.results(search))
+            # id_list 배치 조회 (결과의 arxiv_id는 요청한 ID로 맞춰짐)
+            results = await ArxivServer().get_paper_metadata_batch(id_list)
         except Exception:
             logger.warning("arXiv API 조회 실패, comment 보강 건너뜀", exc_info=True)
             return 0
 
         venue_count = 0
         for result in results:
-            arxiv_id = result.entry_id.split("/abs/")[-1]
-            # 버전 제거하여 매칭 (예: 2401.12345v2 -> 2401.12345)
-            base_id = arxiv_id.split("v")[0]
-
-            paper = needs_comment.get(arxiv_id) or needs_comment.get(base_id)
+            paper = needs_comment.get(result["arxiv_id"])
             if paper is None:
                 continue
 
-            if result.comment:
-                paper.comment = result.comment
-                venue = self._extract_venue(result.comment)
+            comment = result.get("comment")
+            if comment:
+                paper.comment = comment
+                venue = self._extract_venue(comment)
                 if venue:
                     paper.venue = venue
                     venue_count += 1
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 import httpx
+import orjson
 
 from rtc.agents.base import BaseAgent
 from rtc.config import get_settings
@@ -221,14 +222,16 @@ class GitHubMethodAgent(BaseAgent[GitHubMethodInput, GitHubMethodOutput]):
                 max_tokens=8000,
             )
 
-            # 메타데이터 채우기
-            result.arxiv_id = extraction.arxiv_id
-            result.repo_url = github_url
-            result.repo_description = repo_info.get("description", "")
-            result.main_language = repo_info.get("language", "Python")
-            result.total_methods_found = len(result.methods)
-
-            return result
+            # 메타데이터 채우기 (출력 모델은 불변이므로 복사본에 반영)
+            return result.model_copy(
+                update={
+                    "arxiv_id": extraction.arxiv_id,
+                    "repo_url": github_url,
+                    "repo_description": repo_info.get("description", ""),
+                    "main_language": repo_info.get("language", "Python"),
+                    "total_methods_found": len(result.methods),
+                }
+            )
 
         except Exception as e:
             return self._create_error_output(
@@ -249,7 +252,7 @@ class GitHubMethodAgent(BaseAgent[GitHubMethodInput, GitHubMethodOutput]):
         url = f"https://api.github.com/repos/{owner}/{repo}"
         response = await self._client.get(url)
         if response.status_code == 200:
-            return response.json()
+            return orjson.loads(response.content)
         return {}
 
     async def _get_repo_structure(
@@ -265,7 +268,7 @@ class GitHubMethodAgent(BaseAgent[GitHubMethodInput, GitHubMethodOutput]):
         if response.status_code != 200:
             return []
 
-        items = response.json()
+        items = orjson.loads(response.content)
         if not isinstance(items, list):
             return []
 
@@ -10,6 +10,7 @@ from langsmith.run_helpers import traceable
 
 from rtc.agents.base import BaseAgent
 from rtc.config import get_settings
+from rtc.mcp.servers.common import close_shared_httpx_client
 from rtc.schemas.skim import SkimSummary
 from rtc.storage.deep_store import DeepStore
 from rtc.storage.index_store import IndexStore
@@ -92,7 +93,7 @@ class Orchestrator(BaseAgent[OrchestratorInput, OrchestratorOutput]):
 
         # 2. Deep Pipeline 실행 (선택적, 병렬 처리)
         if input.run_deep and deep_candidates:
-            from rtc.pipeline.deep import run_deep_pipeline
+            from rtc.pipeline.deep import run_deep_pipeline_batch
 
             print(f"[Orchestrator] Running Deep Pipeline for {len(deep_candidates)} papers (parallel)...")
 
@@ -118,31 +119,38 @@ class Orchestrator(BaseAgent[OrchestratorInput, OrchestratorOutput]):
             if papers_to_process:
                 print(f"  [Parallel] Processing {len(papers_to_process)} papers...")
 
-                async def process_paper(arxiv_id: str, paper: SkimSummary) -> dict:
-                    """개별 논문 처리."""
-                    try:
-                        result = await run_deep_pipeline(
-                            arxiv_id=arxiv_id,
-                            title=paper.title,
-                            abstract="",
-                            run_date=run_date,
-                            skim_summary=paper,
-                        )
-                        return {
-                            "arxiv_id": arxiv_id,
-                            "success": bool(result.get("report_md")),
-                            "errors": result.get("errors", []),
-                        }
-                    except Exception as e:
-                        return {
+                # 동시 실행 수를 제한해 병렬 실행
+                items = [
+                    {
+                        "arxiv_id": arxiv_id,
+                        "title": paper.title,
+                        "abstract": "",
+                        "run_date": run_date,
+                        "skim_summary": paper,
+                    }
+                    for arxiv_id, paper in papers_to_process
+                ]
+                states = await run_deep_pipeline_batch(items)
+
+                results = []
+                for (arxiv_id, _), state in zip(papers_to_process, states):
+                    if isinstance(state, BaseException):
+                        results.append({
                             "arxiv_id": arxiv_id,
                             "success": False,
-                            "errors": [{"node": "orchestrator", "error": f"Deep failed for {arxiv_id}: {str(e)}"}],
-                        }
-
-                # 모든 논문 병렬 실행
-                tasks = [process_paper(arxiv_id, paper) for arxiv_id, paper in papers_to_process]
-                results = await asyncio.gather(*tasks)
+                            "errors": [
+                                {
+                                    "node": "orchestrator",
+                                    "error": f"Deep failed for {arxiv_id}: {str(state)}",
+                                }
+                            ],
+                        })
+                    else:
+                        results.append({
+                            "arxiv_id": arxiv_id,
+                            "success": bool(state.get("report_md")),
+                            "errors": state.get("errors", []),
+                        })
 
                 # 결과 집계
                 for result in results:
@@ -240,12 +248,6 @@ class Orchestrator(BaseAgent[OrchestratorInput, OrchestratorOutput]):
         # 5. Index 업데이트
         print("[Orchestrator] Updating index...")
         try:
-            self.index_store.update_by_date(run_date, deep_completed)
-
-            # 태그별 인덱스 (스킴 결과 사용)
-            if all_papers:
-                self.index_store.update_by_tag(all_papers)
-
             # 점수별 인덱스 (딥 결과 사용)
             score_data = []
             for arxiv_id in deep_completed:
@@ -255,8 +257,9 @@ class Orchestrator(BaseAgent[OrchestratorInput, OrchestratorOutput]):
                     scoring = self.deep_store.load_scoring(slug)
                     if scoring:
                         score_data.append((arxiv_id, scoring.total))
-            if score_data:
-                self.index_store.update_by_score(score_data)
+
+            # 날짜/태그(스킴 결과)/점수 인덱스를 한 번에 저장
+            self.index_store.update_all(run_date, deep_completed, all_papers, score_data)
 
         except Exception as e:
             errors.append({
@@ -311,14 +314,17 @@ async def run_orchestrator(
         실행 결과
     """
     orchestrator = Orchestrator()
-    return await orchestrator.run(
-        OrchestratorInput(
-            run_date=run_date,
-            run_deep=run_deep,
-            generate_code=generate_code,
-            force_rerun=force_rerun,
+    try:
+        return await orchestrator.run(
+            OrchestratorInput(
+                run_date=run_date,
+                run_deep=run_deep,
+                generate_code=generate_code,
+                force_rerun=force_rerun,
+            )
         )
-    )
+    finally:
+        await close_shared_httpx_client()
 
 
 def _print_result(result: OrchestratorOutput) -> None:
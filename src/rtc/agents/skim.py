@@ -1,5 +1,8 @@
 """UltraSkimAgent - 빠른 논문 스킴 (LLM, 배치 처리)."""
 
+import asyncio
+from typing import Final
+
 from rtc.agents.base import BaseAgent
 from rtc.config import get_settings
 from rtc.llm import get_llm_client
@@ -45,6 +48,18 @@ For each paper, provide:
 7. has_code: 코드 공개 여부 (abstract에서 언급 시)"""
 
 
+PAPER_PROMPT_TEMPLATE: Final = """--- Paper {index} ---
+ArXiv ID: {arxiv_id}
+Title: {title}
+Abstract: {abstract}"""
+
+# 프롬프트에 포함할 초록 최대 길이
+ABSTRACT_MAX_CHARS: Final = 1500
+
+# 동적 배치 최소 크기 (너무 잘게 쪼개 시스템 프롬프트 비용이 커지는 것 방지)
+MIN_BATCH_SIZE: Final = 3
+
+
 class UltraSkimAgent(BaseAgent[list[PaperCandidate], BatchSkimResult]):
     """배치 단위 빠른 스킴 에이전트 (LLM).
 
@@ -54,14 +69,18 @@ class UltraSkimAgent(BaseAgent[list[PaperCandidate], BatchSkimResult]):
     name = "ultra_skim"
     uses_llm = True
 
-    def __init__(self, batch_size: int = 10):
+    def __init__(self, batch_size: int = 10, max_concurrency: int = 4):
         """초기화.
 
         Args:
-            batch_size: 한 번에 처리할 논문 수
+            batch_size: 한 번에 처리할 최대 논문 수
+            max_concurrency: 동시에 실행할 최대 LLM 호출 수
         """
         self.batch_size = batch_size
+        self.max_concurrency = max(1, max_concurrency)
         self.settings = get_settings()
+        self.model = self.settings.agent_models.get("skim", "gpt-4o-mini")
+        self.llm = get_llm_client(provider="openai", model=self.model)
 
     async def run(self, papers: list[PaperCandidate]) -> BatchSkimResult:
         """논문 배치 스킴 실행.
@@ -75,21 +94,28 @@ class UltraSkimAgent(BaseAgent[list[PaperCandidate], BatchSkimResult]):
         if not papers:
             return BatchSkimResult(papers=[], total_processed=0)
 
-        all_summaries: list[SkimSummary] = []
-        errors: list[str] = []
+        batch_size = self._plan_batch_size(len(papers))
+        batches = [papers[i : i + batch_size] for i in range(0, len(papers), batch_size)]
+        sem = asyncio.Semaphore(self.max_concurrency)
+
+        async def skim_one(batch: list[PaperCandidate]) -> list[SkimSummary]:
+            async with sem:
+                return await self._skim_batch(batch)
 
-        # 배치 단위로 처리
-        for i in range(0, len(papers), self.batch_size):
-            batch = papers[i : i + self.batch_size]
+        # 배치들을 동시에 처리 (결과 순서는 입력 순서 유지)
+        results = await asyncio.gather(
+            *(skim_one(batch) for batch in batches), return_exceptions=True
+        )
 
-            try:
-                summaries = await self._skim_batch(batch)
-                all_summaries.extend(summaries)
-            except Exception as e:
-                errors.append(f"Batch {i // self.batch_size}: {str(e)}")
+        all_summaries: list[SkimSummary] = []
+        errors: list[str] = []
+        for index, (batch, result) in enumerate(zip(batches, results)):
+            if isinstance(result, Exception):
+                errors.append(f"Batch {index}: {str(result)}")
                 # 실패한 배치는 기본값으로 처리
-                for paper in batch:
-                    all_summaries.append(self._create_default_summary(paper))
+                all_summaries.extend(self._create_default_summary(paper) for paper in batch)
+            else:
+                all_summaries.extend(result)
 
         return BatchSkimResult(
             papers=all_summaries,
@@ -97,6 +123,21 @@ class UltraSkimAgent(BaseAgent[list[PaperCandidate], BatchSkimResult]):
             errors=errors,
         )
 
+    def _plan_batch_size(self, total: int) -> int:
+        """논문 수에 맞춰 배치 크기 결정.
+
+        논문이 적은 날은 배치를 작게 나눠 동시 호출로 지연을 줄이고, 많은 날은
+        batch_size까지 키워 호출 수를 줄인다.
+
+        Args:
+            total: 스킴할 논문 수
+
+        Returns:
+            배치 크기
+        """
+        per_worker = -(-total // self.max_concurrency)  # ceil
+        return max(min(per_worker, self.batch_size), min(MIN_BATCH_SIZE, self.batch_size))
+
     async def _skim_batch(self, papers: list[PaperCandidate]) -> list[SkimSummary]:
         """단일 배치 스킴.
 
@@ -106,8 +147,7 @@ class UltraSkimAgent(BaseAgent[list[PaperCandidate], BatchSkimResult]):
         Returns:
             스킴 결과 목록
         """
-        model = self.settings.agent_models.get("skim", "gpt-4o-mini")
-        llm = get_llm_client(provider="openai", model=model)
+        llm = self.llm
 
         # 논문 텍스트 포맷팅
         papers_text = self._format_papers_for_prompt(papers)
@@ -123,69 +163,80 @@ class UltraSkimAgent(BaseAgent[list[PaperCandidate], BatchSkimResult]):
             max_tokens=4000,
         )
 
-        # 결과를 SkimSummary로 변환
-        summaries = []
+        # 결과를 SkimSummary로 변환 (LLM 출력은 이미 검증되었으므로 재검증 생략)
+        results = result.results
+        summaries: list[SkimSummary] = []
         for i, paper in enumerate(papers):
-            if i < len(result.results):
-                skim = result.results[i]
-                summaries.append(
-                    SkimSummary(
-                        arxiv_id=paper.arxiv_id,
-                        title=paper.title,
-                        one_liner=skim.one_liner,
-                        tags=skim.tags,
-                        interest_score=skim.interest_score,
-                        interest_reason=skim.interest_reason,
-                        baseline_mentioned=skim.baseline_mentioned,
-                        category=skim.category,
-                        has_code=skim.has_code or bool(paper.github_url),
-                        link=f"https://arxiv.org/abs/{paper.arxiv_id}",
-                        github_url=paper.github_url,
-                        github_stars=paper.github_stars,
-                        matched_keywords=paper.matched_keywords,
-                    )
+            if i < len(results):
+                skim = results[i]
+                summary = SkimSummary.model_construct(
+                    arxiv_id=paper.arxiv_id,
+                    title=paper.title,
+                    one_liner=skim.one_liner,
+                    tags=skim.tags,
+                    interest_score=skim.interest_score,
+                    interest_reason=skim.interest_reason,
+                    baseline_mentioned=skim.baseline_mentioned,
+                    category=skim.category,
+                    has_code=skim.has_code or bool(paper.github_url),
+                    link=f"https://arxiv.org/abs/{paper.arxiv_id}",
+                    github_url=paper.github_url,
+                    github_stars=paper.github_stars,
+                    matched_keywords=list(paper.matched_keywords),
                 )
             else:
-                summaries.append(self._create_default_summary(paper))
+                summary = self._create_default_summary(paper)
+            summaries.append(summary)
 
         return summaries
 
     def _format_papers_for_prompt(self, papers: list[PaperCandidate]) -> str:
         """프롬프트용 논문 텍스트 포맷팅."""
-        parts = []
-        for i, paper in enumerate(papers, 1):
-            parts.append(
-                f"--- Paper {i} ---\n"
-                f"ArXiv ID: {paper.arxiv_id}\n"
-                f"Title: {paper.title}\n"
-                f"Abstract: {paper.abstract[:1500]}..."
-                if len(paper.abstract) > 1500
-                else f"--- Paper {i} ---\n"
-                f"ArXiv ID: {paper.arxiv_id}\n"
-                f"Title: {paper.title}\n"
-                f"Abstract: {paper.abstract}"
-            )
+        parts: list[str] = []
+        for i, paper in enumerate(papers):
+            abstract = paper.abstract
+            if len(abstract) > ABSTRACT_MAX_CHARS:
+                abstract = abstract[:ABSTRACT_MAX_CHARS] + "..."
+            parts.append(PAPER_PROMPT_TEMPLATE.format(
+                index=i + 1,
+                arxiv_id=paper.arxiv_id,
+                title=paper.title,
+                abstract=abstract,
+            ))
         return "\n\n".join(parts)
 
     def _create_default_summary(self, paper: PaperCandidate) -> SkimSummary:
         """기본 스킴 결과 생성 (실패 시 사용)."""
-        return SkimSummary(
-            arxiv_id=paper.arxiv_id,
-            title=paper.title,
-            one_liner="[스킴 실패] " + paper.title,
-            tags=[],
-            interest_score=1,
-            interest_reason="스킴 처리 중 오류 발생",
-            baseline_mentioned=None,
-            category="other",
-            has_code=bool(paper.github_url),
-            link=f"https://arxiv.org/abs/{paper.arxiv_id}",
-            github_url=paper.github_url,
-            github_stars=paper.github_stars,
-            matched_keywords=paper.matched_keywords,
+        return _DEFAULT_SUMMARY.model_copy(
+            update={
+                "arxiv_id": paper.arxiv_id,
+                "title": paper.title,
+                "one_liner": "[스킴 실패] " + paper.title,
+                "tags": [],
+                "has_code": bool(paper.github_url),
+                "link": f"https://arxiv.org/abs/{paper.arxiv_id}",
+                "github_url": paper.github_url,
+                "github_stars": paper.github_stars,
+                "matched_keywords": list(paper.matched_keywords),
+            }
         )
 
 
+# 스킴 실패 시 사용하는 기본값 템플릿 (논문별 필드만 model_copy로 교체)
+_DEFAULT_SUMMARY = SkimSummary(
+    arxiv_id="",
+    title="",
+    one_liner="",
+    tags=[],
+    interest_score=1,
+    interest_reason="스킴 처리 중 오류 발생",
+    baseline_mentioned=None,
+    category="other",
+    has_code=False,
+    link="",
+)
+
+
 # LLM 출력용 내부 스키마
 from typing import Literal, Optional
 
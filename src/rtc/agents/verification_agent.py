@@ -1,7 +1,7 @@
 """VerificationAgent - 검증 에이전트 (LLM)."""
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Final, Optional
 
 from rtc.agents.base import BaseAgent
 from rtc.config import get_settings
@@ -10,6 +10,14 @@ from rtc.schemas.delta_v2 import DeltaOutput
 from rtc.schemas.extraction_v2 import ExtractionOutput
 from rtc.schemas.verification_v1 import VerificationOutput
 
+# 프롬프트에 포함할 full_text 최대 길이
+FULL_TEXT_MAX_CHARS: Final = 50000
+
+NO_CLAIMS_TEXT: Final = "(No claims extracted)"
+NO_BASELINES_TEXT: Final = "(No baselines extracted)"
+NO_FULL_TEXT: Final = "(Full text not available)"
+TRUNCATED_SUFFIX: Final = "\n... (truncated)"
+
 
 @dataclass
 class VerificationInput:
@@ -69,6 +77,32 @@ VERIFICATION_SYSTEM_PROMPT = """You are a Verification Agent checking the accura
 - baseline 오류가 있으면 "baseline:{name}" 형식으로 추가
 - one_line_takeaway 오류가 있으면 "one_line_takeaway" 추가"""
 
+VERIFICATION_INSTRUCTIONS = """## Instructions:
+
+### 1. Baseline 검증 (가장 중요!)
+- 각 baseline이 논문에서 **실험적으로 비교**되었는지 확인
+- Related Work에만 언급된 것이 baseline으로 잘못 분류되었으면 contradicted 처리
+- baseline의 "limitation"이 논문에서 실제로 주장된 것인지 확인
+
+### 2. One-line Takeaway 검증
+- "[X]의 [한계]를 해결했다" 형태에서 X가 실제 baseline인지 확인
+- 새로운 접근/최초 시도를 마치 기존 방법 개선처럼 표현했으면 contradicted 처리
+- 예: "Foundation-Sec-8B-Instruct를 개선했다"고 했는데 실제로는 같은 base model에서 다른 방식으로 훈련한 것이면 → contradicted
+
+### 3. Core Deltas 검증
+- old_approach가 허위 baseline에 기반하면 contradicted 처리
+- 논문이 실제로 주장하지 않은 개선점이 있으면 contradicted 처리
+
+### 4. Claims 검증
+- 각 클레임이 논문에서 지지되는지 검증
+
+### 5. 최종 판정
+- 전체 신뢰도(high/medium/low) 판정
+- contradicted 항목에 대해 교정 힌트 제공
+- corrections_needed에 수정이 필요한 항목 목록 작성
+
+Output verification results in the specified JSON schema."""
+
 VERIFICATION_PROMPT_TEMPLATE = """Verify the accuracy of extracted information against the original paper.
 
 **Paper**: {title} ({arxiv_id})
@@ -102,31 +136,7 @@ VERIFICATION_PROMPT_TEMPLATE = """Verify the accuracy of extracted information a
 
 ---
 
-## Instructions:
-
-### 1. Baseline 검증 (가장 중요!)
-- 각 baseline이 논문에서 **실험적으로 비교**되었는지 확인
-- Related Work에만 언급된 것이 baseline으로 잘못 분류되었으면 contradicted 처리
-- baseline의 "limitation"이 논문에서 실제로 주장된 것인지 확인
-
-### 2. One-line Takeaway 검증
-- "[X]의 [한계]를 해결했다" 형태에서 X가 실제 baseline인지 확인
-- 새로운 접근/최초 시도를 마치 기존 방법 개선처럼 표현했으면 contradicted 처리
-- 예: "Foundation-Sec-8B-Instruct를 개선했다"고 했는데 실제로는 같은 base model에서 다른 방식으로 훈련한 것이면 → contradicted
-
-### 3. Core Deltas 검증
-- old_approach가 허위 baseline에 기반하면 contradicted 처리
-- 논문이 실제로 주장하지 않은 개선점이 있으면 contradicted 처리
-
-### 4. Claims 검증
-- 각 클레임이 논문에서 지지되는지 검증
-
-### 5. 최종 판정
-- 전체 신뢰도(high/medium/low) 판정
-- contradicted 항목에 대해 교정 힌트 제공
-- corrections_needed에 수정이 필요한 항목 목록 작성
-
-Output verification results in the specified JSON schema."""
+""" + VERIFICATION_INSTRUCTIONS
 
 
 class VerificationAgent(BaseAgent[VerificationInput, VerificationOutput]):
@@ -137,6 +147,8 @@ class VerificationAgent(BaseAgent[VerificationInput, VerificationOutput]):
 
     def __init__(self):
         self.settings = get_settings()
+        self.model = self.settings.agent_models.get("verification", "gpt-4o-mini")
+        self.llm = get_llm_client(provider="openai", model=self.model)
 
     async def run(self, input: VerificationInput) -> VerificationOutput:
         """Extraction + Delta 결과 검증.
@@ -147,45 +159,9 @@ class VerificationAgent(BaseAgent[VerificationInput, VerificationOutput]):
         Returns:
             검증 결과
         """
-        model = self.settings.agent_models.get("verification", "gpt-4o-mini")
-        llm = get_llm_client(provider="openai", model=model)
-
-        extraction = input.extraction
-        delta = input.delta
-
-        # Claims 텍스트 준비
-        claims_text = "\n".join(
-            f"- [{c.claim_id}] ({c.claim_type}) {c.text}"
-            for c in extraction.claims
-        )
+        llm = self.llm
 
-        # Baselines 텍스트 준비
-        baselines_text = "\n".join(
-            f"- [{b.name}] {b.description} (한계: {b.limitation})"
-            for b in extraction.baselines
-        ) if extraction.baselines else "(No baselines extracted)"
-
-        # Delta 텍스트 준비
-        deltas_text = "\n".join(
-            f"- [{d.axis}] {d.old_approach} → {d.new_approach}: {d.why_better}"
-            for d in delta.core_deltas
-        )
-
-        # Full text 처리 (너무 길면 자름)
-        full_text = input.full_text or "(Full text not available)"
-        if len(full_text) > 50000:
-            full_text = full_text[:50000] + "\n... (truncated)"
-
-        prompt = VERIFICATION_PROMPT_TEMPLATE.format(
-            title=input.title,
-            arxiv_id=input.arxiv_id,
-            abstract=input.abstract,
-            full_text=full_text,
-            claims_text=claims_text or "(No claims extracted)",
-            baselines_text=baselines_text,
-            one_line_takeaway=delta.one_line_takeaway,
-            deltas_text=deltas_text,
-        )
+        prompt = VERIFICATION_PROMPT_TEMPLATE.format(**self._prompt_fields(input))
 
         try:
             result = await llm.generate_structured(
@@ -202,14 +178,50 @@ class VerificationAgent(BaseAgent[VerificationInput, VerificationOutput]):
             # 실패 시 기본값 반환 (통과 처리)
             return self._create_fallback_output(input.arxiv_id, str(e))
 
+    def _prompt_fields(self, input: VerificationInput) -> dict[str, str]:
+        """프롬프트 템플릿에 채울 필드 생성."""
+        claims = input.extraction.claims
+        baselines = input.extraction.baselines
+        core_deltas = input.delta.core_deltas
+
+        # Claims 텍스트 준비
+        claims_text = "\n".join(
+            [f"- [{c.claim_id}] ({c.claim_type}) {c.text}" for c in claims]
+        )
+
+        # Baselines 텍스트 준비
+        baselines_text = "\n".join(
+            [f"- [{b.name}] {b.description} (한계: {b.limitation})" for b in baselines]
+        ) if baselines else NO_BASELINES_TEXT
+
+        # Delta 텍스트 준비
+        deltas_text = "\n".join(
+            [
+                f"- [{d.axis}] {d.old_approach} → {d.new_approach}: {d.why_better}"
+                for d in core_deltas
+            ]
+        )
+
+        # Full text 처리 (너무 길면 자름)
+        full_text = input.full_text or NO_FULL_TEXT
+        if len(full_text) > FULL_TEXT_MAX_CHARS:
+            full_text = full_text[:FULL_TEXT_MAX_CHARS] + TRUNCATED_SUFFIX
+
+        return {
+            "title": input.title,
+            "arxiv_id": input.arxiv_id,
+            "abstract": input.abstract,
+            "full_text": full_text,
+            "claims_text": claims_text or NO_CLAIMS_TEXT,
+            "baselines_text": baselines_text,
+            "one_line_takeaway": input.delta.one_line_takeaway,
+            "deltas_text": deltas_text,
+        }
+
     def _create_fallback_output(self, arxiv_id: str, error: str) -> VerificationOutput:
         """실패 시 폴백 출력 생성 (통과 처리)."""
         return VerificationOutput(
             arxiv_id=arxiv_id,
-            total_claims=0,
-            verified_count=0,
-            unverified_count=0,
-            contradicted_count=0,
             overall_reliability="high",  # 검증 실패 시 통과 처리
             results=[],
             summary=f"검증 실패로 인한 자동 통과: {error}",
@@ -1,249 +1,248 @@
 """Configuration management for Paper Digest Agent."""
 
+import json
 import os
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Literal, Optional, get_args
 
+import orjson
 from dotenv import load_dotenv
-from pydantic import Field
-from pydantic_settings import BaseSettings
 
-load_dotenv()
+try:
+    import ahocorasick
+except ImportError:  # optional: pip install pyahocorasick
+    ahocorasick = None
 
+load_dotenv()
 
-class Settings(BaseSettings):
-    """Application settings loaded from environment variables."""
+LLMProvider = Literal["claude", "openai"]
+PaperSource = Literal["hf_papers", "arxiv"]
+VenueFilterMode = Literal["only", "boost"]
+
+DEFAULT_HF_PAPERS_KEYWORDS = (
+    # LLM 기본
+    "LLM",
+    "large language model",
+    "language model",
+    # Agent
+    "agent",
+    "agentic",
+    "multi-agent",
+    "autonomous",
+    # RAG
+    "RAG",
+    "retrieval",
+    "retrieval augmented",
+    # 추론/계획
+    "reasoning",
+    "planning",
+    "chain of thought",
+    "CoT",
+    # 도구/함수
+    "tool use",
+    "function calling",
+    "tool learning",
+    # 기타
+    "ReAct",
+    "prompt",
+    "fine-tuning",
+    "RLHF",
+    "instruction",
+)
+
+DEFAULT_INTEREST_KEYWORDS = (
+    # LLM Agent (최우선)
+    "agent",
+    "agentic",
+    "multi-agent",
+    "tool use",
+    "function calling",
+    "ReAct",
+    "autonomous",
+    # RAG
+    "RAG",
+    "retrieval",
+    "retrieval augmented",
+    "knowledge base",
+    # 추론/계획
+    "reasoning",
+    "chain of thought",
+    "CoT",
+    "planning",
+    "problem solving",
+)
+
+DEFAULT_CATEGORY_PRIORITY = ("agent", "rag", "reasoning", "training", "evaluation", "other")
+
+DEFAULT_ARXIV_CATEGORIES = ("cs.LG", "cs.CL", "cs.AI", "cs.CV")
+
+DEFAULT_ARXIV_KEYWORDS = (
+    "LLM",
+    "large language model",
+    "agent",
+    "AI agent",
+    "autonomous agent",
+    "RAG",
+    "retrieval augmented generation",
+    "tool use",
+    "function calling",
+    "reasoning",
+    "planning",
+    "chain of thought",
+    "ReAct",
+    "multi-agent",
+    "agentic",
+)
+
+DEFAULT_VENUE_FILTER_CONFERENCES = (
+    "NeurIPS", "NIPS", "ICML", "ICLR",
+    "ACL", "EMNLP", "NAACL",
+    "AAAI", "IJCAI",
+    "CVPR", "ICCV", "ECCV",
+    "KDD", "WWW", "SIGIR",
+)
+
+DEFAULT_AGENT_MODELS = {
+    "skim": "gpt-4o-mini",
+    "scoring": "gpt-4o-mini",
+    "extraction": "gpt-4o",
+    "delta": "gpt-4o",
+    "verification": "gpt-4o-mini",
+    "correction": "gpt-4o-mini",
+    "github_method": "gpt-4o",
+}
+
+
+@dataclass(slots=True, frozen=True)
+class Settings:
+    """Application settings loaded from environment variables.
+
+    Instances are immutable; build one from the environment with ``_load_settings()``.
+    """
 
     # API Keys
-    anthropic_api_key: str = Field(default="", alias="ANTHROPIC_API_KEY")
-    openai_api_key: str = Field(default="", alias="OPENAI_API_KEY")
-    langsmith_api_key: str = Field(default="", alias="LANGSMITH_API_KEY")
+    anthropic_api_key: str = ""
+    openai_api_key: str = ""
+    langsmith_api_key: str = ""
 
     # LangSmith
-    langsmith_project: str = Field(default="paper-digest-agent", alias="LANGSMITH_PROJECT")
-    langsmith_tracing: bool = Field(default=True, alias="LANGSMITH_TRACING")
+    langsmith_project: str = "paper-digest-agent"
+    langsmith_tracing: bool = True
 
     # LLM Provider
-    llm_provider: Literal["claude", "openai"] = Field(default="claude", alias="LLM_PROVIDER")
-    llm_model_claude: str = Field(default="claude-sonnet-4-20250514", alias="LLM_MODEL_CLAUDE")
-    llm_model_openai: str = Field(default="gpt-4o", alias="LLM_MODEL_OPENAI")
+    llm_provider: LLMProvider = "claude"
+    llm_model_claude: str = "claude-sonnet-4-20250514"
+    llm_model_openai: str = "gpt-4o"
+    # Serve/store deterministic (temperature 0) OpenAI responses via base_dir/cache/llm.sqlite
+    llm_response_cache: bool = False
 
     # GROBID
-    grobid_url: str = Field(default="http://localhost:8070", alias="GROBID_URL")
+    grobid_url: str = "http://localhost:8070"
+    # Seconds to wait for GROBID before falling back to PyMuPDF
+    grobid_soft_deadline: float = 30.0
 
-    # Output Language
-    output_language: str = Field(
-        default="ko",
-        alias="OUTPUT_LANGUAGE",
-        description="Output language for reports: 'ko' (Korean) or 'en' (English)",
-    )
+    # Output language for reports: 'ko' (Korean) or 'en' (English)
+    output_language: str = "ko"
 
-    # Paper Source
-    paper_source: Literal["hf_papers", "arxiv"] = Field(
-        default="hf_papers",
-        alias="PAPER_SOURCE",
-        description="Paper source: 'hf_papers' (Hugging Face Daily Papers) or 'arxiv'",
-    )
+    # Paper source: 'hf_papers' (Hugging Face Daily Papers) or 'arxiv'
+    paper_source: PaperSource = "hf_papers"
 
     # Hugging Face Papers
-    hf_papers_min_votes: int = Field(
-        default=5,
-        alias="HF_PAPERS_MIN_VOTES",
-        description="Minimum upvotes to filter papers (0 for no filter)",
-    )
-    hf_papers_lookback_days: int = Field(
-        default=1,
-        alias="HF_PAPERS_LOOKBACK_DAYS",
-    )
-    hf_papers_keywords: list[str] = Field(
-        default=[
-            # LLM 기본
-            "LLM",
-            "large language model",
-            "language model",
-            # Agent
-            "agent",
-            "agentic",
-            "multi-agent",
-            "autonomous",
-            # RAG
-            "RAG",
-            "retrieval",
-            "retrieval augmented",
-            # 추론/계획
-            "reasoning",
-            "planning",
-            "chain of thought",
-            "CoT",
-            # 도구/함수
-            "tool use",
-            "function calling",
-            "tool learning",
-            # 기타
-            "ReAct",
-            "prompt",
-            "fine-tuning",
-            "RLHF",
-            "instruction",
-        ],
-        alias="HF_PAPERS_KEYWORDS",
-        description="Keywords to filter HF papers (case-insensitive, matches title or abstract)",
+    hf_papers_min_votes: int = 5  # 0 for no filter
+    hf_papers_lookback_days: int = 1
+    # Keywords to filter HF papers (case-insensitive, matches title or abstract)
+    hf_papers_keywords: list[str] = field(
+        default_factory=lambda: list(DEFAULT_HF_PAPERS_KEYWORDS)
     )
 
-    # Interest Keywords (우선순위별 관심 키워드)
-    interest_keywords: list[str] = Field(
-        default=[
-            # LLM Agent (최우선)
-            "agent",
-            "agentic",
-            "multi-agent",
-            "tool use",
-            "function calling",
-            "ReAct",
-            "autonomous",
-            # RAG
-            "RAG",
-            "retrieval",
-            "retrieval augmented",
-            "knowledge base",
-            # 추론/계획
-            "reasoning",
-            "chain of thought",
-            "CoT",
-            "planning",
-            "problem solving",
-        ],
-        alias="INTEREST_KEYWORDS",
-        description="Priority keywords for filtering papers (agent > rag > reasoning)",
+    # Interest Keywords (우선순위별 관심 키워드: agent > rag > reasoning)
+    interest_keywords: list[str] = field(
+        default_factory=lambda: list(DEFAULT_INTEREST_KEYWORDS)
     )
 
     # Category Priority (카테고리 우선순위)
-    category_priority: list[str] = Field(
-        default=["agent", "rag", "reasoning", "training", "evaluation", "other"],
-        alias="CATEGORY_PRIORITY",
-        description="Category priority order for filtering papers",
+    category_priority: list[str] = field(
+        default_factory=lambda: list(DEFAULT_CATEGORY_PRIORITY)
     )
 
     # arXiv
-    arxiv_categories: list[str] = Field(
-        default=["cs.LG", "cs.CL", "cs.AI", "cs.CV"],
-        alias="ARXIV_CATEGORIES",
+    arxiv_categories: list[str] = field(
+        default_factory=lambda: list(DEFAULT_ARXIV_CATEGORIES)
     )
-    arxiv_keywords: list[str] = Field(
-        default=[
-            "LLM",
-            "large language model",
-            "agent",
-            "AI agent",
-            "autonomous agent",
-            "RAG",
-            "retrieval augmented generation",
-            "tool use",
-            "function calling",
-            "reasoning",
-            "planning",
-            "chain of thought",
-            "ReAct",
-            "multi-agent",
-            "agentic",
-        ],
-        alias="ARXIV_KEYWORDS",
-    )
-    arxiv_max_results: int = Field(default=100, alias="ARXIV_MAX_RESULTS")
-    arxiv_lookback_days: int = Field(default=7, alias="ARXIV_LOOKBACK_DAYS")
+    arxiv_keywords: list[str] = field(default_factory=lambda: list(DEFAULT_ARXIV_KEYWORDS))
+    arxiv_max_results: int = 100
+    arxiv_lookback_days: int = 7
 
     # Skim Pipeline Settings
-    skim_batch_size: int = Field(
-        default=10,
-        alias="SKIM_BATCH_SIZE",
-        description="Number of papers to process in a single LLM call",
-    )
-    skim_interest_threshold: int = Field(
-        default=4,
-        alias="SKIM_INTEREST_THRESHOLD",
-        description="Minimum interest score (1-5) for deep analysis",
-    )
-    max_deep_papers_per_day: int = Field(
-        default=3,
-        alias="MAX_DEEP_PAPERS_PER_DAY",
-        description="Maximum number of papers for deep analysis per day",
-    )
+    skim_batch_size: int = 10  # Max number of papers to process in a single LLM call
+    skim_max_concurrency: int = 4  # Max number of skim LLM calls in flight
+    skim_interest_threshold: int = 4  # Minimum interest score (1-5) for deep analysis
+    max_deep_papers_per_day: int = 3
 
     # Venue/Conference Filter
-    venue_filter_enabled: bool = Field(default=False, alias="VENUE_FILTER_ENABLED")
-    venue_filter_conferences: list[str] = Field(
-        default=[
-            "NeurIPS", "NIPS", "ICML", "ICLR",
-            "ACL", "EMNLP", "NAACL",
-            "AAAI", "IJCAI",
-            "CVPR", "ICCV", "ECCV",
-            "KDD", "WWW", "SIGIR",
-        ],
-        alias="VENUE_FILTER_CONFERENCES",
-    )
-    venue_filter_mode: Literal["only", "boost"] = Field(
-        default="boost",
-        alias="VENUE_FILTER_MODE",
-        description="'only': 학회 논문만 통과, 'boost': 학회 논문 우선 표시 (matched_keywords에 학회명 추가)",
+    venue_filter_enabled: bool = False
+    venue_filter_conferences: list[str] = field(
+        default_factory=lambda: list(DEFAULT_VENUE_FILTER_CONFERENCES)
     )
+    # 'only': 학회 논문만 통과, 'boost': 학회 논문 우선 표시 (matched_keywords에 학회명 추가)
+    venue_filter_mode: VenueFilterMode = "boost"
 
     # GitHub Method Analysis
-    analyze_github: bool = Field(
-        default=False,
-        alias="ANALYZE_GITHUB",
-        description="Whether to analyze GitHub repositories for papers",
-    )
+    analyze_github: bool = False
 
-    # Agent-specific model settings
-    agent_models: dict[str, str] = Field(
-        default={
-            "skim": "gpt-4o-mini",
-            "scoring": "gpt-4o-mini",
-            "extraction": "gpt-4o",
-            "delta": "gpt-4o",
-            "verification": "gpt-4o-mini",
-            "correction": "gpt-4o-mini",
-            "github_method": "gpt-4o",
-        },
-        alias="AGENT_MODELS",
-        description="에이전트별 OpenAI 모델 설정",
-    )
+    # Agent-specific model settings (에이전트별 OpenAI 모델 설정)
+    agent_models: dict[str, str] = field(default_factory=lambda: dict(DEFAULT_AGENT_MODELS))
 
     # Timezone
-    scheduler_timezone: str = Field(default="Asia/Seoul", alias="SCHEDULER_TIMEZONE")
+    scheduler_timezone: str = "Asia/Seoul"
 
     # Paths
-    base_dir: Path = Field(default_factory=lambda: Path(__file__).parent.parent.parent)
-    report_base_dir: Optional[Path] = Field(default=None, alias="REPORT_BASE_DIR")
-
-    @property
-    def papers_dir(self) -> Path:
-        """papers/ 디렉토리 (스킴 결과 저장)."""
-        return self.base_dir / "papers"
-
-    @property
-    def reports_dir(self) -> Path:
-        """reports/ 디렉토리 (딥 분석 결과 저장)."""
-        if self.report_base_dir is not None:
-            return self.report_base_dir
-        return self.base_dir / "reports"
-
-    @property
-    def index_dir(self) -> Path:
-        """index/ 디렉토리 (인덱스 저장)."""
-        return self.base_dir / "index"
+    base_dir: Path = field(default_factory=lambda: Path(__file__).parent.parent.parent)
+    report_base_dir: Optional[Path] = None
+
+    # Derived paths (computed in __post_init__)
+    papers_dir: Path = field(init=False)  # papers/ 디렉토리 (스킴 결과 저장)
+    reports_dir: Path = field(init=False)  # reports/ 디렉토리 (딥 분석 결과 저장)
+    index_dir: Path = field(init=False)  # index/ 디렉토리 (인덱스 저장)
+
+    # topics.json cache: ((mtime_ns, size), effective keywords)
+    _hf_keywords_cache: Optional[tuple] = field(
+        init=False, default=None, repr=False, compare=False
+    )
+    # Keyword matcher cache: (keywords, lowercased set, automaton or None)
+    _keyword_matcher: Optional[tuple] = field(
+        init=False, default=None, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "papers_dir", self.base_dir / "papers")
+        object.__setattr__(
+            self,
+            "reports_dir",
+            self.report_base_dir if self.report_base_dir is not None else self.base_dir / "reports",
+        )
+        object.__setattr__(self, "index_dir", self.base_dir / "index")
 
     def get_effective_hf_keywords(self) -> list[str]:
-        """topics.json 반영: disabled 제외 + custom 추가 + 중복 제거."""
-        import json
+        """topics.json 반영: disabled 제외 + custom 추가 + 중복 제거.
 
+        결과는 topics.json의 (mtime_ns, size)가 바뀔 때까지 캐시됩니다.
+        """
         topics_path = self.reports_dir / "topics.json"
-        if not topics_path.exists():
+        try:
+            st = topics_path.stat()
+        except OSError:
             return self.hf_papers_keywords
 
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._hf_keywords_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
         try:
-            data = json.loads(topics_path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
+            data = orjson.loads(topics_path.read_bytes())
+        except (orjson.JSONDecodeError, OSError):
             return self.hf_papers_keywords
 
         disabled_lower = {
@@ -261,15 +260,160 @@ class Settings(BaseSettings):
                 result.append(kw)
                 existing_lower.add(kw.lower())
 
+        object.__setattr__(self, "_hf_keywords_cache", (key, result))
         return result
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        extra = "ignore"
-
-
-settings = Settings()
+    def _get_keyword_matcher(self, keywords: Optional[list[str]]) -> tuple:
+        """키워드 목록에 대한 (keywords, 소문자 set, automaton) 캐시 반환."""
+        if keywords is None:
+            keywords = self.get_effective_hf_keywords()
+        key = tuple(keywords)
+        cached = self._keyword_matcher
+        if cached is not None and cached[0] == key:
+            return cached
+
+        lower_set = frozenset(kw.lower() for kw in key if kw)
+        automaton = None
+        if ahocorasick is not None and lower_set:
+            automaton = ahocorasick.Automaton()
+            for kw in lower_set:
+                automaton.add_word(kw, kw)
+            automaton.make_automaton()
+
+        cached = (key, lower_set, automaton)
+        object.__setattr__(self, "_keyword_matcher", cached)
+        return cached
+
+    def keyword_automaton(self, keywords: Optional[list[str]] = None):
+        """키워드 목록(기본: get_effective_hf_keywords)으로 만든 Aho-Corasick automaton.
+
+        pyahocorasick이 설치되어 있지 않으면 None을 반환합니다.
+        """
+        return self._get_keyword_matcher(keywords)[2]
+
+    def find_keywords(self, text: str, keywords: Optional[list[str]] = None) -> list[str]:
+        """텍스트에 포함된 키워드 목록 (대소문자 무시, 부분 문자열 매칭).
+
+        Args:
+            text: 검사할 텍스트 (예: 제목 + 초록)
+            keywords: 키워드 목록 (기본: get_effective_hf_keywords)
+
+        Returns:
+            매칭된 키워드 (키워드 목록 순서 유지)
+        """
+        key, lower_set, automaton = self._get_keyword_matcher(keywords)
+        if not key:
+            return []
+
+        text = text.lower()
+        if automaton is None:
+            return [kw for kw in key if kw.lower() in text]
+
+        found = {value for _, value in automaton.iter(text)}
+        if not found:
+            return []
+        return [kw for kw in key if kw.lower() in found]
+
+
+_TRUE_VALUES = frozenset({"1", "true", "t", "yes", "y", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "f", "no", "n", "off"})
+
+
+def _parse_bool(name: str, value: str) -> bool:
+    lowered = value.strip().lower()
+    if lowered in _TRUE_VALUES:
+        return True
+    if lowered in _FALSE_VALUES:
+        return False
+    raise ValueError(f"{name}: invalid boolean value {value!r}")
+
+
+def _parse_json(name: str, value: str, expected: type) -> list | dict:
+    try:
+        parsed = json.loads(value)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"{name}: expected a JSON {expected.__name__}: {e}") from e
+    if not isinstance(parsed, expected):
+        raise ValueError(f"{name}: expected a JSON {expected.__name__}")
+    return parsed
+
+
+def _parse_literal(name: str, value: str, choices: object) -> str:
+    allowed = get_args(choices)
+    if value not in allowed:
+        raise ValueError(f"{name}: must be one of {allowed}, got {value!r}")
+    return value
+
+
+# (필드명, 환경 변수, 파서)
+_ENV_FIELDS = (
+    ("anthropic_api_key", "ANTHROPIC_API_KEY", str),
+    ("openai_api_key", "OPENAI_API_KEY", str),
+    ("langsmith_api_key", "LANGSMITH_API_KEY", str),
+    ("langsmith_project", "LANGSMITH_PROJECT", str),
+    ("langsmith_tracing", "LANGSMITH_TRACING", bool),
+    ("llm_provider", "LLM_PROVIDER", LLMProvider),
+    ("llm_model_claude", "LLM_MODEL_CLAUDE", str),
+    ("llm_model_openai", "LLM_MODEL_OPENAI", str),
+    ("llm_response_cache", "LLM_RESPONSE_CACHE", bool),
+    ("grobid_url", "GROBID_URL", str),
+    ("grobid_soft_deadline", "GROBID_SOFT_DEADLINE", float),
+    ("output_language", "OUTPUT_LANGUAGE", str),
+    ("paper_source", "PAPER_SOURCE", PaperSource),
+    ("hf_papers_min_votes", "HF_PAPERS_MIN_VOTES", int),
+    ("hf_papers_lookback_days", "HF_PAPERS_LOOKBACK_DAYS", int),
+    ("hf_papers_keywords", "HF_PAPERS_KEYWORDS", list),
+    ("interest_keywords", "INTEREST_KEYWORDS", list),
+    ("category_priority", "CATEGORY_PRIORITY", list),
+    ("arxiv_categories", "ARXIV_CATEGORIES", list),
+    ("arxiv_keywords", "ARXIV_KEYWORDS", list),
+    ("arxiv_max_results", "ARXIV_MAX_RESULTS", int),
+    ("arxiv_lookback_days", "ARXIV_LOOKBACK_DAYS", int),
+    ("skim_batch_size", "SKIM_BATCH_SIZE", int),
+    ("skim_max_concurrency", "SKIM_MAX_CONCURRENCY", int),
+    ("skim_interest_threshold", "SKIM_INTEREST_THRESHOLD", int),
+    ("max_deep_papers_per_day", "MAX_DEEP_PAPERS_PER_DAY", int),
+    ("venue_filter_enabled", "VENUE_FILTER_ENABLED", bool),
+    ("venue_filter_conferences", "VENUE_FILTER_CONFERENCES", list),
+    ("venue_filter_mode", "VENUE_FILTER_MODE", VenueFilterMode),
+    ("analyze_github", "ANALYZE_GITHUB", bool),
+    ("agent_models", "AGENT_MODELS", dict),
+    ("scheduler_timezone", "SCHEDULER_TIMEZONE", str),
+    ("base_dir", "BASE_DIR", Path),
+    ("report_base_dir", "REPORT_BASE_DIR", Path),
+)
+
+
+def _load_settings() -> Settings:
+    """Build Settings from a single pass over the environment.
+
+    List/dict fields are parsed from JSON and env names match case-insensitively,
+    as with pydantic-settings previously.
+    """
+    env = {key.upper(): value for key, value in os.environ.items()}
+    values: dict[str, object] = {}
+    for field_name, env_name, kind in _ENV_FIELDS:
+        raw = env.get(env_name)
+        if raw is None:
+            continue
+        if kind is str:
+            values[field_name] = raw
+        elif kind is bool:
+            values[field_name] = _parse_bool(env_name, raw)
+        elif kind is int:
+            values[field_name] = int(raw)
+        elif kind is float:
+            values[field_name] = float(raw)
+        elif kind is list or kind is dict:
+            values[field_name] = _parse_json(env_name, raw, kind)
+        elif kind is Path:
+            values[field_name] = Path(raw)
+        else:
+            values[field_name] = _parse_literal(env_name, raw, kind)
+    return Settings(**values)
+
+
+settings = _load_settings()
 
 
 def get_settings() -> Settings:
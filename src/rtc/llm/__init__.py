@@ -1,14 +1,17 @@
 """LLM abstraction layer."""
 
 from rtc.llm.base import BaseLLMClient
+from rtc.llm.cache import LLMCache, get_llm_cache
 from rtc.llm.claude import ClaudeLLMClient
 from rtc.llm.factory import LLMFactory, get_llm_client
 from rtc.llm.openai import OpenAILLMClient
 
 __all__ = [
     "BaseLLMClient",
+    "LLMCache",
     "ClaudeLLMClient",
     "OpenAILLMClient",
     "LLMFactory",
     "get_llm_client",
+    "get_llm_cache",
 ]
@@ -1,12 +1,117 @@
 """Base LLM client interface."""
 
+import functools
+import json
+import re
 from abc import ABC, abstractmethod
 from typing import Any, TypeVar
 
+import orjson
 from pydantic import BaseModel
 
 T = TypeVar("T", bound=BaseModel)
 
+_DECODER = json.JSONDecoder()
+_JSON_STRUCTURAL = re.compile(r'[{}"\\]')
+
+
+STRUCTURED_SYSTEM_TEMPLATE = (
+    "You are a helpful assistant that outputs valid JSON matching the provided schema.\n"
+    "\n"
+    "Output Schema:\n"
+    "```json\n"
+    "{schema_json}\n"
+    "```\n"
+    "\n"
+    "IMPORTANT: Your response must be ONLY valid JSON matching this schema. "
+    "No markdown, no explanation, just the JSON object."
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _schema_to_prompt_json(cls: type[BaseModel]) -> str:
+    """Serialize a schema's JSON Schema for prompt injection (cached per class)."""
+    return orjson.dumps(cls.model_json_schema(), option=orjson.OPT_INDENT_2).decode()
+
+
+@functools.lru_cache(maxsize=128)
+def structured_system_prompt(cls: type[BaseModel]) -> str:
+    """Build the schema instruction block for structured output (cached per class)."""
+    return STRUCTURED_SYSTEM_TEMPLATE.format(schema_json=_schema_to_prompt_json(cls))
+
+
+class JSONStreamScanner:
+    """Track brace depth over streamed text and decode the first complete JSON object.
+
+    Only structural characters are inspected, and string/escape state is carried
+    across chunk boundaries, so braces inside string values are ignored.
+    """
+
+    __slots__ = ("_parts", "_offset", "_start", "_depth", "_in_string", "_escape")
+
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+        self._offset = 0
+        self._start = -1
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    @property
+    def text(self) -> str:
+        """All text fed so far."""
+        return "".join(self._parts)
+
+    def feed(self, chunk: str) -> Any | None:
+        """Feed a chunk of streamed text.
+
+        Returns:
+            The decoded object once the first top-level object is complete, else None.
+        """
+        base = self._offset
+        self._parts.append(chunk)
+        self._offset += len(chunk)
+
+        skip_until = -1
+        if self._escape and chunk:
+            # Previous chunk ended with a backslash inside a string
+            self._escape = False
+            skip_until = 1
+
+        for match in _JSON_STRUCTURAL.finditer(chunk):
+            pos = match.start()
+            if pos < skip_until:
+                continue
+            char = match.group()
+
+            if self._in_string:
+                if char == "\\":
+                    if pos + 1 < len(chunk):
+                        skip_until = pos + 2
+                    else:
+                        self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                if self._start != -1:
+                    self._in_string = True
+            elif char == "{":
+                if self._start == -1:
+                    self._start = base + pos
+                self._depth += 1
+            elif char == "}" and self._start != -1:
+                self._depth -= 1
+                if self._depth == 0:
+                    try:
+                        obj, _ = _DECODER.raw_decode(self.text, self._start)
+                        return obj
+                    except ValueError:
+                        # Not a valid object after all; look for the next one
+                        self._start = -1
+        return None
+
 
 class BaseLLMClient(ABC):
     """Abstract base class for LLM clients."""
@@ -60,38 +165,35 @@ class BaseLLMClient(ABC):
         """Get the model name being used."""
         pass
 
-    def _extract_json_from_response(self, text: str) -> str:
-        """Extract JSON from a response that may contain markdown code blocks."""
-        text = text.strip()
+    def _parse_json_response(self, text: str) -> Any:
+        """Parse the first JSON object in a response that may contain markdown code blocks.
 
-        # Try to find JSON in code blocks
-        if "```json" in text:
-            start = text.find("```json") + 7
-            end = text.find("```", start)
-            if end > start:
-                return text[start:end].strip()
+        The common case (the whole response is one JSON value) is parsed with orjson.
+        Otherwise ``json.JSONDecoder.raw_decode`` finds the object boundary, so the
+        parsed value is returned without a separate extraction pass.
+        """
+        text = text.strip()
 
-        if "```" in text:
-            start = text.find("```") + 3
-            end = text.find("```", start)
+        # Strip code fences if present
+        fence = text.find("```")
+        if fence != -1:
+            start = text.find("\n", fence)
+            end = text.find("```", start + 1) if start != -1 else -1
             if end > start:
-                return text[start:end].strip()
+                text = text[start + 1 : end].strip()
 
-        # Try to find raw JSON
-        if text.startswith("{"):
-            return text
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
 
-        # Look for JSON object in the text
         start = text.find("{")
-        if start != -1:
-            # Find matching closing brace
-            depth = 0
-            for i, char in enumerate(text[start:], start):
-                if char == "{":
-                    depth += 1
-                elif char == "}":
-                    depth -= 1
-                    if depth == 0:
-                        return text[start : i + 1]
-
-        return text
+        if start == -1:
+            return json.loads(text)
+
+        obj, _ = _DECODER.raw_decode(text, start)
+        return obj
+
+    def _extract_json_from_response(self, text: str) -> str:
+        """Extract JSON from a response (back-compat wrapper around ``_parse_json_response``)."""
+        return orjson.dumps(self._parse_json_response(text)).decode()
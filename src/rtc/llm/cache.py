@@ -0,0 +1,97 @@
+"""SQLite-backed response cache for deterministic LLM calls."""
+
+import asyncio
+import functools
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from rtc.config import get_settings
+
+
+class LLMCache:
+    """Persistent key/value cache for LLM responses.
+
+    Only deterministic calls (temperature == 0) should be cached; keys are
+    derived from everything that determines the response.
+    """
+
+    def __init__(self, path: Path):
+        """Open (and create if needed) the cache database.
+
+        Args:
+            path: SQLite database file path.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+
+    @staticmethod
+    def make_key(
+        model: str,
+        system_prompt: str | None,
+        prompt: str,
+        schema_name: str | None = None,
+        max_tokens: int | None = None,
+    ) -> str:
+        """Build a cache key from the request parameters.
+
+        Args:
+            model: Model name.
+            system_prompt: System prompt (None if absent).
+            prompt: User prompt.
+            schema_name: Output schema name for structured calls.
+            max_tokens: Token limit (affects truncation of the response).
+
+        Returns:
+            32-char hex digest.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (model, system_prompt or "", prompt, schema_name or "", str(max_tokens)):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached value for a key, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str) -> None:
+        """Store a value for a key (overwrites)."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, created_at) VALUES (?, ?, ?)",
+                (key, value, time.time()),
+            )
+
+    async def aget(self, key: str) -> str | None:
+        """Like ``get``, but runs the SQLite read in a worker thread."""
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: str) -> None:
+        """Like ``set``, but runs the SQLite write (and WAL commit) in a worker thread."""
+        await asyncio.to_thread(self.set, key, value)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+@functools.lru_cache(maxsize=1)
+def get_llm_cache() -> LLMCache:
+    """Get the process-wide LLM cache at ``base_dir/cache/llm.sqlite``."""
+    return LLMCache(get_settings().base_dir / "cache" / "llm.sqlite")
@@ -1,18 +1,30 @@
 """Claude LLM client implementation."""
 
-import json
 from typing import TypeVar
 
+from anthropic import AsyncAnthropic
 from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import HumanMessage, SystemMessage
+from langsmith.wrappers import wrap_anthropic
 from pydantic import BaseModel
 
 from rtc.config import get_settings
-from rtc.llm.base import BaseLLMClient
+from rtc.llm.base import BaseLLMClient, JSONStreamScanner, structured_system_prompt
 
 T = TypeVar("T", bound=BaseModel)
 
 
+def _chunk_text(chunk) -> str:
+    """Extract text from a streamed message chunk (str or content-block list)."""
+    content = chunk.content
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block.get("text", "") if isinstance(block, dict) else str(block)
+        for block in content
+    )
+
+
 class ClaudeLLMClient(BaseLLMClient):
     """Claude LLM client using langchain-anthropic."""
 
@@ -29,6 +41,9 @@ class ClaudeLLMClient(BaseLLMClient):
             api_key=settings.anthropic_api_key,
             max_tokens=4096,
         )
+        # Raw SDK client for structured calls (prompt caching via cache_control blocks),
+        # wrapped so the calls still show up in LangSmith traces like the langchain ones
+        self._async_client = wrap_anthropic(AsyncAnthropic(api_key=settings.anthropic_api_key))
 
     async def generate(
         self,
@@ -51,8 +66,10 @@ class ClaudeLLMClient(BaseLLMClient):
             temperature=temperature,
         )
 
-        response = await client.ainvoke(messages)
-        return response.content
+        parts: list[str] = []
+        async for chunk in client.astream(messages):
+            parts.append(_chunk_text(chunk))
+        return "".join(parts)
 
     async def generate_structured(
         self,
@@ -62,40 +79,47 @@ class ClaudeLLMClient(BaseLLMClient):
         temperature: float = 0.0,
         max_tokens: int = 4096,
     ) -> T:
-        """Generate a structured response matching a Pydantic schema."""
-        # Build schema description
-        schema_json = json.dumps(output_schema.model_json_schema(), indent=2)
-
-        structured_system = f"""You are a helpful assistant that outputs valid JSON matching the provided schema.
-
-Output Schema:
-```json
-{schema_json}
-```
-
-IMPORTANT: Your response must be ONLY valid JSON matching this schema. No markdown, no explanation, just the JSON object."""
+        """Generate a structured response matching a Pydantic schema.
 
+        The caller's system prompt and the schema block are sent as separate
+        ``cache_control`` system blocks (in that order, as in the plain-text
+        prompt) so repeated calls with the same agent prompt/schema only pay
+        prefill for the user message.
+        """
+        system_blocks = []
         if system_prompt:
-            structured_system = f"{system_prompt}\n\n{structured_system}"
-
-        messages = [
-            SystemMessage(content=structured_system),
-            HumanMessage(content=prompt),
-        ]
+            system_blocks.append(
+                {
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            )
+        system_blocks.append(
+            {
+                "type": "text",
+                "text": structured_system_prompt(output_schema),
+                "cache_control": {"type": "ephemeral"},
+            }
+        )
 
-        client = ChatAnthropic(
+        # Stream and return as soon as the top-level JSON object is complete
+        scanner = JSONStreamScanner()
+        data = None
+        async with self._async_client.messages.stream(
             model=self.model,
-            api_key=get_settings().anthropic_api_key,
             max_tokens=max_tokens,
             temperature=temperature,
-        )
-
-        response = await client.ainvoke(messages)
-        response_text = response.content
-
-        # Extract and parse JSON
-        json_str = self._extract_json_from_response(response_text)
-        data = json.loads(json_str)
+            system=system_blocks,
+            messages=[{"role": "user", "content": prompt}],
+        ) as stream:
+            async for text in stream.text_stream:
+                data = scanner.feed(text)
+                if data is not None:
+                    break
+
+        if data is None:
+            data = self._parse_json_response(scanner.text)
 
         return output_schema.model_validate(data)
 
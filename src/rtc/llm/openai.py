@@ -1,41 +1,207 @@
 """OpenAI LLM client implementation."""
 
-import json
-from typing import TypeVar
+import copy
+import functools
+import re
+from typing import Any, TypeVar
 
+import orjson
 from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.runnables import Runnable
 from langchain_openai import ChatOpenAI
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from rtc.config import get_settings
-from rtc.llm.base import BaseLLMClient
+from rtc.llm.base import BaseLLMClient, structured_system_prompt
+from rtc.llm.cache import LLMCache, get_llm_cache
 
 T = TypeVar("T", bound=BaseModel)
 
+# Validation keywords that strict Structured Outputs rejects (pydantic still enforces them)
+_UNSUPPORTED_STRICT_KEYWORDS = (
+    "default",
+    "minLength",
+    "maxLength",
+    "pattern",
+    "format",
+    "minimum",
+    "maximum",
+    "exclusiveMinimum",
+    "exclusiveMaximum",
+    "multipleOf",
+    "minItems",
+    "maxItems",
+    "uniqueItems",
+)
+
+
+def _make_strict(node: Any) -> bool:
+    """Rewrite a JSON schema in place for strict mode.
+
+    Returns:
+        False if the schema uses a construct strict mode cannot express
+        (free-form dicts: ``additionalProperties`` set to anything but False).
+    """
+    if isinstance(node, list):
+        return all(_make_strict(item) for item in node)
+    if not isinstance(node, dict):
+        return True
+
+    for keyword in _UNSUPPORTED_STRICT_KEYWORDS:
+        node.pop(keyword, None)
+
+    if node.get("type") == "object" or "properties" in node:
+        # Free-form dicts (additionalProperties true or a schema) would become closed objects
+        if node.get("additionalProperties", False) is not False:
+            return False
+        properties = node.setdefault("properties", {})
+        node["required"] = list(properties)
+        node["additionalProperties"] = False
+        if not all(_make_strict(prop) for prop in properties.values()):
+            return False
+
+    for key in ("items", "anyOf", "allOf", "$defs"):
+        child = node.get(key)
+        if child is None:
+            continue
+        children = child.values() if key == "$defs" else [child]
+        if not all(_make_strict(c) for c in children):
+            return False
+
+    return True
+
+
+@functools.lru_cache(maxsize=128)
+def strict_response_format(cls: type[BaseModel]) -> dict[str, Any] | None:
+    """Build a strict ``json_schema`` response_format for a schema (cached per class).
+
+    Returns:
+        response_format dict, or None if the schema cannot be expressed in strict mode.
+    """
+    schema = copy.deepcopy(cls.model_json_schema())
+    if not _make_strict(schema):
+        return None
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": cls.__name__, "schema": schema, "strict": True},
+    }
+
+
+def _has_constraint_keywords(node: Any) -> bool:
+    """Whether a JSON schema uses validation keywords that strict mode drops."""
+    if isinstance(node, list):
+        return any(_has_constraint_keywords(item) for item in node)
+    if not isinstance(node, dict):
+        return False
+    if any(keyword in node for keyword in _UNSUPPORTED_STRICT_KEYWORDS if keyword != "default"):
+        return True
+    return any(_has_constraint_keywords(value) for value in node.values())
+
+
+@functools.lru_cache(maxsize=128)
+def _can_skip_validation(cls: type[BaseModel]) -> bool:
+    """Whether a strict-mode response can be built with ``model_construct`` (cached per class).
+
+    Requires a flat schema (``model_construct`` does not recurse, so nested models would
+    stay plain dicts) with no constraint keywords (``_make_strict`` strips them, so the
+    server never enforces bounds such as ``ge``/``le``).
+    """
+    schema = cls.model_json_schema()
+    return "$defs" not in schema and not _has_constraint_keywords(schema)
+
 
 class OpenAILLMClient(BaseLLMClient):
     """OpenAI LLM client using langchain-openai."""
 
-    # o-시리즈 모델은 temperature를 지원하지 않음
-    REASONING_MODELS = ("o1", "o3", "o4", "o1-", "o3-", "o4-")
+    # o-시리즈 모델은 temperature를 지원하지 않음 (o1, o3, o4, o1-*, o3-*, o4-*)
+    REASONING_MODEL_PATTERN = re.compile(r"o[134](?:-|$)")
+
+    # Structured Outputs(response_format json_schema, strict) 지원 모델
+    JSON_SCHEMA_MODELS = ("gpt-4o", "gpt-4.1", "gpt-5", "o1", "o3", "o4")
+    JSON_SCHEMA_UNSUPPORTED = ("gpt-4o-2024-05-13", "o1-mini", "o1-preview")
+
+    DEFAULT_TEMPERATURE = 0.0
+    DEFAULT_MAX_TOKENS = 4096
 
-    def __init__(self, model: str | None = None):
+    def __init__(self, model: str | None = None, validate_responses: bool = False):
         """Initialize OpenAI client.
 
         Args:
             model: Model name to use. Defaults to settings.
+            validate_responses: Always run pydantic validation, even for
+                responses already constrained by a strict json_schema.
         """
         settings = get_settings()
         self.model = model or settings.llm_model_openai
-        self._client = ChatOpenAI(
-            model=self.model,
-            api_key=settings.openai_api_key,
-            max_tokens=4096,
+        self.validate_responses = validate_responses
+        self.cache_responses = settings.llm_response_cache
+        self._is_reasoning = self._is_reasoning_model()
+        self._json_schema_supported = self._supports_json_schema()
+
+        # 추론 모델은 temperature 지원 안 함
+        kwargs = {
+            "model": self.model,
+            "api_key": settings.openai_api_key,
+            "max_tokens": self.DEFAULT_MAX_TOKENS,
+        }
+        if not self._is_reasoning:
+            kwargs["temperature"] = self.DEFAULT_TEMPERATURE
+
+        self._client_plain = ChatOpenAI(**kwargs)
+        self._client_json = ChatOpenAI(
+            **kwargs, model_kwargs={"response_format": {"type": "json_object"}}
         )
+        # (json_mode, temperature, max_tokens, format_key) -> bound runnable
+        self._bound_clients: dict[tuple, Runnable] = {}
 
     def _is_reasoning_model(self) -> bool:
         """추론 모델인지 확인 (o1, o3, o4 시리즈)."""
-        return any(self.model.startswith(prefix) for prefix in self.REASONING_MODELS)
+        return self.REASONING_MODEL_PATTERN.match(self.model) is not None
+
+    def _supports_json_schema(self) -> bool:
+        """Structured Outputs(json_schema strict) 지원 모델인지 확인."""
+        return self.model.startswith(self.JSON_SCHEMA_MODELS) and not self.model.startswith(
+            self.JSON_SCHEMA_UNSUPPORTED
+        )
+
+    def _get_client(
+        self,
+        json_mode: bool,
+        temperature: float,
+        max_tokens: int,
+        response_format: dict[str, Any] | None = None,
+        format_key: Any = None,
+    ) -> Runnable:
+        """Return the cached client, bound to non-default call parameters if needed.
+
+        Args:
+            json_mode: Use the json_object client
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            response_format: Explicit response_format to bind (e.g. json_schema)
+            format_key: Hashable cache key identifying ``response_format``
+        """
+        client = self._client_json if json_mode else self._client_plain
+        if self._is_reasoning:
+            temperature = self.DEFAULT_TEMPERATURE
+        if (
+            response_format is None
+            and temperature == self.DEFAULT_TEMPERATURE
+            and max_tokens == self.DEFAULT_MAX_TOKENS
+        ):
+            return client
+
+        key = (json_mode, temperature, max_tokens, format_key)
+        bound = self._bound_clients.get(key)
+        if bound is None:
+            bind_kwargs: dict[str, Any] = {"max_tokens": max_tokens}
+            if not self._is_reasoning:
+                bind_kwargs["temperature"] = temperature
+            if response_format is not None:
+                bind_kwargs["response_format"] = response_format
+            bound = client.bind(**bind_kwargs)
+            self._bound_clients[key] = bound
+        return bound
 
     async def generate(
         self,
@@ -43,25 +209,32 @@ class OpenAILLMClient(BaseLLMClient):
         system_prompt: str | None = None,
         temperature: float = 0.0,
         max_tokens: int = 4096,
+        cache: bool | None = None,
     ) -> str:
-        """Generate a text response using OpenAI."""
+        """Generate a text response using OpenAI.
+
+        Deterministic calls (temperature 0) are served from / stored in the
+        LLM response cache when ``cache`` is True (None: the
+        ``llm_response_cache`` setting, off by default).
+        """
+        cache_key = None
+        if (self.cache_responses if cache is None else cache) and temperature == 0:
+            cache_key = LLMCache.make_key(self.model, system_prompt, prompt, None, max_tokens)
+            cached = await get_llm_cache().aget(cache_key)
+            if cached is not None:
+                return cached
+
         messages = []
         if system_prompt:
             messages.append(SystemMessage(content=system_prompt))
         messages.append(HumanMessage(content=prompt))
 
-        # 추론 모델은 temperature 지원 안 함
-        kwargs = {
-            "model": self.model,
-            "api_key": get_settings().openai_api_key,
-            "max_tokens": max_tokens,
-        }
-        if not self._is_reasoning_model():
-            kwargs["temperature"] = temperature
-
-        client = ChatOpenAI(**kwargs)
+        client = self._get_client(False, temperature, max_tokens)
 
         response = await client.ainvoke(messages)
+        # Empty responses are not cached so a retry asks the model again
+        if cache_key is not None and response.content:
+            await get_llm_cache().aset(cache_key, response.content)
         return response.content
 
     async def generate_structured(
@@ -71,45 +244,90 @@ class OpenAILLMClient(BaseLLMClient):
         system_prompt: str | None = None,
         temperature: float = 0.0,
         max_tokens: int = 4096,
+        cache: bool | None = None,
     ) -> T:
-        """Generate a structured response using OpenAI's JSON mode."""
-        schema_json = json.dumps(output_schema.model_json_schema(), indent=2)
-
-        structured_system = f"""You are a helpful assistant that outputs valid JSON matching the provided schema.
+        """Generate a structured response using OpenAI's JSON mode.
 
-Output Schema:
-```json
-{schema_json}
-```
+        Models that support Structured Outputs get a strict ``json_schema``
+        response_format (schema enforced server-side, no schema text in the
+        prompt). Other models, or schemas that strict mode cannot express, use
+        json_object mode with the schema injected into the system prompt.
 
-IMPORTANT: Your response must be ONLY valid JSON matching this schema. No markdown, no explanation, just the JSON object."""
+        Deterministic calls (temperature 0) are served from / stored in the
+        LLM response cache when ``cache`` is True (None: the
+        ``llm_response_cache`` setting, off by default).
+        """
+        cache_key = None
+        if (self.cache_responses if cache is None else cache) and temperature == 0:
+            cache_key = LLMCache.make_key(
+                self.model, system_prompt, prompt, output_schema.__name__, max_tokens
+            )
+            cached = await get_llm_cache().aget(cache_key)
+            if cached is not None:
+                try:
+                    return output_schema.model_validate_json(cached)
+                except ValidationError:
+                    # Schema changed since the entry was written; refetch
+                    pass
 
-        if system_prompt:
-            structured_system = f"{system_prompt}\n\n{structured_system}"
+        # Raises on parse/validation failure, so only valid results are cached
+        result = await self._generate_structured(
+            prompt, output_schema, system_prompt, temperature, max_tokens
+        )
+        if cache_key is not None:
+            await get_llm_cache().aset(cache_key, result.model_dump_json())
+        return result
 
-        messages = [
-            SystemMessage(content=structured_system),
-            HumanMessage(content=prompt),
-        ]
+    async def _generate_structured(
+        self,
+        prompt: str,
+        output_schema: type[T],
+        system_prompt: str | None,
+        temperature: float,
+        max_tokens: int,
+    ) -> T:
+        """Call the model and parse/validate its structured response."""
+        response_format = (
+            strict_response_format(output_schema) if self._json_schema_supported else None
+        )
 
-        # 추론 모델은 temperature 지원 안 함
-        kwargs = {
-            "model": self.model,
-            "api_key": get_settings().openai_api_key,
-            "max_tokens": max_tokens,
-            "model_kwargs": {"response_format": {"type": "json_object"}},
-        }
-        if not self._is_reasoning_model():
-            kwargs["temperature"] = temperature
+        if response_format is not None:
+            messages = []
+            if system_prompt:
+                messages.append(SystemMessage(content=system_prompt))
+            messages.append(HumanMessage(content=prompt))
+            client = self._get_client(
+                False, temperature, max_tokens, response_format, format_key=output_schema
+            )
+        else:
+            structured_system = structured_system_prompt(output_schema)
+            if system_prompt:
+                structured_system = f"{system_prompt}\n\n{structured_system}"
 
-        client = ChatOpenAI(**kwargs)
+            messages = [
+                SystemMessage(content=structured_system),
+                HumanMessage(content=prompt),
+            ]
+            client = self._get_client(True, temperature, max_tokens)
 
         response = await client.ainvoke(messages)
         response_text = response.content
 
-        # Parse JSON
-        json_str = self._extract_json_from_response(response_text)
-        data = json.loads(json_str)
+        if response_format is not None:
+            # Strict mode guarantees the shape but not stripped constraints; skip validation
+            # only for flat schemas that have none
+            if not self.validate_responses and _can_skip_validation(output_schema):
+                return output_schema.model_construct(**orjson.loads(response_text))
+            return output_schema.model_validate_json(response_text)
+
+        # Fast path: JSON mode usually returns a bare object, validated in one pass
+        try:
+            return output_schema.model_validate_json(response_text)
+        except ValidationError:
+            pass
+
+        # Slow path: tolerate surrounding text / code fences
+        data = self._parse_json_response(response_text)
 
         # Handle case where LLM returns schema-like structure with values in "properties"
         if "properties" in data and isinstance(data["properties"], dict):
@@ -1,11 +1,6 @@
 """MCP (Model Context Protocol) integration."""
 
-from rtc.mcp.servers import (
-    ArxivServer,
-    GrobidServer,
-    HFPapersServer,
-    PyMuPDFParser,
-)
+from typing import Any
 
 __all__ = [
     "ArxivServer",
@@ -13,3 +8,11 @@ __all__ = [
     "HFPapersServer",
     "PyMuPDFParser",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in __all__:
+        from rtc.mcp import servers
+
+        return getattr(servers, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
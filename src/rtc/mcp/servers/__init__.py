@@ -1,11 +1,20 @@
-"""MCP server implementations."""
+"""MCP server implementations.
 
-from rtc.mcp.servers.arxiv_server import ArxivServer
-from rtc.mcp.servers.arxiv_server import paper_dict_to_candidate as arxiv_paper_to_candidate
-from rtc.mcp.servers.grobid_server import GrobidServer
-from rtc.mcp.servers.hf_papers_server import HFPapersServer
-from rtc.mcp.servers.hf_papers_server import paper_dict_to_candidate as hf_paper_to_candidate
-from rtc.mcp.servers.pymupdf_parser import PyMuPDFParser
+Exports are resolved lazily (PEP 562) so importing this package does not
+pull in every server module and its heavy dependencies (PyMuPDF, lxml).
+"""
+
+import importlib
+from typing import Any
+
+_EXPORTS: dict[str, tuple[str, str]] = {
+    "ArxivServer": ("rtc.mcp.servers.arxiv_server", "ArxivServer"),
+    "GrobidServer": ("rtc.mcp.servers.grobid_server", "GrobidServer"),
+    "HFPapersServer": ("rtc.mcp.servers.hf_papers_server", "HFPapersServer"),
+    "PyMuPDFParser": ("rtc.mcp.servers.pymupdf_parser", "PyMuPDFParser"),
+    "arxiv_paper_to_candidate": ("rtc.mcp.servers.arxiv_server", "paper_dict_to_candidate"),
+    "hf_paper_to_candidate": ("rtc.mcp.servers.hf_papers_server", "paper_dict_to_candidate"),
+}
 
 __all__ = [
     "ArxivServer",
@@ -15,3 +24,17 @@ __all__ = [
     "arxiv_paper_to_candidate",
     "hf_paper_to_candidate",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
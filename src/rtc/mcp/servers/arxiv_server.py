@@ -1,19 +1,122 @@
 """arXiv MCP Server implementation."""
 
+import asyncio
+import re
+import time
 from datetime import datetime, timedelta
 from typing import Any
 
-import arxiv
+import httpx
 
+from rtc.mcp.servers.common import get_shared_httpx_client, parse_iso, xml_parser
 from rtc.schemas import PaperCandidate
 
+# Atom feed namespaces used by the arXiv API
+ATOM_NS = {
+    "atom": "http://www.w3.org/2005/Atom",
+    "arxiv": "http://arxiv.org/schemas/atom",
+}
+
+_WHITESPACE = re.compile(r"\s+")
+# Version suffix of an arXiv ID (old-style IDs such as solv-int/9901001v1 contain other "v"s)
+_VERSION_SUFFIX = re.compile(r"v\d+$")
+
+# arXiv API terms: at most one request every 3 seconds (shared by all instances)
+REQUEST_INTERVAL = 3.0
+# Retries for throttling responses (503/429), as the arxiv client library did
+MAX_RETRIES = 3
+_RETRY_STATUS = (429, 503)
+
+# Monotonic time at which the next request may be sent
+_next_request_at = 0.0
+
+
+async def _wait_for_request_slot() -> None:
+    """Reserve the next request slot and sleep until it starts.
+
+    The slot is reserved before awaiting, so concurrent callers queue up
+    REQUEST_INTERVAL apart instead of bursting.
+    """
+    global _next_request_at
+    now = time.monotonic()
+    start = max(now, _next_request_at)
+    _next_request_at = start + REQUEST_INTERVAL
+    if start > now:
+        await asyncio.sleep(start - now)
+
 
 class ArxivServer:
-    """MCP Server for arXiv paper search and retrieval."""
+    """MCP Server for arXiv paper search and retrieval.
+
+    Queries the arXiv Atom API asynchronously over the shared HTTP client so
+    searches do not block the event loop.
+    """
+
+    API_URL = "https://export.arxiv.org/api/query"
+    # Results per API request (pages are fetched one at a time)
+    PAGE_SIZE = 100
 
-    def __init__(self):
-        """Initialize arXiv server."""
-        self._client = arxiv.Client()
+    def __init__(self, client: httpx.AsyncClient | None = None):
+        """Initialize arXiv server.
+
+        Args:
+            client: HTTP client to use. Defaults to the shared client.
+        """
+        self._client = client
+
+    async def _query(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        """Run one rate-limited arXiv API request and parse the Atom entries."""
+        client = self._client or get_shared_httpx_client()
+        for attempt in range(MAX_RETRIES + 1):
+            await _wait_for_request_slot()
+            response = await client.get(self.API_URL, params=params, timeout=60.0)
+            if response.status_code not in _RETRY_STATUS or attempt == MAX_RETRIES:
+                break
+        response.raise_for_status()
+
+        root = xml_parser.fromstring(response.content)
+        return [self._parse_entry(entry) for entry in root.iterfind("atom:entry", ATOM_NS)]
+
+    def _parse_entry(self, entry: Any) -> dict[str, Any]:
+        """Convert an Atom <entry> into a paper metadata dict."""
+
+        def text(path: str) -> str | None:
+            elem = entry.find(path, ATOM_NS)
+            return elem.text if elem is not None else None
+
+        entry_id = text("atom:id") or ""
+        published = _parse_atom_datetime(text("atom:published"))
+        updated = _parse_atom_datetime(text("atom:updated"))
+
+        pdf_url = None
+        links = []
+        for link in entry.iterfind("atom:link", ATOM_NS):
+            title = link.get("title")
+            links.append({"href": link.get("href"), "title": title})
+            if title == "pdf":
+                pdf_url = link.get("href")
+
+        primary = entry.find("arxiv:primary_category", ATOM_NS)
+
+        return {
+            # Keep the archive prefix of old-style IDs (…/abs/solv-int/9901001v1)
+            "arxiv_id": entry_id.rpartition("/abs/")[2] or entry_id.split("/")[-1],
+            "title": _WHITESPACE.sub(" ", text("atom:title") or "").strip(),
+            "abstract": (text("atom:summary") or "").strip(),
+            "authors": [
+                name.text for name in entry.iterfind("atom:author/atom:name", ATOM_NS)
+            ],
+            "categories": [
+                cat.get("term") for cat in entry.iterfind("atom:category", ATOM_NS)
+            ],
+            "published": published.isoformat() if published else None,
+            "updated": updated.isoformat() if updated else None,
+            "pdf_url": pdf_url,
+            "comment": text("arxiv:comment"),
+            "journal_ref": text("arxiv:journal_ref"),
+            "primary_category": primary.get("term") if primary is not None else None,
+            "links": links,
+        }
 
     async def search_papers(
         self,
@@ -49,33 +152,35 @@ class ArxivServer:
         # Calculate date cutoff
         cutoff_date = datetime.now() - timedelta(days=days_back)
 
-        # Search
-        search = arxiv.Search(
-            query=query,
-            max_results=max_results,
-            sort_by=arxiv.SortCriterion.SubmittedDate,
-            sort_order=arxiv.SortOrder.Descending,
-        )
-
+        # Search (pages fetched sequentially; _query spaces requests per arXiv API terms)
         results = []
-        for paper in self._client.results(search):
-            # Filter by date
-            if paper.published.replace(tzinfo=None) < cutoff_date:
-                continue
-
-            results.append({
-                "arxiv_id": paper.entry_id.split("/")[-1],
-                "title": paper.title,
-                "abstract": paper.summary,
-                "authors": [a.name for a in paper.authors],
-                "categories": paper.categories,
-                "published": paper.published.isoformat(),
-                "updated": paper.updated.isoformat() if paper.updated else None,
-                "pdf_url": paper.pdf_url,
-                "comment": paper.comment,
-                "journal_ref": paper.journal_ref,
+        for start in range(0, max_results, self.PAGE_SIZE):
+            page_size = min(self.PAGE_SIZE, max_results - start)
+            page = await self._query({
+                "search_query": query,
+                "start": start,
+                "max_results": page_size,
+                "sortBy": "submittedDate",
+                "sortOrder": "descending",
             })
 
+            reached_cutoff = False
+            for paper in page:
+                # Filter by date
+                published = paper["published"]
+                if not published or (
+                    datetime.fromisoformat(published).replace(tzinfo=None) < cutoff_date
+                ):
+                    reached_cutoff = reached_cutoff or bool(published)
+                    continue
+
+                del paper["primary_category"], paper["links"]
+                results.append(paper)
+
+            # Newest first: once a page reaches the cutoff (or runs out), later pages cannot match
+            if reached_cutoff or len(page) < page_size:
+                break
+
         return results
 
     async def get_paper_metadata(self, arxiv_id: str) -> dict[str, Any]:
@@ -87,23 +192,51 @@ class ArxivServer:
         Returns:
             Paper metadata dict
         """
-        search = arxiv.Search(id_list=[arxiv_id])
-        paper = next(self._client.results(search))
+        papers = await self.get_paper_metadata_batch([arxiv_id], chunk_size=1)
+        if not papers:
+            raise ValueError(f"arXiv paper not found: {arxiv_id}")
+        return papers[0]
 
-        return {
-            "arxiv_id": arxiv_id,
-            "title": paper.title,
-            "abstract": paper.summary,
-            "authors": [a.name for a in paper.authors],
-            "categories": paper.categories,
-            "published": paper.published.isoformat(),
-            "updated": paper.updated.isoformat() if paper.updated else None,
-            "pdf_url": paper.pdf_url,
-            "comment": paper.comment,
-            "journal_ref": paper.journal_ref,
-            "primary_category": paper.primary_category,
-            "links": [{"href": l.href, "title": l.title} for l in paper.links],
-        }
+    async def get_paper_metadata_batch(
+        self,
+        arxiv_ids: list[str],
+        chunk_size: int = 100,
+    ) -> list[dict[str, Any]]:
+        """Get metadata for many papers with one id_list request per chunk.
+
+        Args:
+            arxiv_ids: arXiv paper IDs (with or without version suffix)
+            chunk_size: Maximum IDs per API request
+
+        Returns:
+            Paper metadata dicts in the order of ``arxiv_ids``. IDs that arXiv
+            does not return are omitted. ``arxiv_id`` is set to the requested ID.
+        """
+        if not arxiv_ids:
+            return []
+
+        # One chunk at a time; _query spaces requests per arXiv API terms
+        pages = []
+        for i in range(0, len(arxiv_ids), chunk_size):
+            chunk = arxiv_ids[i : i + chunk_size]
+            pages.append(
+                await self._query({"id_list": ",".join(chunk), "max_results": len(chunk)})
+            )
+
+        # Index by both versioned and base ID (e.g. 2401.12345v2 and 2401.12345)
+        by_id: dict[str, dict[str, Any]] = {}
+        for page in pages:
+            for paper in page:
+                versioned = paper["arxiv_id"]
+                by_id[versioned] = paper
+                by_id.setdefault(_VERSION_SUFFIX.sub("", versioned), paper)
+
+        results = []
+        for arxiv_id in arxiv_ids:
+            paper = by_id.get(arxiv_id)
+            if paper is not None:
+                results.append({**paper, "arxiv_id": arxiv_id})
+        return results
 
     async def get_pdf_url(self, arxiv_id: str) -> str:
         """Get the PDF URL for a paper.
@@ -125,13 +258,16 @@ def paper_dict_to_candidate(data: dict[str, Any]) -> PaperCandidate:
         abstract=data["abstract"],
         authors=data.get("authors", []),
         categories=data.get("categories", []),
-        published=datetime.fromisoformat(data["published"].replace("Z", "+00:00")),
-        updated=(
-            datetime.fromisoformat(data["updated"].replace("Z", "+00:00"))
-            if data.get("updated")
-            else None
-        ),
+        published=parse_iso(data["published"]),
+        updated=parse_iso(data["updated"]) if data.get("updated") else None,
         pdf_url=data["pdf_url"],
         comment=data.get("comment"),
         journal_ref=data.get("journal_ref"),
     )
+
+
+def _parse_atom_datetime(value: str | None) -> datetime | None:
+    """Parse an Atom timestamp (e.g. "2024-01-02T03:04:05Z")."""
+    if not value:
+        return None
+    return parse_iso(value)
@@ -0,0 +1,96 @@
+"""Shared helpers for MCP server implementations."""
+
+import asyncio
+import tempfile
+import weakref
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import IO
+
+import httpx
+
+# Re-exported XML parser module for the servers (lxml's C parser is faster for large
+# documents; lxml is optional)
+try:
+    from lxml import etree as xml_parser  # noqa: F401
+except ImportError:
+    import xml.etree.ElementTree as xml_parser  # noqa: F401, N813
+
+
+def parse_iso(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp, accepting a trailing "Z" for UTC.
+
+    Raises:
+        ValueError: If the string is not a valid ISO-8601 timestamp.
+    """
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+# Download chunk size for streamed PDF downloads
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# One shared client per event loop (httpx connection pools are loop-bound)
+_shared_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_shared_httpx_client() -> httpx.AsyncClient:
+    """Get the process-wide HTTP client for the running event loop.
+
+    The client keeps connections alive (HTTP/2 where the server supports it) so
+    GROBID, PDF downloads and HF API calls reuse TCP/TLS sessions across requests.
+    Close it with ``close_shared_httpx_client()`` at application shutdown.
+
+    Returns:
+        Shared ``httpx.AsyncClient``
+    """
+    loop = asyncio.get_running_loop()
+    client = _shared_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(120.0, connect=10.0),
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            follow_redirects=True,
+        )
+        _shared_clients[loop] = client
+    return client
+
+
+async def close_shared_httpx_client() -> None:
+    """Close the shared HTTP client of the running event loop, if any."""
+    client = _shared_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+@asynccontextmanager
+async def download_to_tempfile(
+    client: httpx.AsyncClient,
+    url: str,
+    suffix: str = ".pdf",
+) -> AsyncIterator[IO[bytes]]:
+    """Stream a download into a temporary file instead of holding it in memory.
+
+    The file is rewound before being yielded and deleted on exit.
+
+    Args:
+        client: HTTP client to download with
+        url: URL to download
+        suffix: Temporary file suffix
+
+    Yields:
+        Open binary file handle positioned at the start (``.name`` is a valid path)
+    """
+    with tempfile.NamedTemporaryFile(suffix=suffix) as tmp:
+        async with client.stream("GET", url, follow_redirects=True) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                tmp.write(chunk)
+        tmp.flush()
+        tmp.seek(0)
+        yield tmp
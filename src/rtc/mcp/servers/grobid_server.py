@@ -1,48 +1,176 @@
 """GROBID MCP Server implementation."""
 
+import asyncio
+import gzip
+import hashlib
+import os
 import re
 import xml.etree.ElementTree as ET
-from typing import Any
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Literal
 
 import httpx
 
 from rtc.config import get_settings
+from rtc.mcp.servers.common import (
+    download_to_tempfile,
+    get_shared_httpx_client,
+    xml_parser,
+)
+from rtc.mcp.servers.pymupdf_parser import PyMuPDFParser
 from rtc.schemas import ParsedPDF, Section, Table
 
+# TEI XML namespace
+_NS = {"tei": "http://www.tei-c.org/ns/1.0"}
+
+
+def _compile_path(path: str) -> Callable[[Any], list[Any]]:
+    """Compile a TEI element path once.
+
+    Uses a precompiled ``lxml.etree.XPath`` when lxml is available; otherwise
+    falls back to ElementTree's ``findall`` (which caches paths internally).
+    """
+    if hasattr(xml_parser, "XPath"):
+        return xml_parser.XPath(path, namespaces=_NS)
+    return lambda elem: elem.findall(path, _NS)
+
+
+def _first(matches: list[Any]) -> Any | None:
+    """Return the first match or None."""
+    return matches[0] if matches else None
+
+
+_XP_BODY = _compile_path(".//tei:body")
+_XP_DIVS = _compile_path(".//tei:div")
+_XP_HEAD = _compile_path("tei:head")
+_XP_PS = _compile_path("tei:p")
+_XP_TABLE_FIGS = _compile_path(".//tei:figure[@type='table']")
+_XP_TABLE = _compile_path("tei:table")
+_XP_ROWS = _compile_path("tei:row")
+_XP_CELLS = _compile_path("tei:cell")
+_XP_TITLE = _compile_path(".//tei:titleStmt/tei:title")
+_XP_ABSTRACT = _compile_path(".//tei:abstract")
+
 
 class GrobidServer:
     """MCP Server for GROBID PDF parsing."""
 
     # TEI XML namespace
-    NS = {"tei": "http://www.tei-c.org/ns/1.0"}
+    NS = _NS
+
+    _XML_ID = "{http://www.w3.org/XML/1998/namespace}id"
 
-    def __init__(self, grobid_url: str | None = None):
+    # pdf_url -> in-flight cached TEI request, shared across instances so a
+    # prefetch and a later parse of the same PDF hit GROBID only once (entries
+    # from another event loop are replaced on lookup)
+    _inflight: dict[str, "asyncio.Task[str]"] = {}
+
+    def __init__(
+        self,
+        grobid_url: str | None = None,
+        client: httpx.AsyncClient | None = None,
+    ):
         """Initialize GROBID server.
 
         Args:
             grobid_url: GROBID service URL. Defaults to settings.
+            client: HTTP client to use. Defaults to the shared client.
         """
         settings = get_settings()
         self.grobid_url = grobid_url or settings.grobid_url
+        self._client = client
+        self.cache_dir = settings.base_dir / "cache" / "grobid"
 
-    async def parse_pdf_to_tei(self, pdf_url: str) -> str:
+    async def parse_pdf_to_tei(self, pdf_url: str, *, cache: bool = True) -> str:
         """Parse a PDF to TEI-XML using GROBID.
 
+        TEI output is deterministic per PDF, so it is cached on disk (gzip) keyed
+        by the PDF URL and reused on later calls.
+
         Args:
             pdf_url: URL to the PDF file
+            cache: Read/write the on-disk TEI cache
 
         Returns:
             TEI-XML string
         """
-        async with httpx.AsyncClient(timeout=120.0, follow_redirects=True) as client:
-            # Download PDF
-            pdf_response = await client.get(pdf_url)
-            pdf_response.raise_for_status()
-            pdf_content = pdf_response.content
+        if not cache:
+            return await self._request_tei(pdf_url)
+
+        cache_path = self._cache_path(pdf_url)
+        try:
+            return gzip.decompress(cache_path.read_bytes()).decode("utf-8")
+        except (OSError, EOFError):
+            # Missing or corrupt cache entry
+            pass
+
+        # Shield so one cancelled waiter does not cancel the shared request
+        return await asyncio.shield(self._start_request(pdf_url, cache_path))
 
-            # Send to GROBID
+    def prefetch(self, pdf_url: str) -> None:
+        """Start converting a PDF in the background to warm the TEI cache.
+
+        A later ``parse_pdf_to_tei``/``parse_pdf_full`` call for the same URL
+        joins the in-flight request or reads the cached result. Must be called
+        from a running event loop.
+
+        Args:
+            pdf_url: URL to the PDF file
+        """
+        cache_path = self._cache_path(pdf_url)
+        if not cache_path.exists():
+            self._start_request(pdf_url, cache_path)
+
+    def _start_request(self, pdf_url: str, cache_path: Path) -> "asyncio.Task[str]":
+        """Return the in-flight TEI request for a URL, starting one if needed."""
+        task = self._inflight.get(pdf_url)
+        # A task left behind by another (possibly closed) event loop cannot be awaited here
+        if task is not None and task.get_loop() is not asyncio.get_running_loop():
+            task = None
+        if task is None:
+            task = asyncio.create_task(self._request_and_cache(pdf_url, cache_path))
+            self._inflight[pdf_url] = task
+            task.add_done_callback(lambda t: self._finish_request(pdf_url, t))
+        return task
+
+    @classmethod
+    def _finish_request(cls, pdf_url: str, task: "asyncio.Task[str]") -> None:
+        """Drop a finished request from the in-flight table.
+
+        The exception is marked as retrieved so a failed prefetch does not log an
+        unhandled-task warning; the next parse simply retries the request.
+        """
+        if cls._inflight.get(pdf_url) is task:
+            del cls._inflight[pdf_url]
+        if not task.cancelled():
+            task.exception()
+
+    async def _request_and_cache(self, pdf_url: str, cache_path: Path) -> str:
+        """Request TEI from GROBID and write it to the cache."""
+        tei_xml = await self._request_tei(pdf_url)
+        self._write_cache(cache_path, tei_xml)
+        return tei_xml
+
+    def _cache_path(self, pdf_url: str) -> Path:
+        """TEI cache file path for a PDF URL."""
+        key = hashlib.sha256(pdf_url.encode("utf-8")).hexdigest()[:16]
+        return self.cache_dir / f"{key}.xml.gz"
+
+    def _write_cache(self, path: Path, tei_xml: str) -> None:
+        """Write a TEI cache entry atomically (tmp file + os.replace)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(gzip.compress(tei_xml.encode("utf-8")))
+        os.replace(tmp_path, path)
+
+    async def _request_tei(self, pdf_url: str) -> str:
+        """Download a PDF and convert it to TEI-XML via the GROBID API."""
+        client = self._client or get_shared_httpx_client()
+        async with download_to_tempfile(client, pdf_url) as pdf_file:
+            # Send to GROBID (multipart upload streams from the downloaded file)
             grobid_endpoint = f"{self.grobid_url}/api/processFulltextDocument"
-            files = {"input": ("paper.pdf", pdf_content, "application/pdf")}
+            files = {"input": ("paper.pdf", pdf_file, "application/pdf")}
             data = {
                 "consolidateHeader": "1",
                 "consolidateCitations": "0",
@@ -51,7 +179,7 @@ class GrobidServer:
                 "teiCoordinates": "0",
             }
 
-            response = await client.post(grobid_endpoint, files=files, data=data)
+            response = await client.post(grobid_endpoint, files=files, data=data, timeout=120.0)
             response.raise_for_status()
 
             return response.text
@@ -65,17 +193,38 @@ class GrobidServer:
         Returns:
             List of section dicts with title and content
         """
-        root = ET.fromstring(tei_xml)
+        return self._extract_sections_from_root(self._parse_tei(tei_xml))
+
+    async def extract_tables(self, tei_xml: str) -> list[dict[str, Any]]:
+        """Extract tables from TEI-XML.
+
+        Args:
+            tei_xml: TEI-XML string from GROBID
+
+        Returns:
+            List of table dicts
+        """
+        return self._extract_tables_from_root(self._parse_tei(tei_xml))
+
+    def _parse_tei(self, tei_xml: str) -> ET.Element:
+        """Parse TEI-XML once (lxml if available, else xml.etree).
+
+        Encoded to bytes first since lxml rejects str input with an encoding declaration.
+        """
+        return xml_parser.fromstring(tei_xml.encode("utf-8"))
+
+    def _extract_sections_from_root(self, root: ET.Element) -> list[dict[str, Any]]:
+        """Extract sections from a parsed TEI root."""
         sections = []
 
         # Find body
-        body = root.find(".//tei:body", self.NS)
+        body = _first(_XP_BODY(root))
         if body is None:
             return sections
 
         # Extract divs (sections)
-        for div in body.findall(".//tei:div", self.NS):
-            head = div.find("tei:head", self.NS)
+        for div in _XP_DIVS(body):
+            head = _first(_XP_HEAD(div))
             title = head.text if head is not None and head.text else "Untitled"
 
             # Get section level from @n attribute or default to 1
@@ -84,12 +233,12 @@ class GrobidServer:
                 n_attr = head.get("n", "")
                 level = n_attr.count(".") + 1 if n_attr else 1
 
-            # Collect all text in section
-            content_parts = []
-            for p in div.findall("tei:p", self.NS):
-                text = self._get_element_text(p)
-                if text:
-                    content_parts.append(text)
+            # Collect all non-empty paragraph text in section
+            content_parts = [
+                text
+                for text in ["".join(p.itertext()).strip() for p in _XP_PS(div)]
+                if text
+            ]
 
             sections.append({
                 "title": title,
@@ -99,27 +248,19 @@ class GrobidServer:
 
         return sections
 
-    async def extract_tables(self, tei_xml: str) -> list[dict[str, Any]]:
-        """Extract tables from TEI-XML.
-
-        Args:
-            tei_xml: TEI-XML string from GROBID
-
-        Returns:
-            List of table dicts
-        """
-        root = ET.fromstring(tei_xml)
+    def _extract_tables_from_root(self, root: ET.Element) -> list[dict[str, Any]]:
+        """Extract tables from a parsed TEI root."""
         tables = []
 
-        for i, figure in enumerate(root.findall(".//tei:figure[@type='table']", self.NS)):
-            table_id = figure.get("{http://www.w3.org/XML/1998/namespace}id", f"table_{i}")
+        for i, figure in enumerate(_XP_TABLE_FIGS(root)):
+            table_id = figure.get(self._XML_ID, f"table_{i}")
 
             # Get caption
-            head = figure.find("tei:head", self.NS)
+            head = _first(_XP_HEAD(figure))
             caption = head.text if head is not None else None
 
             # Get table content
-            table_elem = figure.find("tei:table", self.NS)
+            table_elem = _first(_XP_TABLE(figure))
             content = self._table_to_text(table_elem) if table_elem is not None else ""
 
             tables.append({
@@ -130,52 +271,62 @@ class GrobidServer:
 
         return tables
 
-    async def parse_pdf_full(self, pdf_url: str, arxiv_id: str) -> ParsedPDF:
+    async def parse_pdf_full(
+        self,
+        pdf_url: str,
+        arxiv_id: str,
+        mode: Literal["full", "raw_only", "structured_only"] = "full",
+    ) -> ParsedPDF:
         """Parse a PDF and return structured data.
 
         Args:
             pdf_url: URL to the PDF file
             arxiv_id: arXiv ID for reference
+            mode: What to extract from the TEI. "raw_only" skips sections and
+                tables; "structured_only" skips raw text.
 
         Returns:
             ParsedPDF object
         """
         try:
             tei_xml = await self.parse_pdf_to_tei(pdf_url)
-            root = ET.fromstring(tei_xml)
+            root = self._parse_tei(tei_xml)
 
             # Extract title
-            title_elem = root.find(".//tei:titleStmt/tei:title", self.NS)
+            title_elem = _first(_XP_TITLE(root))
             title = (title_elem.text or "") if title_elem is not None else ""
 
             # Extract abstract
-            abstract_elem = root.find(".//tei:abstract", self.NS)
+            abstract_elem = _first(_XP_ABSTRACT(root))
             abstract = self._get_element_text(abstract_elem) if abstract_elem is not None else ""
 
-            # Extract sections
-            section_dicts = await self.extract_sections(tei_xml)
-            sections = [
-                Section(
-                    title=s["title"],
-                    level=s["level"],
-                    content=s["content"],
-                )
-                for s in section_dicts
-            ]
-
-            # Extract tables
-            table_dicts = await self.extract_tables(tei_xml)
-            tables = [
-                Table(
-                    table_id=t["table_id"],
-                    caption=t["caption"],
-                    content=t["content"],
-                )
-                for t in table_dicts
-            ]
+            sections = []
+            tables = []
+            if mode != "raw_only":
+                # Extract sections
+                section_dicts = self._extract_sections_from_root(root)
+                sections = [
+                    Section(
+                        title=s["title"],
+                        level=s["level"],
+                        content=s["content"],
+                    )
+                    for s in section_dicts
+                ]
+
+                # Extract tables
+                table_dicts = self._extract_tables_from_root(root)
+                tables = [
+                    Table(
+                        table_id=t["table_id"],
+                        caption=t["caption"],
+                        content=t["content"],
+                    )
+                    for t in table_dicts
+                ]
 
             # Get raw text
-            raw_text = self._extract_raw_text(root)
+            raw_text = self._extract_raw_text(root) if mode != "structured_only" else ""
 
             return ParsedPDF(
                 arxiv_id=arxiv_id,
@@ -196,6 +347,21 @@ class GrobidServer:
                 parse_errors=[str(e)],
             )
 
+    async def parse_pdf_raw_text(self, pdf_url: str, arxiv_id: str) -> ParsedPDF:
+        """Extract raw text only, bypassing GROBID.
+
+        Uses PyMuPDF directly, which is much faster than a GROBID round trip
+        when TEI structure (sections, tables) is not needed.
+
+        Args:
+            pdf_url: URL to the PDF file
+            arxiv_id: arXiv ID for reference
+
+        Returns:
+            ParsedPDF object with raw_text only
+        """
+        return await PyMuPDFParser(client=self._client).parse_pdf(pdf_url, arxiv_id)
+
     def _get_element_text(self, elem: ET.Element | None) -> str:
         """Extract all text from an element, including nested elements."""
         if elem is None:
@@ -204,20 +370,17 @@ class GrobidServer:
 
     def _table_to_text(self, table_elem: ET.Element) -> str:
         """Convert a TEI table to text representation."""
-        rows = []
-        for row in table_elem.findall("tei:row", self.NS):
-            cells = []
-            for cell in row.findall("tei:cell", self.NS):
-                cells.append(self._get_element_text(cell))
-            rows.append(" | ".join(cells))
-        return "\n".join(rows)
+        return "\n".join([
+            " | ".join(["".join(cell.itertext()).strip() for cell in _XP_CELLS(row)])
+            for row in _XP_ROWS(table_elem)
+        ])
 
     def _extract_raw_text(self, root: ET.Element) -> str:
-        """Extract raw text from the entire document."""
-        body = root.find(".//tei:body", self.NS)
+        """Extract raw text from the entire document (single itertext pass over body)."""
+        body = _first(_XP_BODY(root))
         if body is None:
             return ""
-        return self._get_element_text(body)
+        return "".join(body.itertext()).strip()
 
 
 async def check_grobid_health() -> bool:
@@ -1,10 +1,14 @@
 """Hugging Face Papers MCP Server implementation."""
 
+import asyncio
+import heapq
 from datetime import datetime, timedelta
 from typing import Any
 
 import httpx
+import orjson
 
+from rtc.mcp.servers.common import get_shared_httpx_client, parse_iso
 from rtc.schemas import PaperCandidate
 
 
@@ -15,10 +19,19 @@ class HFPapersServer:
     """
 
     BASE_URL = "https://huggingface.co/api/daily_papers"
+    # Maximum number of concurrent date requests
+    MAX_CONCURRENCY = 5
 
-    def __init__(self):
-        """Initialize HF Papers server."""
-        self._client = httpx.AsyncClient(timeout=30.0)
+    # Per-request timeout (seconds)
+    TIMEOUT = 30.0
+
+    def __init__(self, client: httpx.AsyncClient | None = None):
+        """Initialize HF Papers server.
+
+        Args:
+            client: HTTP client to use. Defaults to the shared client.
+        """
+        self._client = client
 
     async def _fetch_papers(self, date: str | None = None) -> list[dict[str, Any]]:
         """Fetch papers from Hugging Face API.
@@ -34,10 +47,11 @@ class HFPapersServer:
         if date:
             url = f"{url}?date={date}"
 
-        response = await self._client.get(url)
+        client = self._client or get_shared_httpx_client()
+        response = await client.get(url, timeout=self.TIMEOUT)
         response.raise_for_status()
 
-        papers = response.json()
+        papers = orjson.loads(response.content)
         return [self._normalize_paper(p) for p in papers]
 
     def _normalize_paper(self, paper: dict[str, Any]) -> dict[str, Any]:
@@ -108,12 +122,16 @@ class HFPapersServer:
         self,
         days_back: int = 7,
         min_votes: int = 0,
+        top_k: int | None = None,
     ) -> list[dict[str, Any]]:
         """Search recent papers with optional vote filter.
 
+        Papers featured on several days are returned once (newest occurrence).
+
         Args:
             days_back: Number of days to search back (default: 7).
             min_votes: Minimum number of upvotes to filter by (default: 0).
+            top_k: Return only the top-K papers by votes (default: all).
 
         Returns:
             List of paper metadata dicts, sorted by votes descending.
@@ -123,24 +141,40 @@ class HFPapersServer:
         if not base_date:
             return []
 
-        all_papers = []
-
-        for i in range(days_back):
-            date = (base_date - timedelta(days=i)).strftime("%Y-%m-%d")
-            try:
-                papers = await self._fetch_papers(date=date)
-                all_papers.extend(papers)
-            except httpx.HTTPError:
-                # Skip days with no data
-                continue
+        dates = [
+            (base_date - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days_back)
+        ]
+        sem = asyncio.Semaphore(self.MAX_CONCURRENCY)
+
+        async def fetch_one(date: str) -> list[dict[str, Any]]:
+            async with sem:
+                try:
+                    return await self._fetch_papers(date=date)
+                except httpx.HTTPError:
+                    # Skip days with no data
+                    return []
+
+        results = await asyncio.gather(*(fetch_one(d) for d in dates))
+        # Dedupe by arxiv_id; results are newest-date first, so keep the first occurrence
+        unique: dict[str, dict[str, Any]] = {}
+        for papers in results:
+            for paper in papers:
+                arxiv_id = paper.get("arxiv_id")
+                if arxiv_id and arxiv_id not in unique:
+                    unique[arxiv_id] = paper
+        all_papers = list(unique.values())
 
         # Filter by minimum votes
         if min_votes > 0:
             all_papers = [p for p in all_papers if p.get("votes", 0) >= min_votes]
 
         # Sort by votes descending
-        all_papers.sort(key=lambda p: p.get("votes", 0), reverse=True)
+        def get_votes(p: dict[str, Any]) -> int:
+            return p.get("votes", 0)
 
+        if top_k is not None and top_k < len(all_papers):
+            return heapq.nlargest(top_k, all_papers, key=get_votes)
+        all_papers.sort(key=get_votes, reverse=True)
         return all_papers
 
     async def _find_latest_date(self) -> datetime | None:
@@ -151,44 +185,57 @@ class HFPapersServer:
         Returns:
             datetime of latest available date, or None if not found.
         """
-        # 시스템 날짜부터 시작
-        check_date = datetime.now()
+        # 시스템 날짜부터 시작, MAX_CONCURRENCY일씩 동시에 확인
+        today = datetime.now()
 
-        for _ in range(30):
-            date_str = check_date.strftime("%Y-%m-%d")
+        async def has_papers(check_date: datetime) -> bool:
             try:
-                papers = await self._fetch_papers(date=date_str)
-                if papers:
-                    return check_date
+                return bool(await self._fetch_papers(date=check_date.strftime("%Y-%m-%d")))
             except httpx.HTTPError:
-                pass
-            check_date -= timedelta(days=1)
+                return False
+
+        for offset in range(0, 30, self.MAX_CONCURRENCY):
+            batch = [
+                today - timedelta(days=i)
+                for i in range(offset, min(offset + self.MAX_CONCURRENCY, 30))
+            ]
+            found = await asyncio.gather(*(has_papers(d) for d in batch))
+            for check_date, ok in zip(batch, found):
+                if ok:
+                    return check_date
 
         return None
 
     async def close(self):
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Release server resources.
+
+        The HTTP client is shared (or owned by the caller), so it is left open
+        for reuse; see ``close_shared_httpx_client()``.
+        """
 
 
-def paper_dict_to_candidate(data: dict[str, Any]) -> PaperCandidate:
+def paper_dict_to_candidate(
+    data: dict[str, Any], now: datetime | None = None
+) -> PaperCandidate:
     """Convert a HF paper dict to PaperCandidate.
 
     Args:
         data: Paper data dict from HFPapersServer.
+        now: Fallback published date when missing/invalid. Defaults to now.
 
     Returns:
         PaperCandidate instance.
     """
     # Parse published date
     published_str = data.get("published", "")
+    published = None
     if published_str:
         try:
-            published = datetime.fromisoformat(published_str.replace("Z", "+00:00"))
+            published = parse_iso(published_str)
         except ValueError:
-            published = datetime.now()
-    else:
-        published = datetime.now()
+            pass
+    if published is None:
+        published = now or datetime.now()
 
     return PaperCandidate(
         arxiv_id=data["arxiv_id"],
@@ -204,3 +251,17 @@ def paper_dict_to_candidate(data: dict[str, Any]) -> PaperCandidate:
         github_url=data.get("github_url"),
         github_stars=data.get("github_stars"),
     )
+
+
+def paper_dicts_to_candidates(dicts: list[dict[str, Any]]) -> list[PaperCandidate]:
+    """Convert HF paper dicts to PaperCandidates, sharing one fallback timestamp.
+
+    Args:
+        dicts: Paper data dicts from HFPapersServer.
+
+    Returns:
+        PaperCandidate list in input order.
+    """
+    now = datetime.now()
+    convert = paper_dict_to_candidate
+    return [convert(data, now) for data in dicts]
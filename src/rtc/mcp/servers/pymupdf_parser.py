@@ -1,14 +1,32 @@
 """PyMuPDF-based PDF text extraction as fallback for GROBID."""
 
+import asyncio
+
 import httpx
-import fitz  # PyMuPDF
 
+from rtc.mcp.servers.common import download_to_tempfile, get_shared_httpx_client
 from rtc.schemas import ParsedPDF
 
 
+def _extract_text(path: str) -> list[str]:
+    """Extract the text of every page (PyMuPDF does not support multithreading)."""
+    import fitz  # PyMuPDF; deferred so importing the package stays cheap
+
+    with fitz.open(path, filetype="pdf") as doc:
+        return [page.get_text() for page in doc]
+
+
 class PyMuPDFParser:
     """Fallback PDF parser using PyMuPDF for text extraction."""
 
+    def __init__(self, client: httpx.AsyncClient | None = None):
+        """Initialize parser.
+
+        Args:
+            client: HTTP client for PDF downloads. Defaults to the shared client.
+        """
+        self._client = client
+
     async def parse_pdf(self, pdf_url: str, arxiv_id: str) -> ParsedPDF:
         """Parse a PDF using PyMuPDF for basic text extraction.
 
@@ -22,20 +40,11 @@ class PyMuPDFParser:
         Returns:
             ParsedPDF with raw_text populated
         """
-        # Download PDF
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.get(pdf_url, follow_redirects=True)
-            response.raise_for_status()
-            pdf_bytes = response.content
-
-        # Extract text with PyMuPDF
-        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-        text_parts = []
-
-        for page in doc:
-            text_parts.append(page.get_text())
-
-        doc.close()
+        # Download PDF (streamed to a temp file) and extract text with PyMuPDF
+        client = self._client or get_shared_httpx_client()
+        async with download_to_tempfile(client, pdf_url) as pdf_file:
+            # One worker thread keeps the event loop free; PyMuPDF is not thread-safe
+            text_parts = await asyncio.to_thread(_extract_text, pdf_file.name)
 
         raw_text = "\n".join(text_parts)
 
@@ -1,11 +1,13 @@
 """Pipeline execution module."""
 
 from rtc.pipeline.code import run_code_pipeline
-from rtc.pipeline.deep import run_deep_pipeline
-from rtc.pipeline.skim import run_skim_pipeline
+from rtc.pipeline.deep import astream_deep_pipeline, run_deep_pipeline
+from rtc.pipeline.skim import astream_skim_pipeline, run_skim_pipeline
 
 __all__ = [
     "run_skim_pipeline",
     "run_deep_pipeline",
     "run_code_pipeline",
+    "astream_skim_pipeline",
+    "astream_deep_pipeline",
 ]
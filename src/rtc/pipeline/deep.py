@@ -1,16 +1,33 @@
 """Deep Pipeline - 논문 심층 분석 파이프라인."""
 
+import asyncio
+import functools
+import gzip
+import hashlib
+import os
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Annotated, Optional, TypedDict
+from pathlib import Path
+from typing import Annotated, Any, Optional
 
+import orjson
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import END, StateGraph
 from langsmith.run_helpers import traceable
 
+from rtc.agents.correction_agent import (
+    FULL_TEXT_MAX_CHARS as CORRECTION_FULL_TEXT_MAX_CHARS,
+)
 from rtc.agents.correction_agent import CorrectionAgent, CorrectionInput
 from rtc.agents.delta_agent import DeltaAgent
+from rtc.agents.extraction import FULL_TEXT_MAX_CHARS as EXTRACTION_FULL_TEXT_MAX_CHARS
 from rtc.agents.extraction import ExtractionAgent, ExtractionInput
 from rtc.agents.report_writer import ReportInput, ReportWriter
 from rtc.agents.scoring_agent import ScoringAgent, ScoringInput
+from rtc.agents.verification_agent import (
+    FULL_TEXT_MAX_CHARS as VERIFICATION_FULL_TEXT_MAX_CHARS,
+)
 from rtc.agents.verification_agent import VerificationAgent, VerificationInput
 from rtc.config import get_settings
 from rtc.mcp.servers.grobid_server import GrobidServer
@@ -23,80 +40,221 @@ from rtc.schemas.skim import SkimSummary
 from rtc.schemas.verification_v1 import VerificationOutput
 from rtc.storage.deep_store import DeepStore, create_paper_slug
 
+# 설정은 불변(frozen)이므로 모듈 로드 시 한 번만 조회
+_SETTINGS = get_settings()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_extraction_agent() -> ExtractionAgent:
+    return ExtractionAgent()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_delta_agent() -> DeltaAgent:
+    return DeltaAgent()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_scoring_agent() -> ScoringAgent:
+    return ScoringAgent()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_verification_agent() -> VerificationAgent:
+    return VerificationAgent()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_correction_agent() -> CorrectionAgent:
+    return CorrectionAgent()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_report_writer() -> ReportWriter:
+    return ReportWriter()
+
+
+@functools.lru_cache(maxsize=4)
+def _get_grobid_server(grobid_url: str) -> GrobidServer:
+    return GrobidServer(grobid_url)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_pymupdf_parser() -> PyMuPDFParser:
+    return PyMuPDFParser()
+
+
+@functools.lru_cache(maxsize=4)
+def _get_deep_store(base_dir: Path, reports_dir: Path) -> DeepStore:
+    return DeepStore(base_dir, reports_dir=reports_dir)
+
 
 def merge_errors(left: list[dict], right: list[dict]) -> list[dict]:
-    """에러 리스트 병합."""
+    """에러 리스트 병합 (스트리밍된 상태 스냅샷이 공유하지 않도록 새 리스트 반환)."""
     return left + right
 
 
-class DeepState(TypedDict, total=False):
-    """Deep Pipeline 상태."""
+@dataclass(slots=True, frozen=True)
+class DeepState:
+    """Deep Pipeline 상태.
+
+    노드는 상태를 읽기만 하고 변경분 dict를 반환한다 (LangGraph가 병합).
+    """
 
     # 입력
-    arxiv_id: str
-    title: str
-    abstract: str
-    pdf_url: str
-    run_date: str
-    skim_summary: Optional[SkimSummary]
+    arxiv_id: str = ""
+    title: str = ""
+    abstract: str = ""
+    pdf_url: str = ""
+    run_date: str = ""
+    skim_summary: Optional[SkimSummary] = None
 
     # 중간 상태
-    parsed_pdf: Optional[ParsedPDF]
-    parse_mode: str  # "full", "pymupdf", "lite"
-    extraction: Optional[ExtractionOutput]
-    delta: Optional[DeltaOutput]
-    scoring: Optional[ScoringOutput]
-    verification: Optional[VerificationOutput]
+    parsed_pdf: Optional[ParsedPDF] = None
+    parse_mode: str = ""  # "full", "pymupdf", "lite"
+    extraction: Optional[ExtractionOutput] = None
+    delta: Optional[DeltaOutput] = None
+    scoring: Optional[ScoringOutput] = None
+    verification: Optional[VerificationOutput] = None
+    verification_skipped: bool = False  # 입력이 빈약해 LLM 검증을 생략했는지
 
     # 재시도 관련
-    retry_count: int  # 재시도 횟수 (기본값: 0)
-    max_retries: int  # 최대 재시도 횟수 (기본값: 2)
+    retry_count: int = 0  # 재시도 횟수
+    max_retries: int = 2  # 최대 재시도 횟수
+    correction_applied: bool = False  # 마지막 교정이 extraction/delta를 갱신했는지
 
     # 출력
-    report_md: Optional[str]
-    paper_slug: str
+    report_md: Optional[str] = None
+    paper_slug: str = ""
 
     # 에러
-    errors: Annotated[list[dict], merge_errors]
+    errors: Annotated[list[dict], merge_errors] = field(default_factory=list)
+
+
+async def _settle(task: "asyncio.Task[ParsedPDF]") -> "asyncio.Task[ParsedPDF]":
+    """태스크 완료까지 대기 (예외는 전파하지 않음)."""
+    await asyncio.wait({task})
+    return task
+
+
+def _task_result(
+    task: "asyncio.Task[ParsedPDF]", parser_name: str, errors: list[dict]
+) -> Optional[ParsedPDF]:
+    """완료된 파싱 태스크의 성공 결과 반환 (실패 시 errors에 기록하고 None)."""
+    if task.cancelled():
+        return None
+    exc = task.exception()
+    if exc is not None:
+        errors.append({"node": "parse", "error": f"{parser_name}: {str(exc)}"})
+        return None
+    parsed_pdf = task.result()
+    if parsed_pdf and parsed_pdf.parse_success:
+        return parsed_pdf
+    if parsed_pdf and parsed_pdf.parse_errors:
+        detail = "; ".join(parsed_pdf.parse_errors)
+        errors.append({"node": "parse", "error": f"{parser_name}: {detail}"})
+    return None
+
+
+def _parsed_cache_path(arxiv_id: str, pdf_url: str) -> Path:
+    """파싱 결과 캐시 파일 경로 (arxiv_id + pdf_url 기준)."""
+    key = hashlib.sha256(f"{arxiv_id}:{pdf_url}".encode("utf-8")).hexdigest()[:16]
+    return _SETTINGS.base_dir / "cache" / "parsed" / f"{key}.json.gz"
+
+
+def _load_parsed_cache(path: Path) -> Optional[ParsedPDF]:
+    """캐시된 파싱 결과 로드 (없거나 손상되었으면 None)."""
+    try:
+        data = gzip.decompress(path.read_bytes())
+        return ParsedPDF.model_validate_json(data)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_parsed_cache(path: Path, parsed_pdf: ParsedPDF) -> None:
+    """파싱 결과를 캐시에 원자적으로 저장 (임시 파일 + os.replace)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    data = orjson.dumps(parsed_pdf.model_dump(mode="json"))
+    tmp_path.write_bytes(gzip.compress(data))
+    os.replace(tmp_path, path)
+
+
+async def _write_parsed_cache(path: Path, parsed_pdf: ParsedPDF, errors: list[dict]) -> None:
+    """GROBID 파싱 결과 캐시 저장 (실패해도 파싱 결과는 그대로 사용)."""
+    try:
+        await asyncio.to_thread(_save_parsed_cache, path, parsed_pdf)
+    except OSError as e:
+        errors.append({"node": "parse", "error": f"parsed cache: {str(e)}"})
+
+
+def _resolve_pdf_url(arxiv_id: str, pdf_url: Optional[str]) -> str:
+    """파싱할 PDF URL (없으면 arXiv 기본 URL). GROBID 캐시 키와 같아야 한다."""
+    return pdf_url or f"https://arxiv.org/pdf/{arxiv_id}.pdf"
 
 
 async def parse_node(state: DeepState) -> dict:
     """PDF 파싱 노드."""
-    arxiv_id = state.get("arxiv_id", "")
-    pdf_url = state.get("pdf_url", "")
+    arxiv_id = state.arxiv_id
+    pdf_url = _resolve_pdf_url(arxiv_id, state.pdf_url)
 
-    if not pdf_url:
-        pdf_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
-
-    settings = get_settings()
+    settings = _SETTINGS
     errors = []
 
-    # 1. GROBID 시도
-    try:
-        grobid = GrobidServer(settings.grobid_url)
-        parsed_pdf = await grobid.parse_pdf_full(pdf_url, arxiv_id)
+    # 0. 이전 실행의 GROBID 파싱 결과가 있으면 재사용 (재실행 시 다운로드/파싱 생략)
+    cache_path = _parsed_cache_path(arxiv_id, pdf_url)
+    cached = await asyncio.to_thread(_load_parsed_cache, cache_path)
+    if cached is not None:
+        return {
+            "parsed_pdf": cached,
+            "parse_mode": "full",
+            "errors": errors,
+        }
 
-        if parsed_pdf and parsed_pdf.parse_success:
-            return {
-                "parsed_pdf": parsed_pdf,
-                "parse_mode": "full",
-            }
-    except Exception as e:
-        errors.append({"node": "parse", "error": f"GROBID: {str(e)}"})
+    # GROBID를 먼저 시작하고, soft deadline 안에 성공하지 못했을 때만 PyMuPDF를 시작
+    # (GROBID가 제때 성공하면 PDF를 두 번 받거나 추출하지 않음)
+    grobid = _get_grobid_server(settings.grobid_url)
+    grobid_task = asyncio.create_task(grobid.parse_pdf_full(pdf_url, arxiv_id))
+    pymupdf_task: Optional["asyncio.Task[ParsedPDF]"] = None
 
-    # 2. PyMuPDF 폴백
     try:
-        parser = PyMuPDFParser()
-        parsed_pdf = await parser.parse_pdf(pdf_url, arxiv_id)
-
-        if parsed_pdf and parsed_pdf.parse_success:
+        # 1. GROBID (soft deadline)
+        await asyncio.wait({grobid_task}, timeout=settings.grobid_soft_deadline)
+        if grobid_task.done():
+            parsed_pdf = _task_result(grobid_task, "GROBID", errors)
+            if parsed_pdf is not None:
+                await _write_parsed_cache(cache_path, parsed_pdf, errors)
+                return {
+                    "parsed_pdf": parsed_pdf,
+                    "parse_mode": "full",
+                    "errors": errors,
+                }
+
+        # 2. PyMuPDF 폴백
+        pymupdf_task = asyncio.create_task(_get_pymupdf_parser().parse_pdf(pdf_url, arxiv_id))
+        parsed_pdf = _task_result(await _settle(pymupdf_task), "PyMuPDF", errors)
+        if parsed_pdf is not None:
             return {
                 "parsed_pdf": parsed_pdf,
                 "parse_mode": "pymupdf",
                 "errors": errors,
             }
-    except Exception as e:
-        errors.append({"node": "parse", "error": f"PyMuPDF: {str(e)}"})
+
+        # PyMuPDF도 실패했으면 deadline을 넘긴 GROBID를 끝까지 기다림
+        if not grobid_task.done():
+            parsed_pdf = _task_result(await _settle(grobid_task), "GROBID", errors)
+            if parsed_pdf is not None:
+                await _write_parsed_cache(cache_path, parsed_pdf, errors)
+                return {
+                    "parsed_pdf": parsed_pdf,
+                    "parse_mode": "full",
+                    "errors": errors,
+                }
+    finally:
+        # 사용하지 않은 파서 취소 (GROBID TEI 요청 자체는 공유 태스크라 캐시를 계속 채움)
+        grobid_task.cancel()
+        if pymupdf_task is not None:
+            pymupdf_task.cancel()
 
     # 3. Lite 모드 (초록만)
     return {
@@ -108,18 +266,18 @@ async def parse_node(state: DeepState) -> dict:
 
 async def extraction_node(state: DeepState) -> dict:
     """Extraction 노드."""
-    arxiv_id = state.get("arxiv_id", "")
-    title = state.get("title", "")
-    abstract = state.get("abstract", "")
-    parsed_pdf = state.get("parsed_pdf")
-    skim_summary = state.get("skim_summary")
+    arxiv_id = state.arxiv_id
+    title = state.title
+    abstract = state.abstract
+    parsed_pdf = state.parsed_pdf
+    skim_summary = state.skim_summary
 
-    # 풀텍스트 준비
+    # 풀텍스트 준비 (에이전트가 사용하는 길이만큼만)
     full_text = None
     if parsed_pdf and parsed_pdf.parse_success:
-        full_text = parsed_pdf.get_full_text()
+        full_text = parsed_pdf.get_text_prefix(EXTRACTION_FULL_TEXT_MAX_CHARS)
 
-    agent = ExtractionAgent()
+    agent = _get_extraction_agent()
 
     try:
         extraction = await agent.run(
@@ -143,7 +301,7 @@ async def extraction_node(state: DeepState) -> dict:
 
 async def delta_node(state: DeepState) -> dict:
     """Delta 노드."""
-    extraction = state.get("extraction")
+    extraction = state.extraction
 
     if extraction is None:
         return {
@@ -151,7 +309,7 @@ async def delta_node(state: DeepState) -> dict:
             "errors": [{"node": "delta", "error": "No extraction result"}],
         }
 
-    agent = DeltaAgent()
+    agent = _get_delta_agent()
 
     try:
         delta = await agent.run(extraction)
@@ -166,8 +324,8 @@ async def delta_node(state: DeepState) -> dict:
 
 async def scoring_node(state: DeepState) -> dict:
     """Scoring 노드."""
-    extraction = state.get("extraction")
-    delta = state.get("delta")
+    extraction = state.extraction
+    delta = state.delta
 
     if extraction is None or delta is None:
         return {
@@ -175,7 +333,7 @@ async def scoring_node(state: DeepState) -> dict:
             "errors": [{"node": "scoring", "error": "Missing extraction or delta"}],
         }
 
-    agent = ScoringAgent()
+    agent = _get_scoring_agent()
 
     try:
         scoring = await agent.run(ScoringInput(extraction=extraction, delta=delta))
@@ -188,14 +346,27 @@ async def scoring_node(state: DeepState) -> dict:
         }
 
 
+def _trivial_verification_reason(
+    extraction: ExtractionOutput, delta: DeltaOutput, parsed_pdf: Optional[ParsedPDF]
+) -> Optional[str]:
+    """LLM 검증이 의미 없는 (결과가 "low"로 정해진) 입력이면 그 사유를 반환."""
+    if not extraction.method_components:
+        return "method_components 없음"
+    if not delta.core_deltas:
+        return "core_deltas 없음"
+    if parsed_pdf is None or not parsed_pdf.parse_success:
+        return "PDF 파싱 실패"
+    return None
+
+
 async def verification_node(state: DeepState) -> dict:
     """검증 노드."""
-    extraction = state.get("extraction")
-    delta = state.get("delta")
-    parsed_pdf = state.get("parsed_pdf")
-    arxiv_id = state.get("arxiv_id", "")
-    title = state.get("title", "")
-    abstract = state.get("abstract", "")
+    extraction = state.extraction
+    delta = state.delta
+    parsed_pdf = state.parsed_pdf
+    arxiv_id = state.arxiv_id
+    title = state.title
+    abstract = state.abstract
 
     if extraction is None or delta is None:
         return {
@@ -203,12 +374,26 @@ async def verification_node(state: DeepState) -> dict:
             "errors": [{"node": "verification", "error": "Missing extraction or delta"}],
         }
 
-    # Full text 추출
+    # 빈약한 입력은 LLM 호출 없이 "low"로 확정 (교정해도 개선될 근거가 없음)
+    reason = _trivial_verification_reason(extraction, delta, parsed_pdf)
+    if reason is not None:
+        return {
+            "verification": VerificationOutput(
+                arxiv_id=arxiv_id,
+                overall_reliability="low",
+                results=[],
+                summary=f"검증 생략: {reason}",
+                corrections_needed=[],
+            ),
+            "verification_skipped": True,
+        }
+
+    # Full text 추출 (+1자: 에이전트가 잘림 여부를 판단할 수 있도록)
     full_text = None
     if parsed_pdf and parsed_pdf.parse_success:
-        full_text = parsed_pdf.get_full_text()
+        full_text = parsed_pdf.get_text_prefix(VERIFICATION_FULL_TEXT_MAX_CHARS + 1)
 
-    agent = VerificationAgent()
+    agent = _get_verification_agent()
 
     try:
         verification = await agent.run(
@@ -222,7 +407,7 @@ async def verification_node(state: DeepState) -> dict:
             )
         )
 
-        return {"verification": verification}
+        return {"verification": verification, "verification_skipped": False}
 
     except Exception as e:
         return {
@@ -233,27 +418,28 @@ async def verification_node(state: DeepState) -> dict:
 
 async def correction_node(state: DeepState) -> dict:
     """교정 노드 - 검증 실패 항목 수정."""
-    verification = state.get("verification")
-    extraction = state.get("extraction")
-    delta = state.get("delta")
-    parsed_pdf = state.get("parsed_pdf")
-    arxiv_id = state.get("arxiv_id", "")
-    title = state.get("title", "")
-    abstract = state.get("abstract", "")
-    retry_count = state.get("retry_count", 0)
+    verification = state.verification
+    extraction = state.extraction
+    delta = state.delta
+    parsed_pdf = state.parsed_pdf
+    arxiv_id = state.arxiv_id
+    title = state.title
+    abstract = state.abstract
+    retry_count = state.retry_count
 
     if verification is None or extraction is None or delta is None:
         return {
             "errors": [{"node": "correction", "error": "Missing required data"}],
             "retry_count": retry_count + 1,
+            "correction_applied": False,
         }
 
-    # Full text 추출
+    # Full text 추출 (+1자: 에이전트가 잘림 여부를 판단할 수 있도록)
     full_text = None
     if parsed_pdf and parsed_pdf.parse_success:
-        full_text = parsed_pdf.get_full_text()
+        full_text = parsed_pdf.get_text_prefix(CORRECTION_FULL_TEXT_MAX_CHARS + 1)
 
-    agent = CorrectionAgent()
+    agent = _get_correction_agent()
 
     try:
         corrected = await agent.run(
@@ -272,24 +458,44 @@ async def correction_node(state: DeepState) -> dict:
             "extraction": corrected.extraction,
             "delta": corrected.delta,
             "retry_count": retry_count + 1,
+            "correction_applied": True,
         }
 
     except Exception as e:
         return {
             "errors": [{"node": "correction", "error": str(e)}],
             "retry_count": retry_count + 1,
+            "correction_applied": False,
         }
 
 
+async def join_verify_node(state: DeepState) -> dict:
+    """scoring/verification 병렬 분기 합류 노드 (상태 변경 없음)."""
+    return {}
+
+
+async def post_verify_node(state: DeepState) -> dict:
+    """검증 종료 후 더 이상 필요 없는 파싱 결과를 상태에서 제거.
+
+    report 이후 단계는 parsed_pdf(전문 텍스트 포함)를 사용하지 않으므로
+    상태 크기를 줄인다.
+    """
+    return {"parsed_pdf": None}
+
+
 def should_retry_or_proceed(state: DeepState) -> str:
     """검증 결과에 따라 분기."""
-    verification = state.get("verification")
-    retry_count = state.get("retry_count", 0)
-    max_retries = state.get("max_retries", 2)
+    verification = state.verification
+    retry_count = state.retry_count
+    max_retries = state.max_retries
 
     if verification is None:
         return "report"
 
+    # 검증 생략 (빈약한 입력) → 교정할 항목이 없으므로 바로 진행
+    if state.verification_skipped:
+        return "report"
+
     # 신뢰도 높음 → 통과
     if verification.overall_reliability == "high":
         return "report"
@@ -302,13 +508,24 @@ def should_retry_or_proceed(state: DeepState) -> str:
     return "report"
 
 
+def route_after_correction(state: DeepState) -> str | list[str]:
+    """교정 후 분기.
+
+    교정 결과(extraction/delta)가 이미 있으므로 extraction/delta를 재실행하지 않고
+    scoring과 verification만 다시 실행한다. 교정이 실패했으면 재시도/진행 판단으로.
+    """
+    if state.correction_applied:
+        return ["scoring", "verification"]
+    return should_retry_or_proceed(state)
+
+
 async def report_node(state: DeepState) -> dict:
     """Report 생성 노드."""
-    extraction = state.get("extraction")
-    delta = state.get("delta")
-    scoring = state.get("scoring")
-    skim_summary = state.get("skim_summary")
-    run_date = state.get("run_date", datetime.now().strftime("%Y-%m-%d"))
+    extraction = state.extraction
+    delta = state.delta
+    scoring = state.scoring
+    skim_summary = state.skim_summary
+    run_date = state.run_date  # 엔트리포인트에서 한 번만 결정
 
     if extraction is None or delta is None or scoring is None:
         return {
@@ -316,7 +533,7 @@ async def report_node(state: DeepState) -> dict:
             "errors": [{"node": "report", "error": "Missing required data"}],
         }
 
-    agent = ReportWriter()
+    agent = _get_report_writer()
 
     try:
         report_md = await agent.run(
@@ -346,40 +563,33 @@ async def report_node(state: DeepState) -> dict:
 
 async def save_deep_node(state: DeepState) -> dict:
     """Deep 결과 저장 노드."""
-    extraction = state.get("extraction")
-    delta = state.get("delta")
-    scoring = state.get("scoring")
-    verification = state.get("verification")
-    report_md = state.get("report_md")
-    paper_slug = state.get("paper_slug", "")
+    extraction = state.extraction
+    delta = state.delta
+    scoring = state.scoring
+    verification = state.verification
+    report_md = state.report_md
+    paper_slug = state.paper_slug
 
     if not paper_slug or not extraction:
         return {"errors": [{"node": "save_deep", "error": "Missing paper_slug or extraction"}]}
 
-    settings = get_settings()
-    store = DeepStore(settings.base_dir, reports_dir=settings.reports_dir)
+    settings = _SETTINGS
+    store = _get_deep_store(settings.base_dir, settings.reports_dir)
 
+    # 모든 아티팩트를 워커 스레드에서 한 번에 저장 (이벤트 루프 블로킹 방지)
     try:
-        # 각 아티팩트 저장
-        if extraction:
-            store.save_extraction(paper_slug, extraction)
-
-        if delta:
-            store.save_delta(paper_slug, delta)
-
-        if scoring:
-            store.save_scoring(paper_slug, scoring)
-
-        if verification:
-            store.save_verification(paper_slug, verification)
-
-        if report_md:
-            store.save_report(paper_slug, report_md)
-
-        return {}
-
+        await asyncio.to_thread(
+            store.save_all,
+            paper_slug,
+            extraction,
+            delta=delta,
+            scoring=scoring,
+            verification=verification,
+            report_md=report_md,
+        )
     except Exception as e:
         return {"errors": [{"node": "save_deep", "error": str(e)}]}
+    return {}
 
 
 def should_continue_after_parse(state: DeepState) -> str:
@@ -392,21 +602,22 @@ def build_deep_pipeline() -> StateGraph:
     """Deep Pipeline 빌드.
 
     파이프라인 구조:
-    parse → extraction → delta → scoring → verification → [조건 분기]
-                                                              │
+    parse → extraction → delta ─┬→ scoring ──────┬→ join_verify → [조건 분기]
+                                └→ verification ─┘            │
                                         ┌─────────────────────┼─────────────────────┐
                                         │                     │                     │
                                   [통과: high]          [재시도 필요]         [최대 재시도 초과]
                                         │              (medium/low)                 │
                                         ▼                     │                     │
+                                  post_verify                 │                     │
+                                (parsed_pdf 해제)             │                     │
+                                        ▼                     │                     │
                                      report                   ▼                     │
                                         │              correction                   │
                                         │                     │                     │
                                         │                     ▼                     │
-                                        │            extraction (재실행)            │
-                                        │                     ↓                     │
-                                        │               (delta → scoring →         │
-                                        │                verification 반복)         │
+                                        │      scoring ∥ verification (재실행)      │
+                                        │       (교정된 extraction/delta 사용)      │
                                         │                                           │
                                         ▼                                           │
                                    save_deep ←──────────────────────────────────────┘
@@ -424,7 +635,9 @@ def build_deep_pipeline() -> StateGraph:
     graph.add_node("delta", delta_node)
     graph.add_node("scoring", scoring_node)
     graph.add_node("verification", verification_node)
+    graph.add_node("join_verify", join_verify_node)
     graph.add_node("correction", correction_node)
+    graph.add_node("post_verify", post_verify_node)
     graph.add_node("report", report_node)
     graph.add_node("save_deep", save_deep_node)
 
@@ -434,41 +647,56 @@ def build_deep_pipeline() -> StateGraph:
     # 기본 엣지
     graph.add_edge("parse", "extraction")
     graph.add_edge("extraction", "delta")
+
+    # scoring과 verification은 서로 의존하지 않으므로 병렬 실행 후 합류
     graph.add_edge("delta", "scoring")
-    graph.add_edge("scoring", "verification")
+    graph.add_edge("delta", "verification")
+    graph.add_edge(["scoring", "verification"], "join_verify")
 
-    # 조건 분기: verification 후
+    # 조건 분기: 두 분기 합류 후
     graph.add_conditional_edges(
-        "verification",
+        "join_verify",
         should_retry_or_proceed,
         {
-            "report": "report",
+            "report": "post_verify",
             "correction": "correction",
         }
     )
 
-    # 교정 후 → 다시 extraction부터 (수정된 컨텍스트로)
-    graph.add_edge("correction", "extraction")
+    # 교정 후 → 교정된 extraction/delta로 scoring/verification만 재실행
+    graph.add_conditional_edges(
+        "correction",
+        route_after_correction,
+        {
+            "scoring": "scoring",
+            "verification": "verification",
+            "report": "post_verify",
+            "correction": "correction",
+        },
+    )
 
     # 마무리
+    graph.add_edge("post_verify", "report")
     graph.add_edge("report", "save_deep")
     graph.add_edge("save_deep", END)
 
     return graph
 
 
-def create_deep_pipeline():
+def create_deep_pipeline(checkpointer: Optional[BaseCheckpointSaver] = None):
     """Deep Pipeline 컴파일.
 
+    Args:
+        checkpointer: 상태 체크포인터 (기본: 없음)
+
     Returns:
         컴파일된 LangGraph runnable
     """
     graph = build_deep_pipeline()
-    return graph.compile()
+    return graph.compile(checkpointer=checkpointer)
 
 
-@traceable(name="deep_pipeline", run_type="chain")
-async def run_deep_pipeline(
+async def astream_deep_pipeline(
     arxiv_id: str,
     title: str,
     abstract: str,
@@ -476,8 +704,10 @@ async def run_deep_pipeline(
     run_date: str | None = None,
     skim_summary: SkimSummary | None = None,
     max_retries: int = 2,
-) -> DeepState:
-    """Deep Pipeline 실행.
+) -> AsyncIterator[dict[str, Any]]:
+    """Deep Pipeline 스트리밍 실행.
+
+    각 노드(슈퍼스텝) 실행 후의 상태를 순서대로 yield한다.
 
     Args:
         arxiv_id: arXiv ID
@@ -488,8 +718,8 @@ async def run_deep_pipeline(
         skim_summary: 스킴 결과 (있으면)
         max_retries: 최대 재시도 횟수 (기본값: 2)
 
-    Returns:
-        최종 상태
+    Yields:
+        단계별 상태 값 dict (마지막 값이 최종 상태)
     """
     if run_date is None:
         run_date = datetime.now().strftime("%Y-%m-%d")
@@ -499,26 +729,91 @@ async def run_deep_pipeline(
 
     pipeline = create_deep_pipeline()
 
-    initial_state: DeepState = {
-        "arxiv_id": arxiv_id,
-        "title": title,
-        "abstract": abstract,
-        "pdf_url": pdf_url,
-        "run_date": run_date,
-        "skim_summary": skim_summary,
-        "retry_count": 0,
-        "max_retries": max_retries,
-        "errors": [],
-    }
+    initial_state = DeepState(
+        arxiv_id=arxiv_id,
+        title=title,
+        abstract=abstract,
+        pdf_url=pdf_url,
+        run_date=run_date,
+        skim_summary=skim_summary,
+        max_retries=max_retries,
+    )
+
+    async for state in pipeline.astream(initial_state, stream_mode="values"):
+        yield state
+
+
+@traceable(name="deep_pipeline", run_type="chain")
+async def run_deep_pipeline(
+    arxiv_id: str,
+    title: str,
+    abstract: str,
+    pdf_url: str | None = None,
+    run_date: str | None = None,
+    skim_summary: SkimSummary | None = None,
+    max_retries: int = 2,
+) -> dict[str, Any]:
+    """Deep Pipeline 실행.
+
+    Args:
+        arxiv_id: arXiv ID
+        title: 논문 제목
+        abstract: 초록
+        pdf_url: PDF URL (없으면 자동 생성)
+        run_date: 실행 날짜 (YYYY-MM-DD)
+        skim_summary: 스킴 결과 (있으면)
+        max_retries: 최대 재시도 횟수 (기본값: 2)
 
-    result = await pipeline.ainvoke(initial_state)
+    Returns:
+        최종 상태 값 dict
+    """
+    result: dict[str, Any] = {}
+    async for state in astream_deep_pipeline(
+        arxiv_id=arxiv_id,
+        title=title,
+        abstract=abstract,
+        pdf_url=pdf_url,
+        run_date=run_date,
+        skim_summary=skim_summary,
+        max_retries=max_retries,
+    ):
+        result = state
     return result
 
 
+async def run_deep_pipeline_batch(
+    items: list[dict[str, Any]],
+    max_concurrency: int = 5,
+) -> list[dict[str, Any] | BaseException]:
+    """여러 논문에 대해 Deep Pipeline을 동시 실행 (동시 실행 수 제한).
+
+    Args:
+        items: run_deep_pipeline 키워드 인자 dict 목록
+        max_concurrency: 동시에 실행할 최대 파이프라인 수
+
+    Returns:
+        입력 순서대로의 최종 상태 (실패한 항목은 예외 객체)
+    """
+    # 대기 중인 논문의 GROBID 변환을 미리 시작 (parse_node와 같은 URL로 요청을 공유).
+    # 호출 측에서 이미 처리된 논문을 걸러낸 뒤 호출하므로 실제로 파싱할 논문만 대상
+    grobid = _get_grobid_server(_SETTINGS.grobid_url)
+    for item in items:
+        pdf_url = _resolve_pdf_url(item["arxiv_id"], item.get("pdf_url"))
+        if not _parsed_cache_path(item["arxiv_id"], pdf_url).exists():
+            grobid.prefetch(pdf_url)
+
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def run_one(kwargs: dict[str, Any]) -> dict[str, Any]:
+        async with sem:
+            return await run_deep_pipeline(**kwargs)
+
+    return await asyncio.gather(*(run_one(item) for item in items), return_exceptions=True)
+
+
 # CLI 지원
 if __name__ == "__main__":
     import argparse
-    import asyncio
 
     parser = argparse.ArgumentParser(description="Run Deep Pipeline")
     parser.add_argument("--arxiv-id", type=str, required=True, help="arXiv ID")
@@ -1,8 +1,13 @@
 """Skim Pipeline - 빠른 논문 스킴 파이프라인."""
 
+import functools
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Annotated, Optional, TypedDict
+from pathlib import Path
+from typing import Annotated, Any, Optional
 
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import END, StateGraph
 from langsmith.run_helpers import traceable
 
@@ -14,41 +19,68 @@ from rtc.schemas import PaperCandidate
 from rtc.schemas.skim import BatchSkimResult, DailySkimOutput, SkimSummary
 from rtc.storage.skim_store import SkimStore
 
+# 설정은 불변(frozen)이므로 모듈 로드 시 한 번만 조회
+_SETTINGS = get_settings()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_fetcher() -> CandidateFetcher:
+    return CandidateFetcher()
+
+
+@functools.lru_cache(maxsize=4)
+def _get_skim_agent(batch_size: int, max_concurrency: int) -> UltraSkimAgent:
+    return UltraSkimAgent(batch_size=batch_size, max_concurrency=max_concurrency)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_gatekeeper(interest_threshold: int, max_deep_papers: int) -> Gatekeeper:
+    return Gatekeeper(interest_threshold=interest_threshold, max_deep_papers=max_deep_papers)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_skim_store(base_dir: Path) -> SkimStore:
+    return SkimStore(base_dir)
+
 
 def merge_errors(left: list[dict], right: list[dict]) -> list[dict]:
-    """에러 리스트 병합."""
+    """에러 리스트 병합 (스트리밍된 상태 스냅샷이 공유하지 않도록 새 리스트 반환)."""
     return left + right
 
 
-class SkimState(TypedDict, total=False):
-    """Skim Pipeline 상태."""
+@dataclass(slots=True, frozen=True)
+class SkimState:
+    """Skim Pipeline 상태.
+
+    노드는 상태를 읽기만 하고 변경분 dict를 반환한다 (LangGraph가 병합).
+    """
 
     # 입력
-    run_date: str  # YYYY-MM-DD
+    run_date: str = ""  # YYYY-MM-DD
 
     # 중간 상태
-    candidates: list[PaperCandidate]
-    skim_result: Optional[BatchSkimResult]
+    candidates: list[PaperCandidate] = field(default_factory=list)
+    skim_result: Optional[BatchSkimResult] = None
 
     # 출력
-    deep_candidates: list[str]
-    all_papers: list[SkimSummary]
-    daily_output: Optional[DailySkimOutput]
+    deep_candidates: list[str] = field(default_factory=list)
+    all_papers: list[SkimSummary] = field(default_factory=list)
+    daily_output: Optional[DailySkimOutput] = None
 
     # 통계
-    total_collected: int
-    total_after_filter: int
-    total_skimmed: int
+    total_collected: int = 0
+    total_after_filter: int = 0
+    total_skimmed: int = 0
 
     # 에러
-    errors: Annotated[list[dict], merge_errors]
+    errors: Annotated[list[dict], merge_errors] = field(default_factory=list)
 
 
 async def fetch_node(state: SkimState) -> dict:
     """논문 수집 노드."""
-    run_date = state.get("run_date", datetime.now().strftime("%Y-%m-%d"))
+    run_date = state.run_date  # 엔트리포인트에서 한 번만 결정
 
-    fetcher = CandidateFetcher()
+    fetcher = _get_fetcher()
 
     try:
         result = await fetcher.run(FetchInput(run_date=run_date))
@@ -69,7 +101,7 @@ async def fetch_node(state: SkimState) -> dict:
 
 async def skim_node(state: SkimState) -> dict:
     """스킴 노드."""
-    candidates = state.get("candidates", [])
+    candidates = state.candidates
 
     if not candidates:
         return {
@@ -77,8 +109,8 @@ async def skim_node(state: SkimState) -> dict:
             "total_skimmed": 0,
         }
 
-    settings = get_settings()
-    skim_agent = UltraSkimAgent(batch_size=settings.skim_batch_size)
+    settings = _SETTINGS
+    skim_agent = _get_skim_agent(settings.skim_batch_size, settings.skim_max_concurrency)
 
     try:
         result = await skim_agent.run(candidates)
@@ -102,7 +134,7 @@ async def skim_node(state: SkimState) -> dict:
 
 async def gate_node(state: SkimState) -> dict:
     """Gatekeeper 노드."""
-    skim_result = state.get("skim_result")
+    skim_result = state.skim_result
 
     if skim_result is None:
         return {
@@ -110,10 +142,9 @@ async def gate_node(state: SkimState) -> dict:
             "all_papers": [],
         }
 
-    settings = get_settings()
-    gatekeeper = Gatekeeper(
-        interest_threshold=settings.skim_interest_threshold,
-        max_deep_papers=settings.max_deep_papers_per_day,
+    settings = _SETTINGS
+    gatekeeper = _get_gatekeeper(
+        settings.skim_interest_threshold, settings.max_deep_papers_per_day
     )
 
     try:
@@ -133,11 +164,11 @@ async def gate_node(state: SkimState) -> dict:
 
 async def save_skim_node(state: SkimState) -> dict:
     """스킴 결과 저장 노드."""
-    run_date = state.get("run_date", datetime.now().strftime("%Y-%m-%d"))
-    all_papers = state.get("all_papers", [])
-    deep_candidates = state.get("deep_candidates", [])
-    total_collected = state.get("total_collected", 0)
-    total_skimmed = state.get("total_skimmed", 0)
+    run_date = state.run_date  # 엔트리포인트에서 한 번만 결정
+    all_papers = state.all_papers
+    deep_candidates = state.deep_candidates
+    total_collected = state.total_collected
+    total_skimmed = state.total_skimmed
 
     # DailySkimOutput 생성
     daily_output = DailySkimOutput(
@@ -149,8 +180,8 @@ async def save_skim_node(state: SkimState) -> dict:
     )
 
     # 저장
-    settings = get_settings()
-    store = SkimStore(settings.base_dir)
+    settings = _SETTINGS
+    store = _get_skim_store(settings.base_dir)
 
     try:
         path = store.save(daily_output)
@@ -166,7 +197,7 @@ async def save_skim_node(state: SkimState) -> dict:
 
 def should_continue_after_fetch(state: SkimState) -> str:
     """fetch 후 계속 진행 여부."""
-    candidates = state.get("candidates", [])
+    candidates = state.candidates
     if not candidates:
         return "end"
     return "skim"
@@ -205,38 +236,54 @@ def build_skim_pipeline() -> StateGraph:
     return graph
 
 
-def create_skim_pipeline():
+def create_skim_pipeline(checkpointer: Optional[BaseCheckpointSaver] = None):
     """Skim Pipeline 컴파일.
 
+    Args:
+        checkpointer: 상태 체크포인터 (기본: 없음)
+
     Returns:
         컴파일된 LangGraph runnable
     """
     graph = build_skim_pipeline()
-    return graph.compile()
+    return graph.compile(checkpointer=checkpointer)
 
 
-@traceable(name="skim_pipeline", run_type="chain")
-async def run_skim_pipeline(run_date: str | None = None) -> SkimState:
-    """Skim Pipeline 실행.
+async def astream_skim_pipeline(run_date: str | None = None) -> AsyncIterator[dict[str, Any]]:
+    """Skim Pipeline 스트리밍 실행.
+
+    각 노드 실행 후의 상태를 순서대로 yield한다.
 
     Args:
         run_date: 실행 날짜 (YYYY-MM-DD). None이면 오늘 날짜.
 
-    Returns:
-        최종 상태
+    Yields:
+        단계별 상태 값 dict (마지막 값이 최종 상태)
     """
     if run_date is None:
         run_date = datetime.now().strftime("%Y-%m-%d")
 
     pipeline = create_skim_pipeline()
 
-    initial_state: SkimState = {
-        "run_date": run_date,
-        "candidates": [],
-        "errors": [],
-    }
+    initial_state = SkimState(run_date=run_date)
+
+    async for state in pipeline.astream(initial_state, stream_mode="values"):
+        yield state
 
-    result = await pipeline.ainvoke(initial_state)
+
+@traceable(name="skim_pipeline", run_type="chain")
+async def run_skim_pipeline(run_date: str | None = None) -> dict[str, Any]:
+    """Skim Pipeline 실행.
+
+    Args:
+        run_date: 실행 날짜 (YYYY-MM-DD). None이면 오늘 날짜.
+
+    Returns:
+        최종 상태 값 dict
+    """
+    result: dict[str, Any] = {}
+    async for state in astream_skim_pipeline(run_date):
+        result = state
     return result
 
 
@@ -1,28 +1,36 @@
 """Extraction 스키마 v2 - Evidence 포함."""
 
-from typing import Literal, Optional
+import functools
+from dataclasses import dataclass
+from typing import Annotated, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class Evidence(BaseModel):
+# 클레임마다 생성되는 리프 타입이라 BaseModel 대신 slots 데이터클래스를 쓴다.
+# 상위 pydantic 모델의 필드로 쓰이면 pydantic이 그대로 검증/직렬화한다.
+# (docstring은 JSON 스키마 description으로 LLM 프롬프트에 들어가므로 짧게 유지)
+@dataclass(slots=True)
+class Evidence:
     """근거 정보."""
 
-    page: Optional[int] = Field(default=None, description="페이지 번호")
-    section: Optional[str] = Field(default=None, description="섹션 이름")
-    quote: Optional[str] = Field(default=None, description="인용문")
-    type: Literal["quote", "table", "figure", "equation"] = Field(
-        default="quote", description="근거 유형"
-    )
+    page: Annotated[Optional[int], Field(description="페이지 번호")] = None
+    section: Annotated[Optional[str], Field(description="섹션 이름")] = None
+    quote: Annotated[Optional[str], Field(description="인용문")] = None
+    type: Annotated[
+        Literal["quote", "table", "figure", "equation"], Field(description="근거 유형")
+    ] = "quote"
 
     def to_pointer(self) -> str:
         """Evidence pointer 문자열 생성."""
-        parts = []
-        if self.page:
-            parts.append(f"p.{self.page}")
-        if self.section:
-            parts.append(f"§{self.section}")
-        return f"(Evidence: {' '.join(parts)})" if parts else ""
+        page, section = self.page, self.section
+        if page:
+            if section:
+                return f"(Evidence: p.{page} §{section})"
+            return f"(Evidence: p.{page})"
+        if section:
+            return f"(Evidence: §{section})"
+        return ""
 
 
 class ProblemDefinition(BaseModel):
@@ -100,6 +108,9 @@ class ClaimWithEvidence(BaseModel):
 class ExtractionOutput(BaseModel):
     """Extraction Agent 출력 - extraction.json 스키마."""
 
+    # LLM/파서가 한 번 생성한 뒤 읽기만 하므로 불변 (파생 값은 cached_property로 캐싱)
+    model_config = ConfigDict(frozen=True)
+
     arxiv_id: str = Field(..., description="arXiv ID")
     title: str = Field(..., description="논문 제목")
     problem_definition: ProblemDefinition = Field(..., description="문제 정의")
@@ -125,27 +136,42 @@ class ExtractionOutput(BaseModel):
         default="full", description="추출 모드"
     )
 
-    @property
+    @functools.cached_property
     def all_benchmarks(self) -> list[BenchmarkInfo]:
         """모든 벤치마크 반환 (benchmarks + 레거시 benchmark 통합)."""
         result = list(self.benchmarks)
-        if self.benchmark and self.benchmark not in result:
-            result.append(self.benchmark)
+        legacy = self.benchmark
+        if legacy is None:
+            return result
+        # list의 in 비교는 동일 객체면 필드 비교 없이 바로 일치한다.
+        # LLM이 같은 벤치마크를 두 필드에 모두 채운 경우 중복을 막기 위해 값 비교는 유지
+        if legacy not in result:
+            result.append(legacy)
         return result
 
+    @functools.cached_property
+    def _claim_stats(self) -> tuple[int, int]:
+        """(총 클레임 수, Evidence가 있는 클레임 수)를 한 번의 순회로 계산."""
+        with_evidence = 0
+        for claim in self.claims:
+            if claim.evidence:
+                with_evidence += 1
+        return len(self.claims), with_evidence
+
     @property
     def total_claims(self) -> int:
         """총 클레임 수."""
-        return len(self.claims)
+        return self._claim_stats[0]
 
     @property
     def claims_with_evidence(self) -> int:
         """Evidence가 있는 클레임 수."""
-        return sum(1 for c in self.claims if c.evidence)
+        return self._claim_stats[1]
 
     @property
     def evidence_coverage(self) -> float:
         """Evidence 커버리지."""
-        if not self.claims:
+        total, with_evidence = self._claim_stats
+        if not total:
             return 0.0
-        return self.claims_with_evidence / self.total_claims
+        return with_evidence / total
@@ -1,8 +1,9 @@
 """GitHub Method 스키마 - 논문 방법론의 GitHub 구현 매핑."""
 
+import functools
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from rtc.schemas.extraction_v2 import Evidence
 
@@ -54,6 +55,9 @@ class MethodImplementation(BaseModel):
 class GitHubMethodOutput(BaseModel):
     """GitHubMethodAgent 출력."""
 
+    # 생성 후 읽기만 하므로 불변 (파생 값은 cached_property로 캐싱)
+    model_config = ConfigDict(frozen=True)
+
     arxiv_id: str = Field(..., description="arXiv ID")
     repo_url: str = Field(..., description="GitHub 레포 URL")
     repo_description: str = Field(..., description="레포 설명")
@@ -77,7 +81,7 @@ class GitHubMethodOutput(BaseModel):
     installation: str = Field(default="", description="설치 방법")
     usage_example: str = Field(default="", description="사용 예시")
 
-    @property
+    @functools.cached_property
     def has_implementations(self) -> bool:
         """구현이 있는지 여부."""
         return len(self.methods) > 0
@@ -1,78 +1,147 @@
 """Parsed PDF schemas."""
 
+import functools
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Table(BaseModel):
     """A table extracted from the paper."""
 
-    table_id: str = Field(..., description="Table identifier")
-    caption: Optional[str] = Field(default=None, description="Table caption")
-    content: str = Field(..., description="Table content as text or markdown")
-    section: Optional[str] = Field(default=None, description="Section where table appears")
+    table_id: str  # Table identifier
+    caption: Optional[str] = None  # Table caption
+    content: str  # Table content as text or markdown
+    section: Optional[str] = None  # Section where table appears
 
 
-class Figure(BaseModel):
-    """A figure reference from the paper."""
+@dataclass(slots=True)
+class Figure:
+    """A figure reference from the paper (slots dataclass leaf; validated by ParsedPDF)."""
 
-    figure_id: str = Field(..., description="Figure identifier")
-    caption: Optional[str] = Field(default=None, description="Figure caption")
-    section: Optional[str] = Field(default=None, description="Section where figure appears")
+    figure_id: str  # Figure identifier
+    caption: Optional[str] = None  # Figure caption
+    section: Optional[str] = None  # Section where figure appears
 
 
 class Section(BaseModel):
     """A section from the parsed paper."""
 
-    title: str = Field(..., description="Section title")
-    level: int = Field(default=1, description="Section level (1=top)")
-    content: str = Field(..., description="Section text content")
+    title: str  # Section title
+    level: int = 1  # Section level (1=top)
+    content: str  # Section text content
     subsections: list["Section"] = Field(default_factory=list, description="Nested subsections")
 
 
-class Reference(BaseModel):
-    """A bibliographic reference."""
+@dataclass(slots=True)
+class Reference:
+    """A bibliographic reference (slots dataclass leaf; validated by ParsedPDF)."""
 
-    ref_id: str = Field(..., description="Reference identifier")
-    title: Optional[str] = Field(default=None, description="Reference title")
-    authors: list[str] = Field(default_factory=list, description="Reference authors")
-    year: Optional[int] = Field(default=None, description="Publication year")
-    venue: Optional[str] = Field(default=None, description="Publication venue")
+    ref_id: str  # Reference identifier
+    title: Optional[str] = None  # Reference title
+    authors: list[str] = field(default_factory=list)  # Reference authors
+    year: Optional[int] = None  # Publication year
+    venue: Optional[str] = None  # Publication venue
 
 
 class ParsedPDF(BaseModel):
     """Fully parsed PDF structure."""
 
-    arxiv_id: str = Field(..., description="arXiv identifier")
-    title: str = Field(..., description="Paper title")
-    abstract: str = Field(..., description="Paper abstract")
+    # Parsers build this once and downstream nodes only read it
+    model_config = ConfigDict(frozen=True)
+
+    arxiv_id: str  # arXiv identifier
+    title: str  # Paper title
+    abstract: str  # Paper abstract
     sections: list[Section] = Field(default_factory=list, description="Paper sections")
     tables: list[Table] = Field(default_factory=list, description="Extracted tables")
     figures: list[Figure] = Field(default_factory=list, description="Figure references")
     references: list[Reference] = Field(default_factory=list, description="Bibliography")
-    raw_text: Optional[str] = Field(default=None, description="Full raw text if available")
-    parse_success: bool = Field(default=True, description="Whether parsing succeeded")
+    raw_text: Optional[str] = None  # Full raw text if available
+    parse_success: bool = True  # Whether parsing succeeded
     parse_errors: list[str] = Field(default_factory=list, description="Any parsing errors")
 
+    @functools.cached_property
+    def _lowered_titles(self) -> list[tuple[str, Section]]:
+        """(lowercased title, section) pairs for sections and subsections, in document order."""
+        pairs = []
+        for section in self.sections:
+            pairs.append((section.title.lower(), section))
+            for subsec in section.subsections:
+                pairs.append((subsec.title.lower(), subsec))
+        return pairs
+
+    @functools.cached_property
+    def _title_index(self) -> dict[str, Section]:
+        """Lowercased title -> first section with that title."""
+        index: dict[str, Section] = {}
+        for title_lower, section in self._lowered_titles:
+            index.setdefault(title_lower, section)
+        return index
+
     def get_section_by_title(self, title: str) -> Optional[Section]:
-        """Find a section by its title (case-insensitive)."""
+        """Find a section by its title (case-insensitive).
+
+        An exact title match wins; otherwise the first section whose title
+        contains ``title`` is returned.
+        """
         title_lower = title.lower()
-        for section in self.sections:
-            if title_lower in section.title.lower():
+        section = self._title_index.get(title_lower)
+        if section is not None:
+            return section
+        for section_title, section in self._lowered_titles:
+            if title_lower in section_title:
                 return section
-            for subsec in section.subsections:
-                if title_lower in subsec.title.lower():
-                    return subsec
         return None
 
-    def get_full_text(self) -> str:
-        """Get concatenated text from all sections."""
-        if self.raw_text:
-            return self.raw_text
-        parts = [self.abstract]
+    def iter_text(self, section_titles: Optional[Iterable[str]] = None) -> Iterator[str]:
+        """Yield the document text in chunks, in the same order as get_full_text().
+
+        Args:
+            section_titles: Only yield sections whose title contains one of these
+                (case-insensitive). None yields the whole document.
+        """
+        if section_titles is None and self.raw_text:
+            yield self.raw_text
+            return
+        wanted = [t.lower() for t in section_titles] if section_titles is not None else None
+
+        yield self.abstract
         for section in self.sections:
-            parts.append(f"\n## {section.title}\n{section.content}")
+            keep_section = wanted is None or any(w in section.title.lower() for w in wanted)
+            if keep_section:
+                yield f"\n\n## {section.title}\n{section.content}"
             for subsec in section.subsections:
-                parts.append(f"\n### {subsec.title}\n{subsec.content}")
-        return "\n".join(parts)
+                if keep_section or any(w in subsec.title.lower() for w in wanted):
+                    yield f"\n\n### {subsec.title}\n{subsec.content}"
+
+    def get_text_prefix(self, max_chars: int) -> str:
+        """Get the first ``max_chars`` characters of get_full_text().
+
+        Stops consuming sections once enough text is collected, so callers that
+        truncate anyway never build the full document string.
+        """
+        if self.raw_text:
+            return self.raw_text[:max_chars]
+        parts = []
+        remaining = max_chars
+        for chunk in self.iter_text():
+            if len(chunk) >= remaining:
+                parts.append(chunk[:remaining])
+                break
+            parts.append(chunk)
+            remaining -= len(chunk)
+        return "".join(parts)
+
+    @functools.cached_property
+    def full_text(self) -> str:
+        """Concatenated text from all sections (built once per instance)."""
+        if self.raw_text:
+            return self.raw_text
+        return "".join(self.iter_text())
+
+    def get_full_text(self) -> str:
+        """Get concatenated text from all sections."""
+        return self.full_text
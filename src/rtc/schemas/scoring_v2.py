@@ -1,8 +1,20 @@
 """Scoring 스키마 v2 - 단순화된 구조."""
 
+import functools
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# 점수 기준 상수
+SCORE_THRESHOLD_MUST_READ = 12
+SCORE_THRESHOLD_WORTH_READING = 8
+
+# 통과한 기준 수(0~2)로 인덱싱하는 추천 등급
+_RECOMMENDATIONS: tuple[Literal["must_read", "worth_reading", "skip"], ...] = (
+    "skip",
+    "worth_reading",
+    "must_read",
+)
 
 
 class ScoringOutput(BaseModel):
@@ -19,6 +31,9 @@ class ScoringOutput(BaseModel):
     - skip: total < 8
     """
 
+    # LLM/파서가 한 번 생성한 뒤 읽기만 하므로 불변 (파생 값은 cached_property로 캐싱)
+    model_config = ConfigDict(frozen=True)
+
     arxiv_id: str = Field(..., description="arXiv ID")
 
     # 점수 (각 0-5, 총 15점)
@@ -51,7 +66,7 @@ class ScoringOutput(BaseModel):
     key_strength: str = Field(..., description="주요 강점")
     main_concern: str = Field(default="", description="주요 우려 사항")
 
-    @property
+    @functools.cached_property
     def total(self) -> int:
         """총점 (최대 15점)."""
         return self.practicality + self.codeability + self.signal
@@ -59,24 +74,10 @@ class ScoringOutput(BaseModel):
     @classmethod
     def get_recommendation_from_score(cls, total: int) -> Literal["must_read", "worth_reading", "skip"]:
         """총점으로부터 추천 등급 결정."""
-        if total >= 12:
-            return "must_read"
-        elif total >= 8:
-            return "worth_reading"
-        else:
-            return "skip"
+        return _RECOMMENDATIONS[
+            (total >= SCORE_THRESHOLD_WORTH_READING) + (total >= SCORE_THRESHOLD_MUST_READ)
+        ]
 
-    def model_post_init(self, __context) -> None:
-        """모델 초기화 후 추천 등급 검증."""
-        expected = self.get_recommendation_from_score(self.total)
-        if self.recommendation != expected:
-            # 자동 수정하지 않고 경고만 (LLM 출력 존중)
-            pass
-
-
-# 점수 기준 상수
-SCORE_THRESHOLD_MUST_READ = 12
-SCORE_THRESHOLD_WORTH_READING = 8
 
 
 # 점수 설명
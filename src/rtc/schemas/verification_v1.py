@@ -1,8 +1,9 @@
 """Verification 스키마 v1 - 검증 결과."""
 
+import functools
 from typing import Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class VerificationResult(BaseModel):
@@ -28,11 +29,15 @@ class VerificationResult(BaseModel):
 class VerificationOutput(BaseModel):
     """검증 에이전트 출력 - verification.json 스키마."""
 
+    # LLM/파서가 한 번 생성한 뒤 읽기만 하므로 불변 (파생 값은 cached_property로 캐싱)
+    model_config = ConfigDict(frozen=True)
+
     arxiv_id: str = Field(..., description="arXiv ID")
-    total_claims: int = Field(..., description="총 클레임 수")
-    verified_count: int = Field(..., description="검증된 클레임 수")
-    unverified_count: int = Field(..., description="미검증 클레임 수")
-    contradicted_count: int = Field(..., description="모순된 클레임 수")
+    # 카운터는 results에서 집계된다 (입력 값은 _tally에서 덮어씀)
+    total_claims: int = Field(default=0, description="총 클레임 수")
+    verified_count: int = Field(default=0, description="검증된 클레임 수")
+    unverified_count: int = Field(default=0, description="미검증 클레임 수")
+    contradicted_count: int = Field(default=0, description="모순된 클레임 수")
     overall_reliability: Literal["high", "medium", "low"] = Field(
         ..., description="전체 신뢰도"
     )
@@ -44,7 +49,20 @@ class VerificationOutput(BaseModel):
         default_factory=list, description="교정 필요한 항목 목록"
     )
 
-    @property
+    @model_validator(mode="after")
+    def _tally(self) -> "VerificationOutput":
+        """results를 한 번 순회해 카운터를 집계 (LLM이 준 카운터와 불일치 방지)."""
+        counts = {"verified": 0, "unverified": 0, "contradicted": 0}
+        for result in self.results:
+            counts[result.status] += 1
+        # frozen 모델이므로 object.__setattr__로 직접 설정
+        object.__setattr__(self, "total_claims", len(self.results))
+        object.__setattr__(self, "verified_count", counts["verified"])
+        object.__setattr__(self, "unverified_count", counts["unverified"])
+        object.__setattr__(self, "contradicted_count", counts["contradicted"])
+        return self
+
+    @functools.cached_property
     def verification_rate(self) -> float:
         """검증률."""
         if self.total_claims == 0:
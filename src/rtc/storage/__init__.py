@@ -1,10 +1,27 @@
-"""Storage 패키지 - 아티팩트 저장 관리."""
+"""Storage 패키지 - 아티팩트 저장 관리.
 
-from rtc.storage.code_store import CodeStore
-from rtc.storage.deep_store import DeepStore, create_paper_slug
-from rtc.storage.index_store import IndexStore
-from rtc.storage.report_store import ReportStore
-from rtc.storage.skim_store import SkimStore
+export는 지연 로딩(PEP 562)되므로 패키지를 import해도 모든 저장소 모듈과
+스키마 모듈을 불러오지 않는다 (사용하는 저장소만 로드).
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from rtc.storage.code_store import CodeStore
+    from rtc.storage.deep_store import DeepStore, create_paper_slug
+    from rtc.storage.index_store import IndexStore
+    from rtc.storage.report_store import ReportStore
+    from rtc.storage.skim_store import SkimStore
+
+_EXPORTS: dict[str, str] = {
+    "SkimStore": "rtc.storage.skim_store",
+    "DeepStore": "rtc.storage.deep_store",
+    "CodeStore": "rtc.storage.code_store",
+    "IndexStore": "rtc.storage.index_store",
+    "ReportStore": "rtc.storage.report_store",
+    "create_paper_slug": "rtc.storage.deep_store",
+}
 
 __all__ = [
     "SkimStore",
@@ -14,3 +31,17 @@ __all__ = [
     "ReportStore",
     "create_paper_slug",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,11 +1,40 @@
 """CodeStore - reports/<slug>/code/ 저장 관리."""
 
-import json
 import re
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Optional
 
-from rtc.schemas.github_method import GitHubMethodOutput
+import orjson
+
+from rtc.schemas.extraction_v2 import Evidence
+from rtc.schemas.github_method import GitHubMethodOutput, MethodImplementation
+
+# 파일명 정리용 변환 테이블: 영숫자/밑줄 외의 바이트는 "_"로 (메서드마다 호출되므로 미리 구성)
+_SANITIZE_TABLE = bytes(
+    b if chr(b).isascii() and (chr(b).isalnum() or b == ord("_")) else ord("_")
+    for b in range(256)
+)
+_DEDUP_RE = re.compile(r"_+")
+
+
+def _construct_github_method(content: dict) -> GitHubMethodOutput:
+    """검증 없이 GitHubMethodOutput 트리 구성 (직접 저장한 신뢰 가능한 JSON 전용).
+
+    중첩 methods/paper_evidence까지 model_construct로 만들어 재귀 검증 비용을 생략한다.
+    """
+    methods = []
+    for m in content.get("methods", []):
+        evidence = m.get("paper_evidence")
+        methods.append(
+            MethodImplementation.model_construct(
+                **{
+                    **m,
+                    "paper_evidence": Evidence(**evidence) if evidence else None,
+                }
+            )
+        )
+    return GitHubMethodOutput.model_construct(**{**content, "methods": methods})
 
 
 class CodeStore:
@@ -25,11 +54,15 @@ class CodeStore:
             reports_dir: reports 디렉토리 경로 (우선 사용)
         """
         self.reports_dir = reports_dir if reports_dir is not None else base_dir / "reports"
+        # 이미 생성을 확인한 코드 디렉토리 (반복 mkdir 시스템 콜 생략)
+        self._ensured_dirs: set[str] = set()
 
     def get_code_dir(self, slug: str) -> Path:
-        """코드 디렉토리 경로."""
+        """코드 디렉토리 경로 (없으면 생성)."""
         code_dir = self.reports_dir / slug / "code"
-        code_dir.mkdir(parents=True, exist_ok=True)
+        if slug not in self._ensured_dirs:
+            code_dir.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(slug)
         return code_dir
 
     def github_method_exists(self, slug: str) -> bool:
@@ -50,96 +83,99 @@ class CodeStore:
 
         # 1. github_methods.json 저장 (전체 결과)
         json_path = code_dir / "github_methods.json"
-        json_path.write_text(
-            json.dumps(result.model_dump(), indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
+        json_path.write_bytes(orjson.dumps(result.model_dump(), option=orjson.OPT_INDENT_2))
 
         # 2. methods.md 저장 (읽기 좋은 형식)
         md_path = code_dir / "methods.md"
         md_content = self._format_github_method_md(result)
-        md_path.write_text(md_content, encoding="utf-8")
+        md_path.write_bytes(md_content.encode("utf-8"))
 
         # 3. 각 방법론별 코드 파일 저장
         for i, method in enumerate(result.methods):
             filename = f"method_{i+1}_{self._sanitize_filename(method.method_name)}.py"
             method_path = code_dir / filename
             method_content = self._format_method_file(method, result)
-            method_path.write_text(method_content, encoding="utf-8")
+            method_path.write_bytes(method_content.encode("utf-8"))
 
         return code_dir
 
-    def load_github_method(self, slug: str) -> Optional[GitHubMethodOutput]:
-        """GitHub Method 결과 로드."""
+    def load_github_method(
+        self, slug: str, *, trusted: bool = True
+    ) -> Optional[GitHubMethodOutput]:
+        """GitHub Method 결과 로드.
+
+        Args:
+            slug: 논문 슬러그
+            trusted: save_github_method로 저장한 파일이면 True (검증 생략).
+                외부에서 작성/수정된 파일이면 False로 전체 검증
+
+        Returns:
+            GitHub Method 출력 (파일 없으면 None)
+        """
         path = self.reports_dir / slug / "code" / "github_methods.json"
         if not path.exists():
             return None
 
-        content = json.loads(path.read_text(encoding="utf-8"))
+        content = orjson.loads(path.read_bytes())
+        if trusted:
+            return _construct_github_method(content)
         return GitHubMethodOutput(**content)
 
     def _format_github_method_md(self, result: GitHubMethodOutput) -> str:
         """GitHub Method 결과를 Markdown으로 포맷."""
-        lines = [
-            f"# {result.arxiv_id} - GitHub Method Analysis",
-            "",
-            f"**Repository**: [{result.repo_url}]({result.repo_url})",
-            f"**Language**: {result.main_language}",
-            "",
-            "## 프로젝트 구조",
-            "",
-            result.structure_summary,
-            "",
-            "## 방법론 구현",
-            "",
-        ]
+        return "\n".join(self._iter_github_method_md_lines(result))
+
+    def _iter_github_method_md_lines(self, result: GitHubMethodOutput) -> Iterator[str]:
+        """GitHub Method Markdown 라인 생성 (중간 리스트 없이 join에 바로 전달)."""
+        yield f"# {result.arxiv_id} - GitHub Method Analysis"
+        yield ""
+        yield f"**Repository**: [{result.repo_url}]({result.repo_url})"
+        yield f"**Language**: {result.main_language}"
+        yield ""
+        yield "## 프로젝트 구조"
+        yield ""
+        yield result.structure_summary
+        yield ""
+        yield "## 방법론 구현"
+        yield ""
 
         for i, method in enumerate(result.methods, 1):
-            lines.extend([
-                f"### {i}. {method.method_name}",
-                "",
-                f"**설명**: {method.description}",
-                "",
-                f"**위치**: `{method.file_path}`",
-                f"**함수/클래스**: `{method.class_or_function}`",
-                "",
-                "```python",
-                method.key_code,
-                "```",
-                "",
-                f"**코드 설명**: {method.code_explanation}",
-                "",
-            ])
+            yield f"### {i}. {method.method_name}"
+            yield ""
+            yield f"**설명**: {method.description}"
+            yield ""
+            yield f"**위치**: `{method.file_path}`"
+            yield f"**함수/클래스**: `{method.class_or_function}`"
+            yield ""
+            yield "```python"
+            yield method.key_code
+            yield "```"
+            yield ""
+            yield f"**코드 설명**: {method.code_explanation}"
+            yield ""
 
         if result.unmapped_methods:
-            lines.extend([
-                "## 미구현 방법론",
-                "",
-                *[f"- {m}" for m in result.unmapped_methods],
-                "",
-            ])
+            yield "## 미구현 방법론"
+            yield ""
+            for m in result.unmapped_methods:
+                yield f"- {m}"
+            yield ""
 
         if result.installation:
-            lines.extend([
-                "## 설치 방법",
-                "",
-                "```bash",
-                result.installation,
-                "```",
-                "",
-            ])
+            yield "## 설치 방법"
+            yield ""
+            yield "```bash"
+            yield result.installation
+            yield "```"
+            yield ""
 
         if result.usage_example:
-            lines.extend([
-                "## 사용 예시",
-                "",
-                "```python",
-                result.usage_example,
-                "```",
-                "",
-            ])
-
-        return "\n".join(lines)
+            yield "## 사용 예시"
+            yield ""
+            yield "```python"
+            yield result.usage_example
+            yield "```"
+            yield ""
 
     def _format_method_file(self, method, result: GitHubMethodOutput) -> str:
         """개별 방법론 코드 파일 포맷."""
@@ -162,6 +198,6 @@ class CodeStore:
 
     def _sanitize_filename(self, name: str) -> str:
         """파일명으로 사용 가능하도록 정리."""
-        sanitized = re.sub(r'[^a-zA-Z0-9_]', '_', name.lower())
-        sanitized = re.sub(r'_+', '_', sanitized)
-        return sanitized[:50]
+        # 비ASCII 문자는 encode에서 "?" 한 글자가 되고, 테이블에서 "_"로 바뀐다
+        ascii_name = name.lower().encode("ascii", "replace").translate(_SANITIZE_TABLE)
+        return _DEDUP_RE.sub("_", ascii_name.decode("ascii"))[:50]
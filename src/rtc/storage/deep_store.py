@@ -1,19 +1,29 @@
 """DeepStore - reports/<slug>/ 저장 관리."""
 
-import json
+import functools
+import os
 import re
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+import orjson
+from pydantic import BaseModel
+
 from rtc.schemas.delta_v2 import DeltaOutput
 from rtc.schemas.extraction_v2 import ExtractionOutput
 from rtc.schemas.scoring_v2 import ScoringOutput
 from rtc.schemas.verification_v1 import VerificationOutput
 
+# 슬러그에 남길 문자 외 (알파벳/숫자/공백)
+_SLUG_STRIP_RE = re.compile(r"[^a-zA-Z0-9\s]")
+# 연속 공백 (하이픈 하나로 치환)
+_SLUG_WS_RE = re.compile(r"\s+")
+
 
+@functools.lru_cache(maxsize=4096)
 def create_paper_slug(arxiv_id: str, title: str) -> str:
-    """논문 슬러그 생성.
+    """논문 슬러그 생성 (순수 함수, 결과 캐시).
 
     Args:
         arxiv_id: arXiv ID (예: 2601.18491)
@@ -23,12 +33,72 @@ def create_paper_slug(arxiv_id: str, title: str) -> str:
         슬러그 (예: 2601.18491-agentdog)
     """
     # 제목에서 알파벳/숫자만 추출, 소문자로
-    title_clean = re.sub(r"[^a-zA-Z0-9\s]", "", title.lower())
+    title_clean = _SLUG_STRIP_RE.sub("", title.lower())
     # 공백을 하이픈으로, 30자 제한
-    title_slug = "-".join(title_clean.split())[:30].rstrip("-")
+    title_slug = _SLUG_WS_RE.sub("-", title_clean).strip("-")[:30].rstrip("-")
     return f"{arxiv_id}-{title_slug}"
 
 
+def _dump_json_bytes(model: BaseModel) -> bytes:
+    """pydantic 모델을 들여쓰기된 UTF-8 JSON 바이트로 직렬화."""
+    return orjson.dumps(model.model_dump(), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+
+# 기존 파일 비교 시 읽기 단위
+_COMPARE_CHUNK_SIZE = 1 << 16
+
+
+def _file_equals(path: Path, data: bytes) -> bool:
+    """파일 내용이 data와 같은지 청크 단위로 비교 (기존 파일 전체를 메모리에 올리지 않음)."""
+    view = memoryview(data)
+    offset = 0
+    with open(path, "rb") as f:
+        while chunk := f.read(_COMPARE_CHUNK_SIZE):
+            end = offset + len(chunk)
+            if view[offset:end] != chunk:
+                return False
+            offset = end
+    return offset == len(data)
+
+
+def _fsync_dir(path: Path) -> None:
+    """디렉토리 엔트리(이름 변경/생성)를 디스크에 동기화."""
+    dir_fd = os.open(path, os.O_DIRECTORY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def _write_bytes_atomic(
+    path: Path, data: bytes, *, durable: bool = False, sync_dir: bool = True
+) -> None:
+    """파일 쓰기.
+
+    durable=False면 그대로 덮어쓴다 (fsync 없음, OS 버퍼링에 맡김 - 쓰는 도중 중단되면
+    파일이 잘릴 수 있음). durable=True면 임시 파일에 쓰고 fsync한 뒤 os.replace로
+    교체하므로, 중단되어도 이전 내용 또는 새 내용 중 하나만 남는다.
+
+    Args:
+        path: 파일 경로
+        data: 저장할 바이트
+        durable: 원자적 교체 + fsync 여부
+        sync_dir: durable일 때 교체 후 디렉토리 엔트리까지 동기화할지 여부
+            (여러 파일을 쓴 뒤 한 번만 동기화하려면 False)
+    """
+    if not durable:
+        path.write_bytes(data)
+        return
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    if sync_dir:
+        _fsync_dir(path.parent)
+
+
 class DeepStore:
     """reports/ 디렉토리 저장 관리.
 
@@ -38,6 +108,8 @@ class DeepStore:
     - scoring.json
     - deep.md
     - verification.json (선택)
+
+    reports/_index.txt: deep.md가 저장된 슬러그 매니페스트 (list_papers용)
     """
 
     def __init__(self, base_dir: Path, *, reports_dir: Path | None = None):
@@ -50,18 +122,69 @@ class DeepStore:
         self.reports_dir = reports_dir if reports_dir is not None else base_dir / "reports"
         self.reports_dir.mkdir(parents=True, exist_ok=True)
 
+    @staticmethod
+    def _write_if_changed(
+        path: Path, text: str | bytes, *, durable: bool = False, sync_dir: bool = True
+    ) -> bool:
+        """내용이 바뀐 경우에만 파일 쓰기.
+
+        재시도 후 결과가 이전과 같으면 기존 파일을 그대로 둔다.
+
+        Args:
+            path: 파일 경로
+            text: 저장할 내용 (str은 UTF-8로 인코딩)
+            durable: 임시 파일 + fsync + os.replace로 원자적으로 쓸지 여부
+            sync_dir: durable일 때 디렉토리 엔트리까지 동기화할지 여부
+
+        Returns:
+            실제로 썼으면 True
+        """
+        data = text.encode("utf-8") if isinstance(text, str) else text
+        try:
+            if path.stat().st_size == len(data) and _file_equals(path, data):
+                return False
+        except FileNotFoundError:
+            pass
+        _write_bytes_atomic(path, data, durable=durable, sync_dir=sync_dir)
+        return True
+
+    def _write_json(
+        self, path: Path, model: BaseModel, *, durable: bool = False, sync_dir: bool = True
+    ) -> bool:
+        """pydantic 모델을 JSON 파일로 저장 (내용이 바뀐 경우에만).
+
+        Args:
+            path: 파일 경로
+            model: 저장할 모델
+            durable: 임시 파일 + fsync + os.replace로 원자적으로 쓸지 여부
+            sync_dir: durable일 때 디렉토리 엔트리까지 동기화할지 여부
+
+        Returns:
+            실제로 썼으면 True
+        """
+        return self._write_if_changed(
+            path, _dump_json_bytes(model), durable=durable, sync_dir=sync_dir
+        )
+
     def get_paper_dir(self, slug: str) -> Path:
-        """논문 디렉토리 경로."""
+        """논문 디렉토리 경로 (없으면 생성).
+
+        재분석을 위해 디렉토리를 지울 수 있으므로 생성 여부를 캐싱하지 않는다
+        (save_all은 논문당 한 번만 호출).
+        """
         paper_dir = self.reports_dir / slug
         paper_dir.mkdir(parents=True, exist_ok=True)
         return paper_dir
 
-    def save_extraction(self, slug: str, data: ExtractionOutput) -> Path:
+    def save_extraction(
+        self, slug: str, data: ExtractionOutput, *, durable: bool = False
+    ) -> Path:
         """extraction.json 저장.
 
         Args:
             slug: 논문 슬러그
             data: 추출 결과
+            durable: 원자적 교체 + fsync 여부 (기본값 False: 빠른 덮어쓰기)
 
         Returns:
             저장된 파일 경로
@@ -69,19 +192,18 @@ class DeepStore:
         paper_dir = self.get_paper_dir(slug)
         path = paper_dir / "extraction.json"
 
-        content = data.model_dump()
-        path.write_text(
-            json.dumps(content, indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
+        self._write_json(path, data, durable=durable)
         return path
 
-    def save_delta(self, slug: str, data: DeltaOutput) -> Path:
+    def save_delta(
+        self, slug: str, data: DeltaOutput, *, durable: bool = False
+    ) -> Path:
         """delta.json 저장.
 
         Args:
             slug: 논문 슬러그
             data: Delta 결과
+            durable: 원자적 교체 + fsync 여부 (기본값 False: 빠른 덮어쓰기)
 
         Returns:
             저장된 파일 경로
@@ -89,19 +211,18 @@ class DeepStore:
         paper_dir = self.get_paper_dir(slug)
         path = paper_dir / "delta.json"
 
-        content = data.model_dump()
-        path.write_text(
-            json.dumps(content, indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
+        self._write_json(path, data, durable=durable)
         return path
 
-    def save_scoring(self, slug: str, data: ScoringOutput) -> Path:
+    def save_scoring(
+        self, slug: str, data: ScoringOutput, *, durable: bool = False
+    ) -> Path:
         """scoring.json 저장.
 
         Args:
             slug: 논문 슬러그
             data: 스코어링 결과
+            durable: 원자적 교체 + fsync 여부 (기본값 False: 빠른 덮어쓰기)
 
         Returns:
             저장된 파일 경로
@@ -109,19 +230,69 @@ class DeepStore:
         paper_dir = self.get_paper_dir(slug)
         path = paper_dir / "scoring.json"
 
-        content = data.model_dump()
-        path.write_text(
-            json.dumps(content, indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
+        self._write_json(path, data, durable=durable)
         return path
 
-    def save_report(self, slug: str, markdown: str) -> Path:
+    def save_all(
+        self,
+        slug: str,
+        extraction: ExtractionOutput,
+        delta: Optional[DeltaOutput] = None,
+        scoring: Optional[ScoringOutput] = None,
+        verification: Optional[VerificationOutput] = None,
+        report_md: Optional[str] = None,
+        *,
+        durable: bool = False,
+    ) -> list[Path]:
+        """논문 아티팩트를 한 번에 저장.
+
+        디렉토리는 한 번만 준비하고, durable=True면 파일마다 임시 파일 + fsync +
+        os.replace로 교체한 뒤 디렉토리 엔트리는 마지막에 한 번만 동기화한다.
+
+        Args:
+            slug: 논문 슬러그
+            extraction: 추출 결과
+            delta: Delta 결과 (없으면 생략)
+            scoring: 스코어링 결과 (없으면 생략)
+            verification: 검증 결과 (없으면 생략)
+            report_md: 마크다운 리포트 (없으면 생략)
+            durable: 내구성 보장 여부 (기본값 False: OS 버퍼링에 맡김)
+
+        Returns:
+            저장 대상 파일 경로 목록
+        """
+        paper_dir = self.get_paper_dir(slug)
+        artifacts: list[tuple[str, Optional[BaseModel]]] = [
+            ("extraction.json", extraction),
+            ("delta.json", delta),
+            ("scoring.json", scoring),
+            ("verification.json", verification),
+        ]
+
+        paths = []
+        written = False
+        for filename, model in artifacts:
+            if model is None:
+                continue
+            path = paper_dir / filename
+            written |= self._write_json(path, model, durable=durable, sync_dir=False)
+            paths.append(path)
+        if report_md:
+            path = paper_dir / "deep.md"
+            written |= self._write_if_changed(path, report_md, durable=durable, sync_dir=False)
+            paths.append(path)
+
+        if durable and written:
+            _fsync_dir(paper_dir)
+        return paths
+
+    def save_report(self, slug: str, markdown: str, *, durable: bool = False) -> Path:
         """deep.md 저장.
 
         Args:
             slug: 논문 슬러그
             markdown: 마크다운 리포트
+            durable: 원자적 교체 + fsync 여부 (기본값 False: 빠른 덮어쓰기)
 
         Returns:
             저장된 파일 경로
@@ -129,7 +300,7 @@ class DeepStore:
         paper_dir = self.get_paper_dir(slug)
         path = paper_dir / "deep.md"
 
-        path.write_text(markdown, encoding="utf-8")
+        self._write_if_changed(path, markdown, durable=durable)
         return path
 
     def load_extraction(self, slug: str) -> Optional[ExtractionOutput]:
@@ -138,7 +309,7 @@ class DeepStore:
         if not path.exists():
             return None
 
-        content = json.loads(path.read_text(encoding="utf-8"))
+        content = orjson.loads(path.read_bytes())
         return ExtractionOutput(**content)
 
     def load_delta(self, slug: str) -> Optional[DeltaOutput]:
@@ -147,7 +318,7 @@ class DeepStore:
         if not path.exists():
             return None
 
-        content = json.loads(path.read_text(encoding="utf-8"))
+        content = orjson.loads(path.read_bytes())
         return DeltaOutput(**content)
 
     def load_scoring(self, slug: str) -> Optional[ScoringOutput]:
@@ -156,7 +327,7 @@ class DeepStore:
         if not path.exists():
             return None
 
-        content = json.loads(path.read_text(encoding="utf-8"))
+        content = orjson.loads(path.read_bytes())
         return ScoringOutput(**content)
 
     def load_report(self, slug: str) -> Optional[str]:
@@ -165,7 +336,7 @@ class DeepStore:
         if not path.exists():
             return None
 
-        return path.read_text(encoding="utf-8")
+        return path.read_bytes().decode("utf-8")
 
     def list_papers(self) -> list[str]:
         """저장된 논문 슬러그 목록.
@@ -179,12 +350,15 @@ class DeepStore:
                 slugs.append(path.name)
         return sorted(slugs, reverse=True)
 
-    def save_verification(self, slug: str, data: VerificationOutput) -> Path:
+    def save_verification(
+        self, slug: str, data: VerificationOutput, *, durable: bool = False
+    ) -> Path:
         """verification.json 저장.
 
         Args:
             slug: 논문 슬러그
             data: 검증 결과
+            durable: 원자적 교체 + fsync 여부 (기본값 False: 빠른 덮어쓰기)
 
         Returns:
             저장된 파일 경로
@@ -192,11 +366,7 @@ class DeepStore:
         paper_dir = self.get_paper_dir(slug)
         path = paper_dir / "verification.json"
 
-        content = data.model_dump()
-        path.write_text(
-            json.dumps(content, indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
+        self._write_json(path, data, durable=durable)
         return path
 
     def load_verification(self, slug: str) -> Optional[VerificationOutput]:
@@ -205,25 +375,52 @@ class DeepStore:
         if not path.exists():
             return None
 
-        content = json.loads(path.read_text(encoding="utf-8"))
+        content = orjson.loads(path.read_bytes())
         return VerificationOutput(**content)
 
     def paper_exists(self, slug: str) -> bool:
-        """논문 디렉토리 존재 여부."""
+        """논문 리포트(deep.md) 존재 여부."""
         return (self.reports_dir / slug / "deep.md").exists()
 
-    def get_paper_metadata(self, slug: str) -> dict:
-        """논문 메타데이터 조회."""
-        extraction = self.load_extraction(slug)
-        scoring = self.load_scoring(slug)
+    def load_extraction_meta(self, slug: str) -> Optional[dict]:
+        """extraction.json에서 식별 필드만 로드 (ExtractionOutput 검증 생략).
+
+        Returns:
+            {"arxiv_id", "title"} 또는 None (파일 없음)
+        """
+        path = self.reports_dir / slug / "extraction.json"
+        try:
+            data = orjson.loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        return {"arxiv_id": data.get("arxiv_id"), "title": data.get("title")}
 
+    def load_scoring_meta(self, slug: str) -> Optional[dict]:
+        """scoring.json에서 총점과 추천 등급만 로드 (ScoringOutput 검증 생략).
+
+        Returns:
+            {"total", "recommendation"} 또는 None (파일 없음)
+        """
+        path = self.reports_dir / slug / "scoring.json"
+        try:
+            data = orjson.loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        # ScoringOutput.total과 동일 (세 항목 합)
+        total = sum(data.get(key, 0) for key in ("practicality", "codeability", "signal"))
+        return {"total": total, "recommendation": data.get("recommendation")}
+
+    def get_paper_metadata(self, slug: str) -> dict:
+        """논문 메타데이터 조회 (전체 모델을 만들지 않고 필요한 필드만 읽음)."""
+        extraction = self.load_extraction_meta(slug)
         if not extraction:
             return {}
+        scoring = self.load_scoring_meta(slug)
 
         return {
             "slug": slug,
-            "arxiv_id": extraction.arxiv_id,
-            "title": extraction.title,
-            "score": scoring.total if scoring else None,
-            "recommendation": scoring.recommendation if scoring else None,
+            "arxiv_id": extraction["arxiv_id"],
+            "title": extraction["title"],
+            "score": scoring["total"] if scoring else None,
+            "recommendation": scoring["recommendation"] if scoring else None,
         }
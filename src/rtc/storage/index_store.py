@@ -1,21 +1,31 @@
 """IndexStore - index/ 디렉토리 관리."""
 
+import heapq
 from collections import defaultdict
 from pathlib import Path
 from typing import Optional
 
+import orjson
 import yaml
 
 from rtc.schemas.skim import SkimSummary
 
+# 레거시 YAML 인덱스 마이그레이션용 (libyaml(C) 구현이 있으면 사용)
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 class IndexStore:
     """index/ 디렉토리 관리.
 
     구조:
-    - by_date.yaml: 날짜별 논문 인덱스
-    - by_tag.yaml: 태그별 논문 인덱스
-    - by_score.yaml: 점수별 논문 인덱스
+    - by_date.json: 날짜별 논문 인덱스
+    - by_tag.json: 태그별 논문 인덱스
+    - by_score.json: 점수별 논문 인덱스 (arxiv_id -> 점수, 정렬하지 않음)
+
+    이전 버전의 .yaml 인덱스가 있으면 처음 로드할 때 .json으로 옮긴다.
     """
 
     def __init__(self, base_dir: Path):
@@ -26,6 +36,8 @@ class IndexStore:
         """
         self.index_dir = base_dir / "index"
         self.index_dir.mkdir(parents=True, exist_ok=True)
+        # 경로 -> (st_mtime_ns, 로드된 데이터). 파일이 바뀌지 않았으면 재파싱하지 않음
+        self._cache: dict[Path, tuple[int, dict]] = {}
 
     def update_by_date(self, date: str, arxiv_ids: list[str]) -> Path:
         """날짜별 인덱스 업데이트.
@@ -37,18 +49,8 @@ class IndexStore:
         Returns:
             인덱스 파일 경로
         """
-        path = self.index_dir / "by_date.yaml"
-
-        # 기존 데이터 로드
-        data = self._load_yaml(path) or {}
-
-        # 업데이트
-        data[date] = arxiv_ids
-
-        # 저장 (최신 날짜 순으로 정렬)
-        sorted_data = dict(sorted(data.items(), reverse=True))
-        self._save_yaml(path, sorted_data)
-
+        path = self.index_dir / "by_date.json"
+        self._save_json(path, self._merge_by_date(path, date, arxiv_ids))
         return path
 
     def update_by_tag(self, papers: list[SkimSummary]) -> Path:
@@ -60,24 +62,8 @@ class IndexStore:
         Returns:
             인덱스 파일 경로
         """
-        path = self.index_dir / "by_tag.yaml"
-
-        # 기존 데이터 로드
-        data = self._load_yaml(path) or {}
-
-        # 태그별로 그룹화
-        for paper in papers:
-            for tag in paper.tags:
-                tag_lower = tag.lower()
-                if tag_lower not in data:
-                    data[tag_lower] = []
-                if paper.arxiv_id not in data[tag_lower]:
-                    data[tag_lower].append(paper.arxiv_id)
-
-        # 저장 (태그 알파벳 순)
-        sorted_data = dict(sorted(data.items()))
-        self._save_yaml(path, sorted_data)
-
+        path = self.index_dir / "by_tag.json"
+        self._save_json(path, self._merge_by_tag(path, papers), sort_keys=True)
         return path
 
     def update_by_score(self, score_data: list[tuple[str, int]]) -> Path:
@@ -89,20 +75,71 @@ class IndexStore:
         Returns:
             인덱스 파일 경로
         """
-        path = self.index_dir / "by_score.yaml"
+        path = self.index_dir / "by_score.json"
+        self._save_json(path, self._merge_by_score(path, score_data))
+        return path
 
-        # 기존 데이터 로드
-        data = self._load_yaml(path) or {}
+    def update_all(
+        self,
+        date: str,
+        arxiv_ids: list[str],
+        papers: list[SkimSummary],
+        score_data: list[tuple[str, int]],
+    ) -> list[Path]:
+        """일일 실행 후 세 인덱스를 한 번에 업데이트.
 
-        # 점수 업데이트
-        for arxiv_id, score in score_data:
-            data[arxiv_id] = score
+        세 인덱스를 모두 병합한 뒤 마지막에 한꺼번에 저장한다.
+        papers/score_data가 비어 있으면 해당 인덱스는 건드리지 않는다.
 
-        # 저장 (점수 높은 순)
-        sorted_data = dict(sorted(data.items(), key=lambda x: x[1], reverse=True))
-        self._save_yaml(path, sorted_data)
+        Args:
+            date: YYYY-MM-DD 형식 날짜
+            arxiv_ids: 해당 날짜에 처리된 논문 ID들
+            papers: 스킴 결과 목록 (태그 인덱스)
+            score_data: (arxiv_id, score) 튜플 리스트 (점수 인덱스)
 
-        return path
+        Returns:
+            저장된 인덱스 파일 경로 목록
+        """
+        by_date = self.index_dir / "by_date.json"
+        by_tag = self.index_dir / "by_tag.json"
+        by_score = self.index_dir / "by_score.json"
+
+        writes: list[tuple[Path, dict, bool]] = [
+            (by_date, self._merge_by_date(by_date, date, arxiv_ids), False)
+        ]
+        if papers:
+            writes.append((by_tag, self._merge_by_tag(by_tag, papers), True))
+        if score_data:
+            writes.append((by_score, self._merge_by_score(by_score, score_data), False))
+
+        for path, data, sort_keys in writes:
+            self._save_json(path, data, sort_keys=sort_keys)
+        return [path for path, _, _ in writes]
+
+    def _merge_by_date(self, path: Path, date: str, arxiv_ids: list[str]) -> dict:
+        """날짜별 인덱스에 한 날짜를 반영한 새 데이터 (최신 날짜 순)."""
+        data = dict(self._load_json(path) or {})
+        data[date] = arxiv_ids
+        return dict(sorted(data.items(), reverse=True))
+
+    def _merge_by_tag(self, path: Path, papers: list[SkimSummary]) -> dict:
+        """태그별 인덱스에 논문들을 반영한 새 데이터 (태그별 arxiv_id 정렬)."""
+        # 중복 확인이 O(1)이 되도록 집합으로 누적
+        accum = {tag: set(ids) for tag, ids in (self._load_json(path) or {}).items()}
+        for paper in papers:
+            for tag in paper.tags:
+                accum.setdefault(tag.lower(), set()).add(paper.arxiv_id)
+        return {tag: sorted(ids) for tag, ids in accum.items()}
+
+    def _merge_by_score(self, path: Path, score_data: list[tuple[str, int]]) -> dict:
+        """점수별 인덱스에 점수들을 반영한 새 데이터.
+
+        파일은 정렬하지 않고 저장한다 (순위는 get_top_scored에서 필요한 만큼만 계산).
+        """
+        data = dict(self._load_json(path) or {})
+        for arxiv_id, score in score_data:
+            data[arxiv_id] = score
+        return data
 
     def get_by_date(self, date: str) -> list[str]:
         """특정 날짜의 논문 목록.
@@ -113,8 +150,8 @@ class IndexStore:
         Returns:
             arxiv_id 목록
         """
-        path = self.index_dir / "by_date.yaml"
-        data = self._load_yaml(path) or {}
+        path = self.index_dir / "by_date.json"
+        data = self._load_json(path) or {}
         return data.get(date, [])
 
     def get_by_tag(self, tag: str) -> list[str]:
@@ -126,8 +163,8 @@ class IndexStore:
         Returns:
             arxiv_id 목록
         """
-        path = self.index_dir / "by_tag.yaml"
-        data = self._load_yaml(path) or {}
+        path = self.index_dir / "by_tag.json"
+        data = self._load_json(path) or {}
         return data.get(tag.lower(), [])
 
     def get_top_scored(self, n: int = 10) -> list[tuple[str, int]]:
@@ -139,12 +176,11 @@ class IndexStore:
         Returns:
             (arxiv_id, score) 튜플 리스트
         """
-        path = self.index_dir / "by_score.yaml"
-        data = self._load_yaml(path) or {}
+        path = self.index_dir / "by_score.json"
+        data = self._load_json(path) or {}
 
-        # 점수 높은 순으로 정렬
-        sorted_items = sorted(data.items(), key=lambda x: x[1], reverse=True)
-        return sorted_items[:n]
+        # 전체 정렬 대신 상위 n개만 선택 (O(N log n), 동점은 저장 순서 유지)
+        return heapq.nlargest(n, data.items(), key=lambda x: x[1])
 
     def get_all_dates(self) -> list[str]:
         """저장된 모든 날짜.
@@ -152,8 +188,8 @@ class IndexStore:
         Returns:
             날짜 목록 (최신순)
         """
-        path = self.index_dir / "by_date.yaml"
-        data = self._load_yaml(path) or {}
+        path = self.index_dir / "by_date.json"
+        data = self._load_json(path) or {}
         return sorted(data.keys(), reverse=True)
 
     def get_all_tags(self) -> list[str]:
@@ -162,8 +198,8 @@ class IndexStore:
         Returns:
             태그 목록 (알파벳순)
         """
-        path = self.index_dir / "by_tag.yaml"
-        data = self._load_yaml(path) or {}
+        path = self.index_dir / "by_tag.json"
+        data = self._load_json(path) or {}
         return sorted(data.keys())
 
     def get_stats(self) -> dict:
@@ -172,9 +208,9 @@ class IndexStore:
         Returns:
             통계 딕셔너리
         """
-        by_date = self._load_yaml(self.index_dir / "by_date.yaml") or {}
-        by_tag = self._load_yaml(self.index_dir / "by_tag.yaml") or {}
-        by_score = self._load_yaml(self.index_dir / "by_score.yaml") or {}
+        by_date = self._load_json(self.index_dir / "by_date.json") or {}
+        by_tag = self._load_json(self.index_dir / "by_tag.json") or {}
+        by_score = self._load_json(self.index_dir / "by_score.json") or {}
 
         return {
             "total_dates": len(by_date),
@@ -186,14 +222,42 @@ class IndexStore:
             ),
         }
 
-    def _load_yaml(self, path: Path) -> Optional[dict]:
-        """YAML 파일 로드."""
-        if not path.exists():
-            return None
-        with open(path, encoding="utf-8") as f:
-            return yaml.safe_load(f)
+    def _load_json(self, path: Path) -> Optional[dict]:
+        """JSON 인덱스 로드 (수정 시각이 같으면 캐시 사용)."""
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._cache.pop(path, None)
+            return self._migrate_yaml(path)
+
+        cached = self._cache.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        data = orjson.loads(path.read_bytes())
+        if data is not None:
+            self._cache[path] = (mtime_ns, data)
+        return data
+
+    def _save_json(self, path: Path, data: dict, *, sort_keys: bool = False) -> None:
+        """JSON 인덱스 저장 (저장한 데이터로 캐시 갱신).
 
-    def _save_yaml(self, path: Path, data: dict) -> None:
-        """YAML 파일 저장."""
-        with open(path, "w", encoding="utf-8") as f:
-            yaml.dump(data, f, allow_unicode=True, default_flow_style=False)
+        Args:
+            path: 인덱스 파일 경로
+            data: 저장할 데이터 (dict 순서대로 저장)
+            sort_keys: 키 알파벳 순으로 저장할지 여부
+        """
+        option = orjson.OPT_INDENT_2 | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        path.write_bytes(orjson.dumps(data, option=option))
+        self._cache[path] = (path.stat().st_mtime_ns, data)
+
+    def _migrate_yaml(self, path: Path) -> Optional[dict]:
+        """이전 버전의 .yaml 인덱스를 .json으로 옮긴 뒤 데이터 반환 (없으면 None)."""
+        yaml_path = path.with_suffix(".yaml")
+        if not yaml_path.exists():
+            return None
+        data = yaml.load(yaml_path.read_bytes(), Loader=SafeLoader)
+        if not data:
+            return None
+        self._save_json(path, data)
+        return data
@@ -1,5 +1,8 @@
 """ReportStore - reports/daily/ 저장 관리."""
 
+import heapq
+import os
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -47,7 +50,7 @@ class ReportStore:
             저장된 파일 경로
         """
         path = self.get_report_path(date)
-        path.write_text(markdown, encoding="utf-8")
+        path.write_bytes(markdown.encode("utf-8"))
         return path
 
     def load_daily_report(self, date: str) -> Optional[str]:
@@ -62,7 +65,7 @@ class ReportStore:
         path = self.get_report_path(date)
         if not path.exists():
             return None
-        return path.read_text(encoding="utf-8")
+        return path.read_bytes().decode("utf-8")
 
     def report_exists(self, date: str) -> bool:
         """일일 리포트 존재 여부.
@@ -84,13 +87,8 @@ class ReportStore:
         Returns:
             날짜 목록 (YYYY-MM-DD)
         """
-        reports = []
-        for path in sorted(self.daily_dir.glob("*.md"), reverse=True):
-            if path.stem and len(path.stem) == 10:  # YYYY-MM-DD format
-                reports.append(path.stem)
-                if len(reports) >= limit:
-                    break
-        return reports
+        # 전체 정렬 대신 상위 limit개만 선택 (O(N log limit))
+        return heapq.nlargest(limit, self._iter_report_dates())
 
     def get_latest_report_date(self) -> Optional[str]:
         """가장 최근 리포트 날짜.
@@ -98,5 +96,12 @@ class ReportStore:
         Returns:
             날짜 (YYYY-MM-DD) 또는 None
         """
-        reports = self.list_reports(limit=1)
-        return reports[0] if reports else None
+        return max(self._iter_report_dates(), default=None)
+
+    def _iter_report_dates(self) -> Iterator[str]:
+        """daily/ 디렉토리의 리포트 날짜 (YYYY-MM-DD.md 파일명, 순서 없음)."""
+        with os.scandir(self.daily_dir) as it:
+            for entry in it:
+                name = entry.name
+                if len(name) == 13 and name.endswith(".md"):  # YYYY-MM-DD.md
+                    yield name[:-3]
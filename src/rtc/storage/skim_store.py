@@ -1,13 +1,21 @@
 """SkimStore - papers/YYYY-MM-DD.yaml 저장 관리."""
 
-from datetime import datetime
+from collections.abc import Iterable
 from pathlib import Path
-from typing import Optional
+from typing import IO, Optional
 
+import orjson
 import yaml
 
 from rtc.schemas.skim import DailySkimOutput, SkimSummary
 
+# libyaml(C) 구현이 있으면 사용
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
 
 class SkimStore:
     """papers/ 디렉토리 저장 관리.
@@ -23,6 +31,9 @@ class SkimStore:
         """
         self.papers_dir = base_dir / "papers"
         self.papers_dir.mkdir(parents=True, exist_ok=True)
+        self.jsonl_dir = base_dir / "skim"
+        # 날짜 -> (st_mtime_ns, 로드된 결과, arxiv_id -> 논문). 파일이 그대로면 재파싱 생략
+        self._load_cache: dict[str, tuple[int, DailySkimOutput, dict[str, SkimSummary]]] = {}
 
     def save(self, output: DailySkimOutput) -> Path:
         """일별 스킴 결과 저장.
@@ -35,19 +46,60 @@ class SkimStore:
         """
         path = self.papers_dir / f"{output.date}.yaml"
 
-        # Pydantic 모델을 dict로 변환 (datetime 처리)
-        data = output.model_dump()
-        data["skimmed_at"] = output.skimmed_at.isoformat()
+        # Pydantic 모델을 dict로 변환 (mode="json": datetime은 ISO 문자열로)
+        data = output.model_dump(mode="json")
+
+        # 재생성 가능한 파일이므로 fsync 없이 UTF-8 바이트로 한 번에 기록
+        content = yaml.dump(
+            data,
+            Dumper=SafeDumper,
+            allow_unicode=True,
+            default_flow_style=False,
+            sort_keys=False,
+            encoding="utf-8",
+        )
+        path.write_bytes(content)
+
+        self._load_cache.pop(output.date, None)
+        return path
 
-        # 각 paper의 datetime도 처리
-        for paper in data.get("papers", []):
-            if "skimmed_at" in paper and isinstance(paper["skimmed_at"], datetime):
-                paper["skimmed_at"] = paper["skimmed_at"].isoformat()
+    def append_jsonl(self, output: DailySkimOutput) -> Path:
+        """일별 스킴 결과를 월별 JSONL 파일(skim/YYYY-MM.jsonl)에 한 줄로 추가.
 
-        with open(path, "w", encoding="utf-8") as f:
-            yaml.dump(data, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
+        Args:
+            output: 저장할 스킴 결과
 
-        return path
+        Returns:
+            JSONL 파일 경로
+        """
+        return self.append_jsonl_many([output])[0]
+
+    def append_jsonl_many(self, outputs: Iterable[DailySkimOutput]) -> list[Path]:
+        """여러 날짜의 스킴 결과를 월별 JSONL 파일에 추가 (백필용).
+
+        같은 달의 결과는 파일을 한 번만 열어 이어 쓴다.
+
+        Args:
+            outputs: 저장할 스킴 결과들
+
+        Returns:
+            입력 순서대로의 JSONL 파일 경로
+        """
+        self.jsonl_dir.mkdir(parents=True, exist_ok=True)
+        files: dict[Path, IO[bytes]] = {}
+        paths: list[Path] = []
+        try:
+            for output in outputs:
+                path = self.jsonl_dir / f"{output.date[:7]}.jsonl"
+                f = files.get(path)
+                if f is None:
+                    f = files[path] = open(path, "ab")
+                f.write(orjson.dumps(output.model_dump()) + b"\n")
+                paths.append(path)
+        finally:
+            for f in files.values():
+                f.close()
+        return paths
 
     def load(self, date: str) -> Optional[DailySkimOutput]:
         """일별 스킴 결과 로드.
@@ -58,19 +110,36 @@ class SkimStore:
         Returns:
             스킴 결과 또는 None
         """
-        path = self.papers_dir / f"{date}.yaml"
+        entry = self._load_entry(date)
+        return entry[1] if entry is not None else None
 
-        if not path.exists():
+    def _load_entry(
+        self, date: str
+    ) -> Optional[tuple[int, DailySkimOutput, dict[str, SkimSummary]]]:
+        """일별 스킴 결과와 arxiv_id 인덱스 로드 (수정 시각이 같으면 캐시 사용)."""
+        path = self.papers_dir / f"{date}.yaml"
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._load_cache.pop(date, None)
             return None
 
-        with open(path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        cached = self._load_cache.get(date)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached
 
-        # datetime 문자열을 datetime 객체로 변환
-        if "skimmed_at" in data and isinstance(data["skimmed_at"], str):
-            data["skimmed_at"] = datetime.fromisoformat(data["skimmed_at"])
+        # 바이트를 그대로 넘겨 텍스트 IO 계층(TextIOWrapper) 생략
+        data = yaml.load(path.read_bytes(), Loader=SafeLoader)
 
-        return DailySkimOutput(**data)
+        # skimmed_at ISO 문자열은 pydantic이 datetime으로 변환
+        output = DailySkimOutput(**data)
+        # 같은 arxiv_id가 여러 번 있으면 첫 번째 (기존 선형 탐색과 동일)
+        by_id: dict[str, SkimSummary] = {}
+        for paper in output.papers:
+            by_id.setdefault(paper.arxiv_id, paper)
+        entry = (mtime_ns, output, by_id)
+        self._load_cache[date] = entry
+        return entry
 
     def list_dates(self) -> list[str]:
         """저장된 날짜 목록 반환.
@@ -108,11 +177,7 @@ class SkimStore:
         Returns:
             스킴 결과 또는 None
         """
-        output = self.load(date)
-        if output is None:
+        entry = self._load_entry(date)
+        if entry is None:
             return None
-
-        for paper in output.papers:
-            if paper.arxiv_id == arxiv_id:
-                return paper
-        return None
+        return entry[2].get(arxiv_id)
@@ -1,5 +1,6 @@
 """LangSmith tracing setup and utilities."""
 
+import functools
 import os
 from contextlib import contextmanager
 from typing import Any, Generator
@@ -26,12 +27,16 @@ def setup_tracing() -> Client | None:
     os.environ["LANGCHAIN_API_KEY"] = settings.langsmith_api_key
     os.environ["LANGCHAIN_PROJECT"] = settings.langsmith_project
 
-    return Client(api_key=settings.langsmith_api_key)
+    return get_tracer()
 
 
+@functools.lru_cache(maxsize=1)
 def get_tracer() -> Client | None:
     """Get the LangSmith client.
 
+    The client is created once per process (settings are immutable); use
+    ``get_tracer.cache_clear()`` to force a new one.
+
     Returns:
         LangSmith client if API key is configured.
     """
@@ -84,10 +89,11 @@ def create_evaluation_dataset(
     """
     dataset = client.create_dataset(dataset_name=dataset_name)
 
-    for example in examples:
-        client.create_example(
-            inputs=example.get("inputs", {}),
-            outputs=example.get("outputs", {}),
+    # Upload all examples in a single batched request
+    if examples:
+        client.create_examples(
+            inputs=[example.get("inputs", {}) for example in examples],
+            outputs=[example.get("outputs", {}) for example in examples],
             dataset_id=dataset.id,
         )
 